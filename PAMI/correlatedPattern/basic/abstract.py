@@ -24,6 +24,8 @@ import os.path as _ospath
 import psutil as _psutil
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 import sys as _sys
 import math as _math
 
@@ -82,7 +84,7 @@ class _correlatedPatterns(_ABC):
     def __init__(self, iFile, minSup, minAllConf, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -94,7 +96,7 @@ class _correlatedPatterns(_ABC):
         :type sep: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._sep = sep
         self._minSup = minSup
         self._minAllConf = minAllConf
@@ -28,6 +28,7 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.correlatedSpatialPattern.basic import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
 
 
 class _Node:
@@ -370,6 +371,8 @@ class CSPGrowth(_ab._correlatedPatterns):
             if 'Transactions' in i:
                 self._Database = self._iFile['Transactions'].tolist()
 
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            self._Database = list(self._iFile.transactions())
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
@@ -395,42 +398,11 @@ class CSPGrowth(_ab._correlatedPatterns):
         """
             A function to map items to their Neighbours
         """
-        self._neighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
-            data, items = [], []
-            if self._nFile.empty:
-                print("its empty..")
-            i = self._nFile.columns.values.tolist()
-            if 'items' in i:
-                items = self._nFile['items'].tolist()
-            if 'Neighbours' in i:
-                data = self._nFile['neighbours'].tolist()
-            for k in range(len(data)):
-                self._neighboursMap[items[k]] = data[k]
-        if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
-                data = _ab._urlopen(self._nFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    item = temp[0]
-                    nibs = temp[1:]
-                    self._neighboursMap[item] = nibs
-            else:
-                try:
-                    with open(self._nFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            item = temp[0]
-                            nibs = temp[1:]
-                            self._neighboursMap[item] = nibs
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._neighboursMap = _NeighbourhoodGraph.read(self._nFile, self._sep).neighbourSets()
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def _getNeighbourItems(self, keySet):
         """
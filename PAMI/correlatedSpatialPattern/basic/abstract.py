@@ -39,6 +39,8 @@ import sys as _sys
 import validators as _validators
 import math as _math
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 
 
 class _correlatedPatterns(_ABC):
@@ -97,7 +99,7 @@ class _correlatedPatterns(_ABC):
     def __init__(self, iFile, nFile, minSup, minAllConf, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param nFile: neighbourhoof file name or path of the neighbourhood file 
         :type nFile: str
         :param minSup: The user can specify minSup either in count or proportion of database size.
@@ -111,7 +113,7 @@ class _correlatedPatterns(_ABC):
         :type sep: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._nFile = nFile
         self._sep = sep
         self._minSup = minSup
@@ -24,6 +24,10 @@ class DF2DB:
             Create temporal database from DataFrame and store into outputFile
         getUDB(outputFile)
             Create utility database from DataFrame and store into outputFile
+        getTransactions()
+            Create in memory the transactions of getDB and getTDB, to be given as iFile to a miner
+        getUtilityTransactions()
+            Create in memory the transactions of getUDB, to be given as iFile to a utility miner
         """
     def __init__(self, inputDF, thresholdValue, condition, DFtype='sparse'):
         self.inputDF = inputDF
@@ -66,3 +70,19 @@ class DF2DB:
         """
         self.DF2DB.createUDB(outputFile)
         return self.DF2DB.getFileName()
+
+    def getTransactions(self):
+        """
+        create in memory the transactions of getDB and getTDB, to be given as iFile to a miner
+        :return: the transactions
+        :rtype: TransactionDatabase
+        """
+        return self.DF2DB.createTransactions()
+
+    def getUtilityTransactions(self):
+        """
+        create in memory the transactions of getUDB, to be given as iFile to a utility miner
+        :return: the transactions
+        :rtype: TransactionDatabase
+        """
+        return self.DF2DB.createUtilityTransactions()
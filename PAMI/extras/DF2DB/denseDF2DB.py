@@ -1,4 +1,10 @@
+import numpy as np
 import pandas as pd
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase
+
+_operators = {'>': np.greater, '>=': np.greater_equal, '<=': np.less_equal, '<': np.less, '==': np.equal,
+              '!=': np.not_equal}
+
 
 class denseDF2DB:
     """
@@ -18,6 +24,8 @@ class denseDF2DB:
             Store the items list
         outputFile : str
             Creation data base output to this outputFile.
+        chunkSize : int
+            number of cells of the DataFrame compared at a time
 
         Methods:
         --------
@@ -27,11 +35,15 @@ class denseDF2DB:
             Create temporal dataBase from dataFrame
         createUDB(outputFile)
             Create utility database from dataFrame
+        createTransactions()
+            Create in memory the transactions of createDB and createTDB
+        createUtilityTransactions()
+            Create in memory the transactions of createUDB
         getFileName()
             Return outputFileName.
         """
 
-    def __init__(self, inputDF, condition, thresholdValue):
+    def __init__(self, inputDF, condition, thresholdValue, chunkSize=1 << 24):
         self.inputDF = inputDF
         self.condition = condition
         self.thresholdValue = thresholdValue
@@ -41,7 +53,52 @@ class denseDF2DB:
         self.items = list(self.inputDF.columns.values)[1:]
         self.inputDF = self.inputDF.set_index('tid')
         self.tids = list(self.inputDF.index)
+        self.chunkSize = chunkSize
+
+
+    def _chunks(self):
+        """
+        Iterate over the rows of the DataFrame, as many rows as fit in chunkSize cells at a time
+
+        :return: generator of the tids and the values of the items of the rows
+        :rtype: generator
+        """
+        rows = max(1, self.chunkSize // max(len(self.items), 1))
+        for start in range(0, len(self.tids), rows):
+            yield self.tids[start:start + rows], self.inputDF[self.items].iloc[start:start + rows].to_numpy()
 
+    @staticmethod
+    def _rows(mask):
+        """
+        The positions of the columns of every row selected by a boolean mask
+
+        :param mask: one row of booleans per transaction
+        :type mask: numpy.ndarray
+        :return: the positions of the selected columns and the start of every row among them, followed by their number
+        :rtype: tuple
+        """
+        columns = np.nonzero(mask)[1]
+        bounds = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=bounds[1:])
+        return columns, bounds.tolist()
+
+    def _transactions(self, compare):
+        """
+        Compare all the values with the threshold, and iterate over the tid and the items of every non empty
+        transaction
+
+        :param compare: the numpy comparison of the condition
+        :type compare: numpy.ufunc
+        :return: generator of the tids and items of the transactions
+        :rtype: generator
+        """
+        items = np.array(self.items, dtype=object)
+        for tids, values in self._chunks():
+            columns, bounds = self._rows(compare(values, self.thresholdValue))
+            names = [str(item) for item in items[columns].tolist()]
+            for i in range(len(tids)):
+                if bounds[i] < bounds[i + 1]:
+                    yield tids[i], names[bounds[i]:bounds[i + 1]]
 
     def createDB(self, outputFile):
         """
@@ -52,86 +109,12 @@ class denseDF2DB:
         """
 
         self.outputFile = outputFile
+        compare = _operators.get(self.condition)
         with open(outputFile, 'w') as f:
-            if self.condition == '>':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] > self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '>=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] >= self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '<=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] <= self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '<':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] < self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-            elif self.condition == '==':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] == self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-            elif self.condition == '!=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] != self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-            else:
+            if compare is None:
                 print('Condition error')
-
-
+                return
+            f.writelines(','.join(transaction) + '\n' for tid, transaction in self._transactions(compare))
 
     def createTDB(self, outputFile):
         """
@@ -142,112 +125,80 @@ class denseDF2DB:
         """
 
         self.outputFile = outputFile
+        compare = _operators.get(self.condition)
         with open(outputFile, 'w') as f:
-            if self.condition == '>':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] > self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '>=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] >= self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '<=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] <= self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            elif self.condition == '<':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] < self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-            elif self.condition == '==':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] == self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-            elif self.condition == '!=':
-                for tid in self.tids:
-                    transaction = [item for item in self.items if self.inputDF.at[tid, item] != self.thresholdValue]
-                    if len(transaction) > 1:
-                        f.write(f'{tid}')
-                        for item in transaction:
-                            f.write(f',{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid}')
-                        f.write(f',{transaction}')
-                    else:
-                        continue
-                    f.write('\n')
-
-            else:
+            if compare is None:
                 print('Condition error')
+                return
+            f.writelines(f'{tid},' + ','.join(transaction) + '\n' for tid, transaction in self._transactions(compare))
 
     def createUDB(self, outputFile):
         """
-        Create the utility data base.
+        Create the utility data base, the items of a transaction being its non missing values.
 
         :param outputFile: Write utility data base into outputFile
         :type outputFile: str
         """
 
         self.outputFile = outputFile
+        items = np.array(self.items, dtype=object)
         with open(self.outputFile, 'w') as f:
-            for tid in self.tids:
-                df = self.inputDF.loc[tid].dropna()
-                f.write(f'{df.index[0]}')
-                for item in df.index[1:]:
-                    f.write(f'\t{item}')
-                f.write(f':{df.sum()}:')
-                f.write(f'{df.at[df.index[0]]}')
-                for item in df.index[1:]:
-                    f.write(f'\t{df.at[item]}')
-                f.write('\n')
+            for tids, values in self._chunks():
+                mask = ~pd.isna(values)
+                columns, bounds = self._rows(mask)
+                names = [str(item) for item in items[columns].tolist()]
+                utilities = [str(value) for value in values[mask].tolist()]
+                sums = np.where(mask, values, 0).sum(axis=1).tolist()
+                lines = []
+                for i in range(len(tids)):
+                    if bounds[i] < bounds[i + 1]:
+                        lines.append('\t'.join(names[bounds[i]:bounds[i + 1]]) + f':{sums[i]}:' +
+                                     '\t'.join(utilities[bounds[i]:bounds[i + 1]]) + '\n')
+                f.writelines(lines)
+
+    def createTransactions(self):
+        """
+        Create in memory the transactions of createDB and createTDB, without going through a file
+
+        :return: the transactions, with the tids as timestamps
+        :rtype: TransactionDatabase
+        """
+
+        compare = _operators.get(self.condition)
+        if compare is None:
+            print('Condition error')
+            return None
+        return self._database(lambda values: compare(values, self.thresholdValue), False)
+
+    def createUtilityTransactions(self):
+        """
+        Create in memory the transactions of createUDB, without going through a file
+
+        :return: the transactions, with the non missing values as the utilities of the items
+        :rtype: TransactionDatabase
+        """
+
+        return self._database(lambda values: ~pd.isna(values), True)
+
+    def _database(self, select, utilities):
+        """
+        The TransactionDatabase of the non empty rows, the items of a row being its columns selected by select
+
+        :param select: function giving the boolean mask of the values of a chunk of rows
+        :type select: function
+        :param utilities: keep the selected values as the utilities of the items
+        :type utilities: bool
+        :rtype: TransactionDatabase
+        """
+
+        items = [str(item) for item in self.items]
+        databases = []
+        for tids, values in self._chunks():
+            databases.append(TransactionDatabase.fromMask(select(values), items, tids,
+                                                          values if utilities else None).withoutEmptyTransactions())
+        if not databases:
+            return TransactionDatabase.fromTransactions([], [])
+        return TransactionDatabase.concatenate(databases)
 
     def getFileName(self):
         """
@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+from PAMI.extras.DF2DB.denseDF2DB import _operators
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase
 
 class denseDF2DBPlus:
     """
@@ -27,6 +30,10 @@ class denseDF2DBPlus:
             Create temporal dataBase from dataFrame
         createUDB(outputFile)
             Create utility database from dataFrame
+        createTransactions()
+            Create in memory the transactions of createDB and createTDB
+        createUtilityTransactions()
+            Create in memory the transactions of createUDB
         getFileName()
             Return outputFileName.
         """
@@ -112,7 +119,9 @@ class denseDF2DBPlus:
         self.outputFile = outputFile
         with open(self.outputFile, 'w') as f:
             for tid in self.tids:
-                df = self.inputDF.loc[tid].dropna()
+                df = self.inputDF[tid].dropna()
+                if df.empty:
+                    continue
                 f.write(f'{df.index[0]}')
                 for item in df.index[1:]:
                     f.write(f'\t{item}')
@@ -122,6 +131,37 @@ class denseDF2DBPlus:
                     f.write(f'\t{df.at[item]}')
                 f.write('\n')
 
+    def createTransactions(self):
+        """
+        Create in memory the transactions of createDB and createTDB, without going through a file, every item being
+        compared with its own threshold and condition
+
+        :return: the transactions, with the tids as timestamps
+        :rtype: TransactionDatabase
+        """
+
+        values = self.df[self.tids].to_numpy()
+        thresholds = self.df['threshold'].to_numpy()
+        conditions = self.df['condition'].to_numpy()
+        mask = np.zeros(values.shape, dtype=bool)
+        for condition, compare in _operators.items():
+            rows = conditions == condition
+            mask[rows] = compare(values[rows], thresholds[rows, None])
+        return TransactionDatabase.fromMask(mask.T, [str(item) for item in self.df.index],
+                                            self.tids).withoutEmptyTransactions()
+
+    def createUtilityTransactions(self):
+        """
+        Create in memory the transactions of createUDB, without going through a file
+
+        :return: the transactions, with the non missing values as the utilities of the items
+        :rtype: TransactionDatabase
+        """
+
+        values = self.inputDF[self.tids].to_numpy().T
+        return TransactionDatabase.fromMask(~pd.isna(values), [str(item) for item in self.items], self.tids,
+                                            values).withoutEmptyTransactions()
+
     def getFileName(self):
         """
         return outputFile name
@@ -1,4 +1,107 @@
+import numpy as np
 import pandas as pd
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase
+
+
+def _sortedRows(tids, items, values, chunkSize):
+    """
+    Iterate over the rows of a long DataFrame sorted by tid, chunkSize rows at a time. The sort is stable, so the
+    items of a tid keep their order as in groupby, and it is skipped when the tids are already sorted.
+
+    :param tids: tid of every row
+    :type tids: numpy.ndarray
+    :param items: item of every row
+    :type items: numpy.ndarray
+    :param values: value of every row
+    :type values: numpy.ndarray
+    :param chunkSize: number of rows given at a time
+    :type chunkSize: int
+    :return: generator of the tids, items and values of the rows
+    :rtype: generator
+    """
+    if len(tids) > 1 and not (tids[1:] >= tids[:-1]).all():
+        order = np.argsort(tids, kind='stable')
+        tids, items, values = tids[order], items[order], values[order]
+    for start in range(0, len(tids), chunkSize):
+        yield tids[start:start + chunkSize], items[start:start + chunkSize], values[start:start + chunkSize]
+
+
+def _groupedItems(tids, items, name):
+    """
+    The items of every tid, as groupby on tid and apply(list) gives them, with a stable sort and a split of the items
+
+    :param tids: tid of every row
+    :type tids: numpy.ndarray
+    :param items: item of every row
+    :type items: numpy.ndarray
+    :param name: name of the tid index
+    :type name: str
+    :rtype: pandas.Series
+    """
+    order = np.argsort(tids, kind='stable')
+    tids = tids[order]
+    items = items[order].tolist()
+    starts = np.flatnonzero(np.concatenate(([True], tids[1:] != tids[:-1]))) if len(tids) else np.empty(0, dtype=int)
+    bounds = starts.tolist() + [len(items)]
+    return pd.Series([items[bounds[i]:bounds[i + 1]] for i in range(len(starts))],
+                     index=pd.Index(tids[starts], name=name), name='item', dtype=object)
+
+
+def _writeUtilities(f, chunks):
+    """
+    Write a line items:transaction utility:utilities for every tid of chunks of rows in which the rows of a tid are
+    consecutive. The rows of the last tid of a chunk are carried to the next chunk, as the tid may go on there.
+
+    :param f: the output file
+    :param chunks: the tids, items and values of the rows, as numpy arrays
+    :type chunks: iterable
+    """
+    pending = None
+    for tids, items, values in chunks:
+        if pending is not None:
+            tids, items, values = (np.concatenate((old, new)) for old, new in zip(pending, (tids, items, values)))
+        if not len(tids):
+            continue
+        starts = np.flatnonzero(np.concatenate(([True], tids[1:] != tids[:-1])))
+        last = starts[-1]
+        pending = tids[last:], items[last:], values[last:]
+        if last:
+            _writeGroups(f, items[:last], values[:last], starts[:-1])
+    if pending is not None:
+        _writeGroups(f, pending[1], pending[2], np.zeros(1, dtype=np.int64))
+
+
+def _writeGroups(f, items, values, starts):
+    """
+    Write the groups of rows beginning at starts. The utilities of a group are summed by the grouped sum of pandas,
+    whose compensated summation gives the transaction utilities groupby gave, to the last digit for floats.
+    """
+    bounds = starts.tolist() + [len(items)]
+    sums = pd.Series(values).groupby(np.repeat(np.arange(len(starts)), np.diff(bounds))).sum().tolist()
+    items = [str(item) for item in items.tolist()]
+    values = [str(value) for value in values.tolist()]
+    lines = []
+    for i in range(len(sums)):
+        lines.append('\t'.join(items[bounds[i]:bounds[i + 1]]) + f':{sums[i]}:' +
+                     '\t'.join(values[bounds[i]:bounds[i + 1]]) + '\n')
+    f.write(''.join(lines))
+
+
+def createUDBFromChunks(chunks, outputFile):
+    """
+    Create the utility data base of a long DataFrame read in chunks, for example with pandas.read_csv and chunksize,
+    for frames larger than memory. The tid is the column tid, or the index when there is no such column, and the
+    rows of a tid must be consecutive.
+
+    :param chunks: DataFrames with the columns item and value
+    :type chunks: iterable
+    :param outputFile: Write utility data base into outputFile
+    :type outputFile: str
+    """
+    with open(outputFile, 'w') as f:
+        _writeUtilities(f, ((np.asarray(chunk['tid'] if 'tid' in chunk.columns else chunk.index),
+                             chunk['item'].to_numpy(), chunk['value'].to_numpy()) for chunk in chunks))
+
 
 class sparseDF2DB:
     """
@@ -16,6 +119,8 @@ class sparseDF2DB:
         It is data frame to create data base.
     outputFile : str
         Creation data base output to this outputFile.
+    chunkSize : int
+        number of rows of the DataFrame written at a time by createUDB
 
     Methods:
     --------
@@ -25,11 +130,15 @@ class sparseDF2DB:
         Create temporal dataBase from dataFrame
     createUDB(outputFile)
         Create utility data base from dataFrame
+    createTransactions()
+        Create in memory the transactions of createDB and createTDB
+    createUtilityTransactions()
+        Create in memory the transactions of createUDB
     getFileName()
         Return outputFileName.
     """
 
-    def __init__(self, inputDF, condition, thresholdValue):
+    def __init__(self, inputDF, condition, thresholdValue, chunkSize=1 << 20):
         self.inputDF = inputDF
         self.condition = condition
         self.thresholdValue = thresholdValue
@@ -44,8 +153,9 @@ class sparseDF2DB:
             self.df = self.inputDF.query(f'value < {self.thresholdValue}')
         else:
             print('Condition error')
-        self.df = self.df.drop(columns='value')
-        self.df = self.df.groupby('tid')['item'].apply(list)
+        tids = self.df['tid'] if 'tid' in self.df.columns else self.df.index.get_level_values('tid')
+        self.df = _groupedItems(np.asarray(tids), self.df['item'].to_numpy(), 'tid')
+        self.chunkSize = chunkSize
 
     def createDB(self, outputFile):
         """
@@ -86,20 +196,31 @@ class sparseDF2DB:
         """
 
         self.outputFile = outputFile
-        items = self.inputDF.groupby(level=0)['item'].apply(list)
-        values = self.inputDF.groupby(level=0)['value'].apply(list)
-        sums = self.inputDF.groupby(level=0)['value'].sum()
-        index = list(items.index)
+        tids = self.inputDF['tid'] if 'tid' in self.inputDF.columns else self.inputDF.index.get_level_values(0)
         with open(self.outputFile, 'w') as f:
-            for tid in index:
-                f.write(f'{items[tid][0]}')
-                for item in items[tid][1:]:
-                    f.write(f'\t{item}')
-                f.write(f':{sums[tid]}:')
-                f.write(f'{values[tid][0]}')
-                for value in values[tid][1:]:
-                    f.write(f'\t{value}')
-                f.write('\n')
+            _writeUtilities(f, _sortedRows(np.asarray(tids), self.inputDF['item'].to_numpy(),
+                                           self.inputDF['value'].to_numpy(), self.chunkSize))
+
+    def createTransactions(self):
+        """
+        Create in memory the transactions of createDB and createTDB, without going through a file
+
+        :return: the transactions, with the tids as timestamps
+        :rtype: TransactionDatabase
+        """
+        return TransactionDatabase.fromTransactions([[str(item) for item in transaction] for transaction in self.df],
+                                                    list(self.df.index))
+
+    def createUtilityTransactions(self):
+        """
+        Create in memory the transactions of createUDB, without going through a file
+
+        :return: the transactions, with the values as the utilities of the items
+        :rtype: TransactionDatabase
+        """
+        tids = self.inputDF['tid'] if 'tid' in self.inputDF.columns else self.inputDF.index.get_level_values(0)
+        return TransactionDatabase.fromRows(np.asarray(tids), self.inputDF['item'].to_numpy(),
+                                            self.inputDF['value'].to_numpy())
 
     def getFileName(self):
         """
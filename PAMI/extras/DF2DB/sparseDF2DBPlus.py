@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+from PAMI.extras.DF2DB.sparseDF2DB import _groupedItems, _sortedRows, _writeUtilities
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase
 
 class sparseDF2DBPlus:
     """
@@ -14,6 +17,8 @@ class sparseDF2DBPlus:
         It is data frame to create data base.
     outputFile : str
         Creation data base output to this outputFile.
+    chunkSize : int
+        number of rows of the DataFrame written at a time by createUDB
 
     Methods:
     --------
@@ -23,11 +28,15 @@ class sparseDF2DBPlus:
         Create temporal dataBase from dataFrame
     createUDB(outputFile)
         Create utility data base from dataFrame
+    createTransactions()
+        Create in memory the transactions of createDB and createTDB
+    createUtilityTransactions()
+        Create in memory the transactions of createUDB
     getFileName()
         Return outputFileName.
     """
 
-    def __init__(self, inputDF, thresholdConditionDF):
+    def __init__(self, inputDF, thresholdConditionDF, chunkSize=1 << 20):
         self.inputDF = inputDF
         self.thresholdConditionDF = thresholdConditionDF
         self.outputFile = ''
@@ -36,8 +45,9 @@ class sparseDF2DBPlus:
                       '(condition == "<=" & value <= threshold) | (condition == "<" & value < threshold) |'
                       '(condition == "==" & value == threshold) | (condition == "!=" & value != threshold)',
                       inplace=True)
-        self.df = self.df.drop(columns=['value', 'threshold', 'condition'])
-        self.df = self.df.groupby(level=0)['item'].apply(list)
+        self.df = _groupedItems(np.asarray(self.df.index.get_level_values(0)), self.df['item'].to_numpy(),
+                                self.df.index.names[0])
+        self.chunkSize = chunkSize
 
     def createDB(self, outputFile):
         """
@@ -80,21 +90,30 @@ class sparseDF2DBPlus:
         """
 
         self.outputFile = outputFile
-        items = self.inputDF.groupby(level=0)['item'].apply(list)
-        values = self.inputDF.groupby(level=0)['value'].apply(list)
-        sums = self.inputDF.groupby(level=0)['value'].sum()
-        index = list(items.index)
         with open(self.outputFile, 'w') as f:
-            for tid in index:
-                f.write(f'{items[tid][0]}')
-                for item in items[tid][1:]:
-                    f.write(f'\t{item}')
-                f.write(f':{sums[tid]}:')
-                f.write(f'{values[tid][0]}')
-                for value in values[tid][1:]:
-                    f.write(f'\t{value}')
-                f.write('\n')
+            _writeUtilities(f, _sortedRows(np.asarray(self.inputDF.index.get_level_values(0)),
+                                           self.inputDF['item'].to_numpy(), self.inputDF['value'].to_numpy(),
+                                           self.chunkSize))
+
+    def createTransactions(self):
+        """
+        Create in memory the transactions of createDB and createTDB, without going through a file
+
+        :return: the transactions, with the tids as timestamps
+        :rtype: TransactionDatabase
+        """
+        return TransactionDatabase.fromTransactions([[str(item) for item in transaction] for transaction in self.df],
+                                                    list(self.df.index))
+
+    def createUtilityTransactions(self):
+        """
+        Create in memory the transactions of createUDB, without going through a file
 
+        :return: the transactions, with the values as the utilities of the items
+        :rtype: TransactionDatabase
+        """
+        return TransactionDatabase.fromRows(np.asarray(self.inputDF.index.get_level_values(0)),
+                                            self.inputDF['item'].to_numpy(), self.inputDF['value'].to_numpy())
 
     def getFileName(self):
         """
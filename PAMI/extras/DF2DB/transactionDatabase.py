@@ -0,0 +1,320 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as _np
+import pandas as _pd
+
+try:
+    from scipy import sparse as _sparse
+except ImportError:
+    _sparse = None
+
+
+def isSparseMatrix(value):
+    """
+    Tell if a value is a scipy.sparse matrix
+
+    :param value: the value
+    :rtype: bool
+    """
+    return _sparse is not None and _sparse.issparse(value)
+
+
+def asTransactionalInput(iFile):
+    """
+    The input of a transactional miner: a scipy.sparse matrix becomes a TransactionDatabase, which the miners read
+    without going through a file, and any other input is unchanged
+
+    :param iFile: the input given to the miner
+    :type iFile: str or pandas.DataFrame or TransactionDatabase or scipy.sparse matrix
+    :rtype: str or pandas.DataFrame or TransactionDatabase
+    """
+    if isSparseMatrix(iFile):
+        return TransactionDatabase.read(iFile)
+    return iFile
+
+
+class TransactionDatabase:
+    """
+        Transactions kept in memory as a CSR structure: the items of transaction i are the item ids
+        indices[indptr[i]:indptr[i + 1]], with optional timestamps and utilities of the items.
+        A TransactionDatabase or a scipy.sparse matrix, whose non zero values are the items of every row, can be
+        given as iFile to the transactional miners, and with utilities to the miners reading a UtilityDatabase.
+
+    Attributes:
+    ----------
+        itemNames: list
+            name of every item id
+        indptr: numpy.ndarray
+            start of the items of every transaction, followed by the number of items
+        indices: numpy.ndarray
+            the item ids of the transactions
+        timestamps: numpy.ndarray
+            timestamp of every transaction, or None
+        utilities: numpy.ndarray
+            utility of every item of indices, or None
+
+    Methods:
+    -------
+        fromTransactions(transactions, timestamps, utilities)
+            Store transactions given as lists of item names
+        fromSparseMatrix(matrix, itemNames, timestamps, utilities)
+            Store the rows of a scipy.sparse matrix
+        fromMask(mask, itemNames, timestamps, values)
+            Store the columns selected in every row of a boolean mask
+        fromRows(tids, items, values)
+            Store the rows of a long DataFrame grouped by tid
+        concatenate(databases)
+            Join databases sharing the same items
+        read(iFile)
+            Return the TransactionDatabase of an in-memory input
+        withoutEmptyTransactions()
+            Return the database without the transactions having no item
+        transactions(names)
+            Iterate over the transactions
+        toDataFrame()
+            Return the DataFrame read by the miners
+        toUtilityDatabase()
+            Return the UtilityDatabase sharing the items and utilities
+    """
+
+    def __init__(self, itemNames, indptr, indices, timestamps=None, utilities=None):
+        self.itemNames = itemNames
+        self.indptr = indptr
+        self.indices = indices
+        self.timestamps = timestamps
+        self.utilities = utilities
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @classmethod
+    def fromTransactions(cls, transactions, timestamps=None, utilities=None):
+        """
+            Store transactions given as lists of item names, the item ids following the first occurrences
+
+            :param transactions: the items of every transaction
+            :type transactions: iterable
+            :param timestamps: timestamp of every transaction
+            :type timestamps: list
+            :param utilities: utilities of the items of every transaction
+            :type utilities: iterable
+            :rtype: TransactionDatabase
+        """
+        ids, itemNames = {}, []
+        indices, lengths = [], []
+        for transaction in transactions:
+            for item in transaction:
+                itemId = ids.get(item)
+                if itemId is None:
+                    itemId = ids[item] = len(itemNames)
+                    itemNames.append(item)
+                indices.append(itemId)
+            lengths.append(len(transaction))
+        indptr = _np.zeros(len(lengths) + 1, dtype=_np.int64)
+        _np.cumsum(lengths, out=indptr[1:])
+        if timestamps is not None:
+            timestamps = _np.asarray(timestamps)
+        if utilities is not None:
+            utilities = _np.fromiter((value for row in utilities for value in row), dtype=_np.float64)
+            if len(utilities) and (utilities == _np.round(utilities)).all():
+                utilities = utilities.astype(_np.int64)
+        return cls(itemNames, indptr, _np.array(indices, dtype=_np.int32), timestamps, utilities)
+
+    @classmethod
+    def fromSparseMatrix(cls, matrix, itemNames=None, timestamps=None, utilities=True):
+        """
+            Store the rows of a scipy.sparse matrix, the items of a row being its columns holding a non zero value.
+            The arrays of a CSR matrix with sorted indices and no explicit zero are used without a copy.
+
+            :param matrix: one row per transaction and one column per item
+            :type matrix: scipy.sparse matrix
+            :param itemNames: name of every column, the column numbers when None
+            :type itemNames: list
+            :param timestamps: timestamp of every row
+            :type timestamps: list
+            :param utilities: keep the values of the matrix as the utilities of the items
+            :type utilities: bool
+            :rtype: TransactionDatabase
+        """
+        matrix = matrix.tocsr()
+        if not matrix.has_canonical_format or (matrix.data == 0).any():
+            matrix = matrix.copy()
+            matrix.sum_duplicates()
+            matrix.eliminate_zeros()
+        if itemNames is None:
+            itemNames = [str(j) for j in range(matrix.shape[1])]
+        if timestamps is not None:
+            timestamps = _np.asarray(timestamps)
+        return cls(list(itemNames), matrix.indptr, matrix.indices, timestamps, matrix.data if utilities else None)
+
+    @classmethod
+    def fromMask(cls, mask, itemNames, timestamps=None, values=None):
+        """
+            Store the columns selected in every row of a boolean mask
+
+            :param mask: one row per transaction and one column per item
+            :type mask: numpy.ndarray
+            :param itemNames: name of every column
+            :type itemNames: list
+            :param timestamps: timestamp of every row
+            :type timestamps: list
+            :param values: array of the shape of mask whose selected values are the utilities of the items
+            :type values: numpy.ndarray
+            :rtype: TransactionDatabase
+        """
+        indices = _np.nonzero(mask)[1].astype(_np.int32)
+        indptr = _np.zeros(len(mask) + 1, dtype=_np.int64)
+        _np.cumsum(mask.sum(axis=1), out=indptr[1:])
+        if timestamps is not None:
+            timestamps = _np.asarray(timestamps)
+        return cls(list(itemNames), indptr, indices, timestamps, None if values is None else values[mask])
+
+    @classmethod
+    def fromRows(cls, tids, items, values=None):
+        """
+            Store the rows of a long DataFrame grouped by tid, the tids being sorted and the items of a tid keeping
+            the order of their rows, as groupby on tid gives them
+
+            :param tids: tid of every row
+            :type tids: numpy.ndarray
+            :param items: item of every row
+            :type items: numpy.ndarray
+            :param values: value of every row, kept as the utility of its item
+            :type values: numpy.ndarray
+            :rtype: TransactionDatabase
+        """
+        order = _np.argsort(tids, kind='stable')
+        tids = tids[order]
+        starts = _np.flatnonzero(_np.concatenate(([True], tids[1:] != tids[:-1]))) if len(tids) else \
+            _np.empty(0, dtype=_np.int64)
+        indices, itemNames = _pd.factorize(items[order])
+        indptr = _np.append(starts, len(tids)).astype(_np.int64)
+        return cls([str(name) for name in itemNames], indptr, indices.astype(_np.int32), tids[starts],
+                   None if values is None else values[order])
+
+    @classmethod
+    def concatenate(cls, databases):
+        """
+            Join databases sharing the same items, one after the other
+
+            :param databases: the databases
+            :type databases: list
+            :rtype: TransactionDatabase
+        """
+        if len(databases) == 1:
+            return databases[0]
+        indptr = [databases[0].indptr[:1]]
+        for database in databases:
+            indptr.append(database.indptr[1:] + indptr[-1][-1])
+        timestamps, utilities = None, None
+        if all(database.timestamps is not None for database in databases):
+            timestamps = _np.concatenate([database.timestamps for database in databases])
+        if all(database.utilities is not None for database in databases):
+            utilities = _np.concatenate([database.utilities for database in databases])
+        return cls(databases[0].itemNames, _np.concatenate(indptr),
+                   _np.concatenate([database.indices for database in databases]), timestamps, utilities)
+
+    @classmethod
+    def read(cls, iFile):
+        """
+            Return the TransactionDatabase of an in-memory input
+
+            :param iFile: a TransactionDatabase or a scipy.sparse matrix
+            :type iFile: TransactionDatabase or scipy.sparse matrix
+            :rtype: TransactionDatabase
+        """
+        if isinstance(iFile, TransactionDatabase):
+            return iFile
+        if isSparseMatrix(iFile):
+            return cls.fromSparseMatrix(iFile)
+        raise TypeError("no in-memory transactions in " + type(iFile).__name__)
+
+    def withoutEmptyTransactions(self):
+        """
+            Return the database without the transactions having no item, as the databases written to a file skip them
+
+            :rtype: TransactionDatabase
+        """
+        kept = self.indptr[1:] > self.indptr[:-1]
+        if kept.all():
+            return self
+        indptr = _np.concatenate((self.indptr[:1], self.indptr[1:][kept]))
+        timestamps = None if self.timestamps is None else self.timestamps[kept]
+        return TransactionDatabase(self.itemNames, indptr, self.indices, timestamps, self.utilities)
+
+    def transactions(self, names=True, chunkSize=1 << 16):
+        """
+            Iterate over the transactions, chunkSize transactions being converted to lists at a time
+
+            :param names: give the item names instead of the item ids
+            :type names: bool
+            :param chunkSize: number of transactions converted at a time
+            :type chunkSize: int
+            :return: generator of the items of every transaction
+            :rtype: generator
+        """
+        for first in range(0, len(self), chunkSize):
+            last = min(first + chunkSize, len(self))
+            start = int(self.indptr[first])
+            bounds = (self.indptr[first:last + 1] - start).tolist()
+            items = self.indices[start:start + bounds[-1]].tolist()
+            if names:
+                items = [self.itemNames[item] for item in items]
+            for i in range(last - first):
+                yield items[bounds[i]:bounds[i + 1]]
+
+    def toDataFrame(self):
+        """
+            Return the DataFrame read by the miners: the column Transactions, and the columns TS, Utilities and
+            TransactionUtility when the timestamps and the utilities are known
+
+            :rtype: pandas.DataFrame
+        """
+        data = {'Transactions': list(self.transactions())}
+        if self.timestamps is not None:
+            data['TS'] = self.timestamps.tolist()
+        if self.utilities is not None:
+            bounds = self.indptr.tolist()
+            utilities = self.utilities.tolist()
+            data['Utilities'] = [utilities[bounds[i]:bounds[i + 1]] for i in range(len(self))]
+            data['TransactionUtility'] = self._transactionUtilities().tolist()
+        return _pd.DataFrame(data)
+
+    def _transactionUtilities(self):
+        """
+            The sum of the utilities of every transaction
+        """
+        sums = _np.zeros(len(self.utilities) + 1, dtype=self.utilities.dtype)
+        _np.cumsum(self.utilities, out=sums[1:])
+        return sums[self.indptr[1:]] - sums[self.indptr[:-1]]
+
+    def toUtilityDatabase(self):
+        """
+            Return the UtilityDatabase of the transactions, whose bounds are the indptr of this database. The utility
+            miners only handle integer utilities, so utilities with a fractional part are refused rather than cast;
+            scale them to integers first.
+
+            :rtype: PAMI.highUtilityPatterns.basic.utilityDatabase.UtilityDatabase
+        """
+        from PAMI.highUtilityPatterns.basic.utilityDatabase import UtilityDatabase
+        if self.utilities is None:
+            raise ValueError("the transactions have no utilities")
+        if self.utilities.dtype.kind not in 'iub' and (self.utilities != _np.round(self.utilities)).any():
+            raise ValueError("the utilities are not integers, scale them to integers first")
+        # the item ids of a UtilityDatabase start at 1
+        return UtilityDatabase((self.indices + 1).astype(_np.int32), self.utilities.astype(_np.int64, copy=False),
+                               self.indptr.astype(_np.int64, copy=False), self._transactionUtilities().astype(_np.int64),
+                               [None] + [str(name) for name in self.itemNames])
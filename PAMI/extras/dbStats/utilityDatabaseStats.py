@@ -1,7 +1,6 @@
 import statistics
-import validators
-from urllib.request import urlopen
 import pandas as pd
+from PAMI.highUtilityPatterns.basic.utilityDatabase import readUtilityTransactions as _readUtilityTransactions
 
 class utilityDatabaseStats:
     """
@@ -85,29 +84,13 @@ class utilityDatabaseStats:
                 self.utilityValues = self.inputFile['Utility'].tolist()
 
         if isinstance(self.inputFile, str):
-            if validators.url(self.inputFile):
-                data = urlopen(self.inputFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(":")]
-                    transaction = [s for s in temp[0].split(self.sep)]
-                    self.Database.append([x for x in transaction if x])
-                    utilities = [int(s) for s in temp[2].split(self.sep)]
-                    self.utilityValues.append([x for x in utilities if x])
-            else:
-                try:
-                    with open(self.inputFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(":")]
-                            transaction = [s for s in temp[0].split(self.sep)]
-                            self.Database.append([x for x in transaction if x])
-                            utilities = [int(s) for s in temp[2].split(self.sep)]
-                            self.utilityValues.append([x for x in utilities if x])
-                except IOError:
-                    print("File Not Found")
-                    quit()
+            try:
+                for items, utilities, transactionUtility in _readUtilityTransactions(self.inputFile, self.sep):
+                    self.Database.append(items)
+                    self.utilityValues.append(utilities)
+            except IOError:
+                print("File Not Found")
+                quit()
 
     def readDatabase(self):
         """
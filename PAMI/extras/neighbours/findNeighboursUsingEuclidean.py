@@ -1,75 +1,63 @@
 import sys
-import re
-from math import sqrt
+from PAMI.extras.neighbours.neighbourIndex import NeighbourIndex as _NeighbourIndex, readPoints as _readPoints
 
 class findNeighboursUsingEuclidean:
     """
     This class create a neighbourhood file using euclid distance.
+    The points are searched through a spatial index (scipy's cKDTree when available, a uniform grid otherwise)
+    and the neighbourhood file is written chunkSize points at a time.
 
     Attribute:
     ----------
         iFile : file
-            Input file name or path of the input file
+            Input file name or path of the input file, the first column of every line being a point such as Point(x y)
         oFile : file
             Output file name or path pf the output file
         maxEucledianDistace : int
             The user can specify maxEucledianDistace.
             This program find pairs of values whose Euclidean distance is less than or equal to maxEucledianDistace
             and store the pairs.
+        metric : str
+            euclidean, or haversine for (longitude latitude) points in degrees and a distance in kilometres
+        sep : str
+            separator of the columns of the input file and of the neighbours in the output file
+        chunkSize : int
+            number of points whose neighbours are searched and written at a time
 
     Methods:
     -------
-        startMine()
+        create()
             find and store the pairs of values whose Euclidean distance is less than or equal to maxEucledianDistace.
         getFileName()
             This function returns output file name.
     """
 
-    def __init__(self,iFile,oFile,maxEucledianDistace):
+    def __init__(self, iFile, oFile, maxEucledianDistace, metric='euclidean', sep='\t', chunkSize=1 << 16):
         self.iFile = iFile
         self.oFile = oFile
         self.maxEucledianDistace = maxEucledianDistace
+        self.metric = metric
+        self.sep = sep
+        self.chunkSize = chunkSize
 
     def create(self):
-        coordinates = []
-        result = {}
-        with open(self.iFile,"r") as f:
-            for line in f:
-                l = line.rstrip().split("\t")
-                l[0] = re.sub(r'[^0-9. ]', '', l[0])
-                coordinates.append(l[0].rstrip().split(' '))
-
-        for i in range(len(coordinates)):
-            for j in range(len(coordinates)):
-                if i != j:
-                    firstCoordinate = coordinates[i]
-                    secondCoordinate = coordinates[j]
-                    x1 = float(firstCoordinate[0])
-                    y1 = float(firstCoordinate[1])
-                    x2 = float(secondCoordinate[0])
-                    y2 = float(secondCoordinate[1])
-                    ansX = x2-x1
-                    ansY = y2-y1
-                    dist = abs(pow(ansX,2) - pow(ansY,2))
-                    norm = sqrt(dist)
-                    if norm <= float(self.maxEucledianDistace):
-                        result[tuple(firstCoordinate)] = result.get(tuple(firstCoordinate),[])
-                        result[tuple(firstCoordinate)].append(secondCoordinate)
-
-        with open(self.oFile,"w") as f:
-            for i in result:
-                string = i[0]+" "+i[1]+"\t"
-                f.write(string)
-                for j in result[i]:
-                    string = j[0] + " " + j[1] + "\t"
-                    f.write(string)
-                f.write("\n")
-
+        labels, coordinates = _readPoints(self.iFile, self.sep)
+        index = _NeighbourIndex(coordinates, float(self.maxEucledianDistace), self.metric)
+        with open(self.oFile, "w") as f:
+            for points, neighbours in index.chunks(self.chunkSize):
+                if len(points) == 0:
+                    continue
+                bounds = [0] + ((points[1:] != points[:-1]).nonzero()[0] + 1).tolist() + [len(points)]
+                points, neighbours = points.tolist(), neighbours.tolist()
+                lines = []
+                for k in range(len(bounds) - 1):
+                    row = neighbours[bounds[k]:bounds[k + 1]]
+                    lines.append(self.sep.join([labels[points[bounds[k]]]] + [labels[j] for j in row]) + "\n")
+                f.writelines(lines)
 
     def getFileName(self):
         return self.oFile
 
 if __name__ == "__main__":
-    euclid = findNeighboursUsingEuclidean(sys.argv[1],sys.argv[2],sys.argv[3])
+    euclid = findNeighboursUsingEuclidean(sys.argv[1], sys.argv[2], sys.argv[3])
     euclid.create()
-
@@ -0,0 +1,187 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import itertools as _itertools
+import re as _re
+import numpy as _np
+
+try:
+    from scipy.spatial import cKDTree as _cKDTree
+except ImportError:
+    _cKDTree = None
+
+_number = _re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def readPoints(iFile, sep='\t'):
+    """
+    Read the points of a file holding one point per line, the first column being the point, such as Point(x y).
+    The first two numbers of the point are its coordinates.
+
+    :param iFile: the file of points
+    :type iFile: str
+    :param sep: separator of the columns
+    :type sep: str
+    :return: the point labels and an array of one row of coordinates per point
+    :rtype: tuple
+    """
+    labels, coordinates = [], []
+    with open(iFile, 'r') as f:
+        for line in f:
+            label = line.rstrip().split(sep)[0].strip()
+            if not label:
+                continue
+            numbers = _number.findall(label)
+            if len(numbers) < 2:
+                raise ValueError("no coordinates in the point " + label)
+            labels.append(label)
+            coordinates.append((float(numbers[0]), float(numbers[1])))
+    return labels, _np.array(coordinates, dtype=_np.float64).reshape(-1, 2)
+
+
+class NeighbourIndex:
+    """
+        A spatial index finding, for every point, the other points within a maximum distance.
+        The points are stored in scipy's cKDTree when scipy is available and in a uniform grid of cells of the size
+        of the maximum distance otherwise, so only the points of the neighbouring cells are compared.
+        With the haversine metric the points are (longitude, latitude) in degrees and the distances are great circle
+        distances on a sphere of the given radius, searched as chord distances between points of the unit sphere.
+
+    Attributes:
+    ----------
+        points: numpy.ndarray
+            the coordinates the distances are computed on, one row per point
+        maxDistance: float
+            the distance threshold in these coordinates
+
+    Methods:
+    -------
+        neighbours(start, end)
+            return the pairs of neighbouring points of the points start to end - 1
+        chunks(chunkSize)
+            iterate over the pairs of neighbouring points, chunkSize points at a time
+    """
+
+    def __init__(self, points, maxDistance, metric='euclidean', radius=6371.0, useKDTree=True):
+        """
+            :param points: one row of coordinates per point
+            :type points: numpy.ndarray
+            :param maxDistance: largest distance between two neighbours, in the unit of radius for haversine
+            :type maxDistance: float
+            :param metric: euclidean or haversine
+            :type metric: str
+            :param radius: radius of the sphere of the haversine metric, the earth radius in kilometres by default
+            :type radius: float
+            :param useKDTree: use scipy's cKDTree when it is available
+            :type useKDTree: bool
+        """
+        points = _np.asarray(points, dtype=_np.float64)
+        maxDistance = float(maxDistance)
+        if maxDistance < 0:
+            raise ValueError("maxDistance must not be negative")
+        if metric == 'euclidean':
+            self.points = points
+            self.maxDistance = maxDistance
+        elif metric == 'haversine':
+            longitudes, latitudes = _np.radians(points[:, 0]), _np.radians(points[:, 1])
+            self.points = _np.column_stack((_np.cos(latitudes) * _np.cos(longitudes),
+                                            _np.cos(latitudes) * _np.sin(longitudes), _np.sin(latitudes)))
+            self.maxDistance = 2 * _np.sin(min(maxDistance / radius, _np.pi) / 2)
+        else:
+            raise ValueError("unknown metric " + str(metric))
+        self._tree = _cKDTree(self.points) if useKDTree and _cKDTree is not None and len(self.points) else None
+        if self._tree is None:
+            self._buildGrid()
+
+    def __len__(self):
+        return len(self.points)
+
+    def _buildGrid(self):
+        """
+            Sort the points by the key of their cell, cells being at least maxDistance wide
+        """
+        dimensions = self.points.shape[1]
+        low = self.points.min(axis=0) if len(self.points) else _np.zeros(dimensions)
+        span = self.points.max(axis=0) - low if len(self.points) else _np.zeros(dimensions)
+        cellSize = self.maxDistance if self.maxDistance > 0 else 1.0
+        # wider cells when the keys of the cells would not fit in 62 bits
+        cellSize = max(cellSize, float(span.max(initial=0)) / (2 ** (62 // dimensions) - 3))
+        cells = _np.floor((self.points - low) / cellSize).astype(_np.int64) + 1
+        extents = cells.max(axis=0, initial=0) + 2
+        strides = _np.cumprod(_np.r_[1, extents[:-1]]).astype(_np.int64)
+        self._keys = cells @ strides
+        self._order = _np.argsort(self._keys, kind='stable')
+        self._sortedKeys = self._keys[self._order]
+        self._offsets = [_np.dot(offset, strides) for offset in _itertools.product((-1, 0, 1), repeat=dimensions)]
+
+    def _gridPairs(self, start, end):
+        """
+            The pairs of points within maxDistance of each other, comparing the points start to end - 1 with the
+            points of the neighbouring cells
+        """
+        queries = _np.arange(start, end, dtype=_np.int64)
+        limit = self.maxDistance * self.maxDistance
+        allQueries, allNeighbours = [], []
+        for offset in self._offsets:
+            keys = self._keys[queries] + offset
+            first = _np.searchsorted(self._sortedKeys, keys, side='left')
+            counts = _np.searchsorted(self._sortedKeys, keys, side='right') - first
+            candidateQueries = _np.repeat(queries, counts)
+            # positions first[q], ..., first[q] + counts[q] - 1 of every query q
+            positions = _np.arange(counts.sum()) + _np.repeat(first - (_np.cumsum(counts) - counts), counts)
+            candidates = self._order[positions]
+            distances = ((self.points[candidateQueries] - self.points[candidates]) ** 2).sum(axis=1)
+            kept = (distances <= limit) & (candidateQueries != candidates)
+            allQueries.append(candidateQueries[kept])
+            allNeighbours.append(candidates[kept])
+        return _np.concatenate(allQueries), _np.concatenate(allNeighbours)
+
+    def neighbours(self, start=0, end=None):
+        """
+            A method to find the neighbours of the points start to end - 1
+
+            :param start: the first point
+            :type start: int
+            :param end: the point after the last one, the number of points when None
+            :type end: int
+            :return: the points and their neighbours, sorted by point and then by neighbour
+            :rtype: tuple
+        """
+        end = len(self.points) if end is None else min(end, len(self.points))
+        if start >= end:
+            return _np.empty(0, dtype=_np.int64), _np.empty(0, dtype=_np.int64)
+        if self._tree is not None:
+            pairs = _cKDTree(self.points[start:end]).sparse_distance_matrix(self._tree, self.maxDistance,
+                                                                             output_type='ndarray')
+            queries = pairs['i'].astype(_np.int64) + start
+            neighbours = pairs['j'].astype(_np.int64)
+            kept = queries != neighbours
+            queries, neighbours = queries[kept], neighbours[kept]
+        else:
+            queries, neighbours = self._gridPairs(start, end)
+        order = _np.lexsort((neighbours, queries))
+        return queries[order], neighbours[order]
+
+    def chunks(self, chunkSize=1 << 16):
+        """
+            Iterate over the neighbours of all points, chunkSize points at a time
+
+            :param chunkSize: number of points searched at a time
+            :type chunkSize: int
+            :return: generator of the points and their neighbours, sorted by point and then by neighbour
+            :rtype: generator
+        """
+        for start in range(0, len(self.points), chunkSize):
+            yield self.neighbours(start, start + chunkSize)
@@ -0,0 +1,385 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os as _os
+from urllib.request import urlopen as _urlopen
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+
+_cache = {}
+
+
+def _parseLine(line, sep):
+    """
+    Split a line of a neighbourhood file, item followed by its neighbours
+
+    :param line: the line
+    :type line: str
+    :param sep: separator of the items
+    :type sep: str
+    :return: the item and its neighbours, or None for an empty line
+    :rtype: tuple
+    """
+    temp = [i.strip() for i in line.split(sep)]
+    temp = [x for x in temp if x]
+    if not temp:
+        return None
+    return temp[0], temp[1:]
+
+
+def readNeighbourRows(nFile, sep='\t'):
+    """
+    Read the rows of a neighbourhood file one at a time. nFile is a file path, a URL or a DataFrame with the column
+    Neighbours and optionally the column items; without items the first value of every Neighbours row is the item.
+
+    :param nFile: the neighbourhood file
+    :type nFile: str or pandas.DataFrame
+    :param sep: separator of the items
+    :type sep: str
+    :return: generator of every item and its neighbours
+    :rtype: generator
+    """
+    if isinstance(nFile, _pd.DataFrame):
+        columns = {column.lower(): column for column in nFile.columns.values.tolist()}
+        itemColumn = columns.get('items', columns.get('item'))
+        rows = nFile[columns['neighbours']].tolist() if 'neighbours' in columns else []
+        items = nFile[itemColumn].tolist() if itemColumn is not None else None
+        for k in range(len(rows)):
+            row = rows[k]
+            row = [x for x in row.split(sep) if x] if isinstance(row, str) else [str(x) for x in row]
+            if items is None:
+                if row:
+                    yield row[0], row[1:]
+                continue
+            item = items[k]
+            yield (str(item[0]) if isinstance(item, (list, tuple)) else str(item)), row
+    elif _validators.url(nFile):
+        for line in _urlopen(nFile):
+            row = _parseLine(line.decode("utf-8"), sep)
+            if row is not None:
+                yield row
+    else:
+        with open(nFile, 'r', encoding='utf-8') as f:
+            for line in f:
+                row = _parseLine(line, sep)
+                if row is not None:
+                    yield row
+
+
+class NeighbourhoodGraph:
+    """
+        The neighbourhood of the items of a spatial database stored as a CSR adjacency: the neighbours of item id i are
+        indices[indptr[i]:indptr[i + 1]], sorted. Items are numbered in the order of their first occurrence in the
+        file, as an item or as a neighbour. An item given on several lines keeps its last line.
+        Graphs read from files are cached, keyed by the path and the separator, until the file changes.
+
+    Attributes:
+    ----------
+        itemNames: list
+            name of every item id
+        indptr: numpy.ndarray
+            start of the neighbours of every item id, followed by the number of edges
+        indices: numpy.ndarray
+            the neighbour ids
+        listed: numpy.ndarray
+            True for the items having a line of their own in the file
+
+    Methods:
+    -------
+        read(nFile, sep, cache)
+            Read a neighbourhood file
+        neighbours(item)
+            return the neighbour ids of an item
+        isNeighbour(item, other)
+            tell if other is a neighbour of item
+        commonNeighbours(items)
+            return the ids of the neighbours shared by all the items
+        neighbourSets(mapping)
+            return the neighbours of every listed item as sets
+        bitsets(items)
+            return the neighbours of every item among items as an integer bitset
+        regions(items, maxRegionSize)
+            split the items into regions that can be mined independently
+    """
+
+    def __init__(self, itemNames, indptr, indices, listed):
+        self.itemNames = itemNames
+        self.indptr = indptr
+        self.indices = indices
+        self.listed = listed
+        self._ids = {name: i for i, name in enumerate(itemNames)}
+
+    def __len__(self):
+        return len(self.itemNames)
+
+    def __contains__(self, item):
+        itemId = self._ids.get(item)
+        return itemId is not None and bool(self.listed[itemId])
+
+    @classmethod
+    def fromRows(cls, rows):
+        """
+            Build the graph of rows given one at a time
+
+            :param rows: every item and its neighbours
+            :type rows: iterable
+            :rtype: NeighbourhoodGraph
+        """
+        ids, itemNames = {}, []
+        lines = {}
+        for item, neighbours in rows:
+            row = []
+            for name in [item] + list(neighbours):
+                itemId = ids.get(name)
+                if itemId is None:
+                    itemId = ids[name] = len(itemNames)
+                    itemNames.append(name)
+                row.append(itemId)
+            lines[row[0]] = row[1:]
+        listed = _np.zeros(len(itemNames), dtype=bool)
+        listed[list(lines.keys())] = True
+        sources = _np.fromiter((i for i, row in lines.items() for _ in row), dtype=_np.int64)
+        targets = _np.fromiter((j for row in lines.values() for j in row), dtype=_np.int64, count=len(sources))
+        pairs = _np.unique(sources * len(itemNames) + targets)
+        sources, targets = pairs // max(len(itemNames), 1), pairs % max(len(itemNames), 1)
+        indptr = _np.zeros(len(itemNames) + 1, dtype=_np.int64)
+        _np.cumsum(_np.bincount(sources, minlength=len(itemNames)), out=indptr[1:])
+        return cls(itemNames, indptr, targets.astype(_np.int32), listed)
+
+    @classmethod
+    def read(cls, nFile, sep='\t', cache=True):
+        """
+            Read a neighbourhood file, the graphs of files being cached until the files change
+
+            :param nFile: file path, URL, DataFrame or an already read NeighbourhoodGraph
+            :type nFile: str or pandas.DataFrame or NeighbourhoodGraph
+            :param sep: separator of the items
+            :type sep: str
+            :param cache: reuse the graph of a file read before
+            :type cache: bool
+            :rtype: NeighbourhoodGraph
+        """
+        if isinstance(nFile, NeighbourhoodGraph):
+            return nFile
+        if not isinstance(nFile, str) or _validators.url(nFile):
+            return cls.fromRows(readNeighbourRows(nFile, sep))
+        key = (_os.path.abspath(nFile), sep)
+        status = _os.stat(nFile)
+        version = (status.st_mtime_ns, status.st_size)
+        if cache and key in _cache and _cache[key][0] == version:
+            return _cache[key][1]
+        graph = cls.fromRows(readNeighbourRows(nFile, sep))
+        if cache:
+            _cache[key] = (version, graph)
+        return graph
+
+    def itemId(self, item):
+        """
+            A method to return the id of an item, None for an unknown item
+
+            :param item: the item name
+            :type item: str
+            :rtype: int
+        """
+        return self._ids.get(item)
+
+    def neighbours(self, item):
+        """
+            A method to return the sorted neighbour ids of an item, empty for an unknown item
+
+            :param item: the item name
+            :type item: str
+            :rtype: numpy.ndarray
+        """
+        itemId = self._ids.get(item)
+        if itemId is None:
+            return self.indices[:0]
+        return self.indices[self.indptr[itemId]:self.indptr[itemId + 1]]
+
+    def neighbourNames(self, item):
+        """
+            A method to return the neighbours of an item
+
+            :param item: the item name
+            :type item: str
+            :rtype: list
+        """
+        return [self.itemNames[j] for j in self.neighbours(item).tolist()]
+
+    def isNeighbour(self, item, other):
+        """
+            A method to tell if other is a neighbour of item
+
+            :param item: the item name
+            :type item: str
+            :param other: the name of the other item
+            :type other: str
+            :rtype: bool
+        """
+        otherId = self._ids.get(other)
+        if otherId is None:
+            return False
+        row = self.neighbours(item)
+        position = _np.searchsorted(row, otherId)
+        return position < len(row) and row[position] == otherId
+
+    def commonNeighbours(self, items):
+        """
+            A method to return the ids of the items neighbouring all the given items, intersecting the sorted rows
+            from the shortest one
+
+            :param items: the item names
+            :type items: iterable
+            :rtype: numpy.ndarray
+        """
+        rows = sorted((self.neighbours(item) for item in items), key=len)
+        if not rows:
+            return self.indices[:0]
+        common = rows[0]
+        for row in rows[1:]:
+            if len(common) == 0:
+                break
+            common = _np.intersect1d(common, row, assume_unique=True)
+        return common
+
+    def commonNeighbourNames(self, items, listedOnly=False):
+        """
+            A method to return the names of the items neighbouring all the given items
+
+            :param items: the item names
+            :type items: iterable
+            :param listedOnly: keep only the neighbours having a line of their own in the file
+            :type listedOnly: bool
+            :rtype: set
+        """
+        common = self.commonNeighbours(items)
+        if listedOnly:
+            common = common[self.listed[common]]
+        return {self.itemNames[j] for j in common.tolist()}
+
+    def neighbourSets(self, mapping=None):
+        """
+            A method to return the neighbours of every item having a line in the file
+
+            :param mapping: names of the items in the returned sets, the items missing from it being left out; the
+                item names when None
+            :type mapping: dict
+            :return: item -> set of its neighbours
+            :rtype: dict
+        """
+        if mapping is None:
+            labels = self.itemNames
+        else:
+            labels = [mapping.get(name) for name in self.itemNames]
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        neighbourSets = {}
+        for i in _np.flatnonzero(self.listed).tolist():
+            if labels[i] is None:
+                continue
+            neighbourSets[labels[i]] = {labels[j] for j in indices[indptr[i]:indptr[i + 1]] if labels[j] is not None}
+        return neighbourSets
+
+    def bitsets(self, items):
+        """
+            A method to return the neighbours of every given item as an integer whose bit k is set when items[k] is
+            one of them, so the neighbours shared by several items are the and of their bitsets
+
+            :param items: the item names
+            :type items: list
+            :return: item -> bitset of its neighbours among items
+            :rtype: dict
+        """
+        positions = _np.full(len(self.itemNames), -1, dtype=_np.int64)
+        known = [(k, self._ids[item]) for k, item in enumerate(items) if item in self._ids]
+        for k, itemId in known:
+            positions[itemId] = k
+        bitsets = {}
+        for item in items:
+            row = positions[self.neighbours(item)]
+            row = row[row >= 0]
+            bits = _np.zeros(len(items), dtype=bool)
+            bits[row] = True
+            bitsets[item] = int.from_bytes(_np.packbits(bits, bitorder='little').tobytes(), 'little')
+        return bitsets
+
+    def _undirected(self, items):
+        """
+            The edges between the given item ids in both directions, as a CSR adjacency over all the item ids
+        """
+        occurs = _np.zeros(len(self.itemNames), dtype=bool)
+        occurs[items] = True
+        sources = _np.repeat(_np.arange(len(self.itemNames), dtype=_np.int64), _np.diff(self.indptr))
+        targets = self.indices.astype(_np.int64)
+        kept = occurs[sources] & occurs[targets] & (sources != targets)
+        sources, targets = sources[kept], targets[kept]
+        pairs = _np.unique(_np.concatenate((sources * len(self.itemNames) + targets,
+                                            targets * len(self.itemNames) + sources)))
+        sources, targets = pairs // max(len(self.itemNames), 1), pairs % max(len(self.itemNames), 1)
+        indptr = _np.zeros(len(self.itemNames) + 1, dtype=_np.int64)
+        _np.cumsum(_np.bincount(sources, minlength=len(self.itemNames)), out=indptr[1:])
+        return indptr, targets
+
+    def regions(self, items=None, maxRegionSize=None):
+        """
+            A method to split the items into regions that can be mined independently. The items of a spatial pattern
+            are neighbours of each other in one direction or the other, so every pattern lies in one connected
+            component of the graph. Components larger than maxRegionSize are cut into tiles of consecutive items of
+            a breadth first order, and the small components are grouped up to maxRegionSize items. Every region is
+            made of its core items and of the halo of their neighbours, so it holds every pattern containing one of
+            its core items; the cores partition the items.
+
+            :param items: ids of the items to split, all the items when None
+            :type items: iterable
+            :param maxRegionSize: largest number of core items of a region, no limit when None
+            :type maxRegionSize: int
+            :return: the core item ids and the region item ids of every region, sorted
+            :rtype: list
+        """
+        if items is None:
+            items = _np.arange(len(self.itemNames), dtype=_np.int64)
+        else:
+            items = _np.unique(_np.asarray(list(items), dtype=_np.int64))
+        if maxRegionSize is None or maxRegionSize < 1:
+            maxRegionSize = max(len(items), 1)
+        indptr, indices = self._undirected(items)
+        indptr, indices = indptr.tolist(), indices.tolist()
+        visited = [False] * len(self.itemNames)
+        tiles = []
+        for start in items.tolist():
+            if visited[start]:
+                continue
+            visited[start] = True
+            component = [start]
+            for item in component:
+                for neighbour in indices[indptr[item]:indptr[item + 1]]:
+                    if not visited[neighbour]:
+                        visited[neighbour] = True
+                        component.append(neighbour)
+            tiles.extend(component[k:k + maxRegionSize] for k in range(0, len(component), maxRegionSize))
+        cores = []
+        for tile in tiles:
+            if cores and len(cores[-1]) + len(tile) <= maxRegionSize:
+                cores[-1].extend(tile)
+            else:
+                cores.append(list(tile))
+        regions = []
+        for core in cores:
+            halo = [indices[indptr[item]:indptr[item + 1]] for item in core]
+            region = _np.unique(_np.concatenate([_np.asarray(core, dtype=_np.int64)] +
+                                                [_np.asarray(row, dtype=_np.int64) for row in halo]))
+            regions.append((sorted(core), region.tolist()))
+        return regions
@@ -0,0 +1,331 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import contextlib as _contextlib
+import io as _io
+import math as _math
+import multiprocessing as _mp
+import os as _os
+import tempfile as _tempfile
+import time as _time
+import numpy as _np
+import psutil as _psutil
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
+
+_worker = {}
+
+
+def _eclatKey(names):
+    """
+    The key of a SpatialECLAT pattern, the item of a single item pattern and the sorted items otherwise
+    """
+    return names[0] if len(names) == 1 else tuple(sorted(names))
+
+
+# name of the algorithm -> (utility database, items of a pattern key, pattern key of items, patterns grown from the
+# first item of their key)
+_algorithms = {
+    'SpatialECLAT': (False, lambda key: [key] if isinstance(key, str) else list(key), _eclatKey, False),
+    'FSPGrowth': (False, lambda key: key.split('\t'), '\t'.join, True),
+    'SHUIM': (True, lambda key: key.split(' '), ' '.join, False),
+}
+
+
+def _readTransactions(iFile, sep, utility):
+    """
+    Read the items of every line of a database and, for a utility database, the other fields of the line
+
+    :param iFile: the database
+    :type iFile: str
+    :param sep: separator of the items
+    :type sep: str
+    :param utility: the lines are items:transaction utility:utilities, optionally followed by more item columns
+    :type utility: bool
+    :return: the items of every line and the transaction utility and item columns of every line
+    :rtype: tuple
+    """
+    transactions, fields = [], []
+    with open(iFile, 'r', encoding='utf-8') as f:
+        for line in f:
+            if utility:
+                parts = line.strip().split(':')
+                if len(parts) < 3:
+                    continue
+                transactions.append(parts[0].strip().split(sep))
+                fields.append((parts[1], [part.strip().split(sep) for part in parts[2:]]))
+            else:
+                temp = [i.rstrip() for i in line.split(sep)]
+                transactions.append([x for x in temp if x])
+    return transactions, fields
+
+
+def _initWorker(algorithm, graph, transactions, fields, threshold, sep, regions):
+    """
+        Keep the data shared by the regions mined in a worker
+    """
+    _worker.update(algorithm=algorithm, graph=graph, transactions=transactions, fields=fields, threshold=threshold,
+                   sep=sep, regions=regions)
+
+
+def _mineRegion(idx):
+    """
+        Mine the database restricted to the items of a region and keep the patterns owned by its core items.
+        The items are renamed to their ids, so the patterns are read back whatever the item names are.
+
+        :param idx: position of the region
+        :type idx: int
+        :return: idx and the ids and value of every pattern of the region
+        :rtype: tuple
+    """
+    algorithm = _worker['algorithm']
+    graph = _worker['graph']
+    sep = _worker['sep']
+    utility, keyItems, patternKey, fromFirstItem = _algorithms[algorithm.__name__]
+    core, region = _worker['regions'][idx]
+    inRegion = _np.zeros(len(graph), dtype=bool)
+    inRegion[region] = True
+    descriptor, path = _tempfile.mkstemp(suffix='.txt')
+    try:
+        with _os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            for k, row in enumerate(_worker['transactions']):
+                positions = _np.flatnonzero(inRegion[row]).tolist()
+                line = sep.join(str(j) for j in row[positions].tolist())
+                if utility:
+                    # the transaction utility is kept, it still bounds the utility of the items of the region
+                    if not positions:
+                        continue
+                    transactionUtility, columns = _worker['fields'][k]
+                    line += ':' + transactionUtility + ':' + ':'.join(sep.join(column[i] for i in positions)
+                                                                      for column in columns)
+                # transactional databases keep every line, so the transaction ids and the number of lines are unchanged
+                f.write(line + '\n')
+        miner = algorithm(path, graph, _worker['threshold'], sep)
+        if fromFirstItem:
+            miner._responsibleItems = {str(j) for j in core}
+        with _contextlib.redirect_stdout(_io.StringIO()):
+            miner.startMine()
+        patterns = miner.getPatterns()
+    finally:
+        _os.remove(path)
+    owned = _np.zeros(len(graph), dtype=bool)
+    owned[core] = True
+    result = []
+    for key, value in patterns.items():
+        items = [int(j) for j in keyItems(key)]
+        if owned[items[0] if fromFirstItem else min(items)]:
+            result.append((items, value))
+    return idx, result
+
+
+class RegionMiner:
+    """
+        Mines a spatial database region by region in parallel processes. Spatial patterns only combine items that are
+        neighbours of each other, so the items are split into regions with NeighbourhoodGraph.regions: connected
+        components of the neighbourhood, large components being cut into tiles with a halo of their neighbours.
+        Every region is mined by the algorithm on the database restricted to its items, and keeps the patterns
+        owned by its core items, so every pattern is kept by exactly one region whatever the order in which the
+        regions complete. FSPGrowth only grows the patterns of the core items through its responsibleItems.
+        The regions are mined through temporary files, as the algorithms read their database from a file.
+
+    Attributes:
+    ----------
+        algorithm : class
+            SpatialECLAT, FSPGrowth or SHUIM
+        iFile : file
+            Name of the input file
+        nFile : file
+            Name of the neighbourhood file
+        threshold : int or float or str
+            minSup of SpatialECLAT and FSPGrowth or minUtil of SHUIM
+        sep : str
+            separator of the items
+        numWorkers : int
+            number of processes
+        maxRegionSize : int
+            largest number of core items of a region, the number of items divided by numWorkers when None
+
+    Methods:
+    -------
+        startMine()
+            Mining process will start from here
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        savePatterns(oFile)
+            Complete set of patterns will be loaded in to a output file, as the algorithm saves them
+        getPatternsAsDataFrame()
+            Complete set of patterns will be loaded in to a dataframe, as the algorithm returns them
+        getRegions()
+            The core items and the items of every region
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+
+    Sample run of importing the code:
+    -------------------------------
+
+        from PAMI.extras.neighbours.regionMining import RegionMiner
+
+        from PAMI.frequentSpatialPattern.basic.FSPGrowth import FSPGrowth
+
+        obj = RegionMiner(FSPGrowth, "sampleTDB.txt", "sampleN.txt", 5, numWorkers=4)
+
+        obj.startMine()
+
+        spatialFrequentPatterns = obj.getPatterns()
+
+        print("Total number of Spatial Frequent Patterns:", len(spatialFrequentPatterns))
+
+        obj.savePatterns("outFile")
+    """
+
+    def __init__(self, algorithm, iFile, nFile, threshold, sep='\t', numWorkers=1, maxRegionSize=None):
+        if algorithm.__name__ not in _algorithms:
+            raise ValueError("region mining does not support " + algorithm.__name__)
+        self._algorithm = algorithm
+        self._iFile = iFile
+        self._nFile = nFile
+        self._threshold = threshold
+        self._sep = sep
+        self._numWorkers = numWorkers
+        self._maxRegionSize = maxRegionSize
+        self._finalPatterns = {}
+        self._regions = []
+        self._startTime = float()
+        self._endTime = float()
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+
+    def startMine(self):
+        """
+            Mining process will start from here
+        """
+        self._startTime = _time.time()
+        utility, keyItems, patternKey, fromFirstItem = _algorithms[self._algorithm.__name__]
+        graph = _NeighbourhoodGraph.read(self._nFile, self._sep)
+        transactions, fields = _readTransactions(self._iFile, self._sep, utility)
+        # the items missing from the neighbourhood file are numbered after the items of the graph
+        names = list(graph.itemNames)
+        ids = {}
+        for k in range(len(transactions)):
+            row = []
+            for item in transactions[k]:
+                itemId = graph.itemId(item)
+                if itemId is None:
+                    itemId = ids.get(item)
+                    if itemId is None:
+                        itemId = ids[item] = len(names)
+                        names.append(item)
+                row.append(itemId)
+            transactions[k] = _np.array(row, dtype=_np.int64)
+        extra = len(names) - len(graph)
+        idGraph = _NeighbourhoodGraph([str(j) for j in range(len(names))],
+                                      _np.concatenate((graph.indptr, _np.full(extra, graph.indptr[-1]))),
+                                      graph.indices, _np.concatenate((graph.listed, _np.zeros(extra, dtype=bool))))
+        occurring = _np.unique(_np.concatenate(transactions)) if transactions else _np.empty(0, dtype=_np.int64)
+        maxRegionSize = self._maxRegionSize
+        if maxRegionSize is None:
+            maxRegionSize = _math.ceil(len(occurring) / max(self._numWorkers, 1))
+        regions = idGraph.regions(occurring, maxRegionSize) if len(occurring) else []
+        initArgs = (self._algorithm, idGraph, transactions, fields, self._threshold, self._sep, regions)
+        results = {}
+        if self._numWorkers > 1 and len(regions) > 1:
+            order = sorted(range(len(regions)), key=lambda i: -len(regions[i][1]))
+            with _mp.Pool(min(self._numWorkers, len(regions)), initializer=_initWorker, initargs=initArgs) as pool:
+                for idx, result in pool.imap_unordered(_mineRegion, order, chunksize=1):
+                    results[idx] = result
+        else:
+            _initWorker(*initArgs)
+            try:
+                for idx in range(len(regions)):
+                    results[idx] = _mineRegion(idx)[1]
+            finally:
+                _worker.clear()
+        self._finalPatterns = {}
+        for idx in range(len(regions)):
+            for items, value in results[idx]:
+                self._finalPatterns.setdefault(patternKey([names[j] for j in items]), value)
+        self._regions = [([names[j] for j in core], [names[j] for j in region]) for core, region in regions]
+        self._endTime = _time.time()
+        process = _psutil.Process(_os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Spatial patterns were generated successfully using region partitioned " + self._algorithm.__name__)
+
+    def _miner(self):
+        """
+            An algorithm holding the final patterns, to save them in its own format
+        """
+        miner = self._algorithm(self._iFile, self._nFile, self._threshold, self._sep)
+        miner._finalPatterns = self._finalPatterns
+        return miner
+
+    def getPatterns(self):
+        """ Function to send the set of patterns after completion of the mining process
+
+        :return: returning patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def savePatterns(self, outFile):
+        """Complete set of patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: file
+        """
+        self._miner().savePatterns(outFile)
+
+    def getPatternsAsDataFrame(self):
+        """Storing final patterns in a dataframe
+
+        :return: returning patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        return self._miner().getPatternsAsDataFrame()
+
+    def getRegions(self):
+        """The core items and the items of every region mined
+
+        :return: the core items and the items of every region
+        :rtype: list
+        """
+        return self._regions
+
+    def getMemoryUSS(self):
+        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
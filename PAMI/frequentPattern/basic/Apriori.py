@@ -155,6 +155,9 @@ class Apriori(_ab._frequentPatterns):
 
             for k in temp:
                 self._Database.append(set(k))
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            for k in self._iFile.transactions():
+                self._Database.append(set(k))
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
@@ -150,6 +150,8 @@ class ECLAT(_ab._frequentPatterns):
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
                 self._Database = self._iFile['Transactions'].tolist()
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            self._Database = list(self._iFile.transactions())
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
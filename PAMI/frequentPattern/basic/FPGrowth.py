@@ -357,6 +357,8 @@ class FPGrowth(_fp._frequentPatterns):
                 self.__Database = self._iFile['Transactions'].tolist()
 
             #print(self.Database)
+        if isinstance(self._iFile, _fp._TransactionDatabase):
+            self.__Database = list(self._iFile.transactions())
         if isinstance(self._iFile, str):
             if _fp._validators.url(self._iFile):
                 data = _fp._urlopen(self._iFile)
@@ -39,6 +39,8 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 import functools as _functools
 
 
@@ -94,7 +96,7 @@ class _frequentPatterns(_ABC):
     def __init__(self, iFile, minSup, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str or DataFrame
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -104,7 +106,7 @@ class _frequentPatterns(_ABC):
         :type sep: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._sep = sep
         self._minSup = minSup
         self._finalPatterns = {}
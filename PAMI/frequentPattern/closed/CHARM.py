@@ -206,6 +206,16 @@ class CHARM(_ab._frequentPatterns):
                     else:
                         self._mapSupport[j] += 1
                         self._tidList[j].append(self._lno)
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            for i in self._iFile.transactions():
+                self._lno += 1
+                for j in i:
+                    if j not in self._mapSupport:
+                        self._mapSupport[j] = 1
+                        self._tidList[j] = [self._lno]
+                    else:
+                        self._mapSupport[j] += 1
+                        self._tidList[j].append(self._lno)
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
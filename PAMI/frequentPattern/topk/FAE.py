@@ -147,6 +147,8 @@ class FAE(_ab._frequentPatterns):
                 self._Database = self._iFile['Transactions'].tolist()
 
             # print(self.Database)
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            self._Database = list(self._iFile.transactions())
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
@@ -26,6 +26,8 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 
 
 class _frequentPatterns(_ABC):
@@ -78,7 +80,7 @@ class _frequentPatterns(_ABC):
     def __init__(self, iFile, k, sep = '\t'):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param k: int
         :type minSup: int or float or str
         :param maxPer: The user can specify maxPer either in count or proportion of database size.
@@ -90,7 +92,7 @@ class _frequentPatterns(_ABC):
         :type sep: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._k = k
         self._sep = sep
         self._oFile = str()
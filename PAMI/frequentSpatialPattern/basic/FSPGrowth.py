@@ -1,5 +1,6 @@
 
 from PAMI.frequentSpatialPattern.basic import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
 
 
 
@@ -160,17 +161,19 @@ class _Tree:
             frequentPatterns.extend(pTree.getPattern(i, pattern, minSup, neighbour))
         return frequentPatterns
 
-    def mining(self, minSup, neighbourhood=None):
+    def mining(self, minSup, isResponsible=lambda x: True, neighbourhood=None):
         """
-        Pattern mining on your own
+        Pattern mining on your own, the patterns being grown from the items isResponsible accepts
         :param minSup: int
-        :param neighbourhood: function
+        :param isResponsible: function
         :param neighbourhood: dict
         :return: list
         """
         frequentPatterns = []
         flist = sorted([item for item in self.nodeLink.keys()])
         for item in reversed(flist):
+            if not isResponsible(item):
+                continue
             frequentPatterns.extend(self.getPattern(item, item, minSup, neighbourhood))
         return frequentPatterns
 
@@ -197,6 +200,9 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        responsibleItems : set
+            When not None, only the patterns grown from these items are mined, as done by the region miner of
+            PAMI.extras.neighbours.regionMining
 
     Methods
     -------
@@ -290,6 +296,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
     _Database = []
     _neighbourList = {}
     _fpList = []
+    _responsibleItems = None
 
     '''def __init__(self, iFile, nFile, minSup, sep):
         self.iFile = iFile
@@ -310,6 +317,9 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
             if 'Transactions' in i:
                 self._Database = self._iFile['Transactions'].tolist()
             self._lno = len(self._Database)
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            self._Database = list(self._iFile.transactions())
+            self._lno = len(self._Database)
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
@@ -333,39 +343,11 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
                     print("File Not Found1")
                     quit()
 
-        self._neighbourList = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
-            data, items = [], []
-            if self._nFile.empty:
-                print("its empty..")
-            i = self._nFile.columns.values.tolist()
-            if 'item' in i:
-                items = self._nFile['items'].tolist()
-            if 'Neighbours' in i:
-                data = self._nFile['Neighbours'].tolist()
-            for k in range(len(items)):
-                self._neighbourList[items[k][0]] = data[k]
-            # print(self.Database)
-        if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
-                data = _ab._urlopen(self._nFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._neighbourList[temp[0]] = temp[1:]
-            else:
-                try:
-                    with open(self._nFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._neighbourList[temp[0]] = temp[1:]
-                except IOError:
-                    print("File Not Found2")
-                    quit()
+        try:
+            self._neighbourList = _NeighbourhoodGraph.read(self._nFile, self._sep).neighbourSets()
+        except IOError:
+            print("File Not Found2")
+            quit()
         '''with open(self.nFile, "r") as nf:
             for line in nf:
                 l = line.rstrip().split('\t')
@@ -430,7 +412,11 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
         self._getFrequentItems()
         self._sortTransaction()
         _FPTree = self._createFPTree()
-        self._finalPatterns = (dict(_FPTree.mining(self._minSup, self._neighbourList)))
+        if self._responsibleItems is None:
+            isResponsible = lambda x: True
+        else:
+            isResponsible = self._responsibleItems.__contains__
+        self._finalPatterns = (dict(_FPTree.mining(self._minSup, isResponsible, self._neighbourList)))
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
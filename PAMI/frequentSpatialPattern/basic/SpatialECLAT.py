@@ -1,4 +1,20 @@
 from PAMI.frequentSpatialPattern.basic import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
+
+
+def _support(tidSet):
+    """
+    The number of transactions of a bitset
+
+    :param tidSet: bitset of transactions
+    :type tidSet: int
+    :rtype: int
+    """
+    return bin(tidSet).count('1')
+
+
+if hasattr(int, 'bit_count'):
+    _support = int.bit_count
 
 
 class SpatialECLAT(_ab._spatialFrequentPatterns):
@@ -57,10 +73,8 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
             Generating one frequent patterns
         dictKeysToInt(iList)
             Converting dictionary keys to integer elements
-        eclatGeneration(cList)
-            It will generate the combinations of frequent items
-        generateSpatialFrequentPatterns(tidList)
-            It will generate the combinations of frequent items from a list of items
+        depthFirstSearch(prefix, items, tidSets, neighbourhood)
+            Mining the extensions of a prefix depth first, over bitset tidsets
         convert(value):
             To convert the given user specified value    
         getNeighbourItems(keySet):
@@ -128,7 +142,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
 
     def __init__(self, iFile, nFile, minSup, sep="\t"):
         super().__init__(iFile, nFile, minSup, sep)
-        self._NeighboursMap = {}
+        self._neighbourhood = None
 
     def _creatingItemSets(self):
         """Storing the complete transactions of the database/input file in a database variable
@@ -144,6 +158,8 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
                 self._Database = self._iFile['Transactions'].tolist()
             if 'Patterns' in i:
                 self._Database = self._iFile['Patterns'].tolist()
+        if isinstance(self._iFile, _ab._TransactionDatabase):
+            self._Database = list(self._iFile.transactions())
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
@@ -164,18 +180,29 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
                 except IOError:
                     print("File Not Found")
                     quit()
+
     # function to get frequent one pattern
     def _frequentOneItem(self):
-        """Generating one frequent patterns"""
-        self._finalPatterns = {}
+        """Generating one frequent patterns, with the transactions of every item as a bitset
+
+        :return: the frequent items in the order of their first occurrence and their tidsets
+        :rtype: tuple
+        """
         candidate = {}
         for i in range(len(self._Database)):
-            for j in range(len(self._Database[i])):
-                if self._Database[i][j] not in candidate:
-                    candidate[self._Database[i][j]] = [i]
-                else:
-                    candidate[self._Database[i][j]] += [i]
-        self._finalPatterns = {keys: value for keys, value in candidate.items() if len(value) >= self._minSup}
+            for item in self._Database[i]:
+                if item not in candidate:
+                    candidate[item] = [i]
+                elif candidate[item][-1] != i:
+                    candidate[item].append(i)
+        items = [item for item, tids in candidate.items() if len(tids) >= self._minSup]
+        bits = _ab._np.zeros(len(self._Database), dtype=bool)
+        tidSets = []
+        for item in items:
+            bits[:] = False
+            bits[candidate[item]] = True
+            tidSets.append(int.from_bytes(_ab._np.packbits(bits, bitorder='little').tobytes(), 'little'))
+        return items, tidSets
 
     def _convert(self, value):
         """
@@ -195,6 +222,17 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
                 value = int(value)
         return value
 
+    @staticmethod
+    def _tidList(tidSet):
+        """Converting a bitset of transactions to the list of their ids
+
+        :param tidSet: bitset of transactions
+        :type tidSet: int
+        :rtype: list
+        """
+        data = _ab._np.frombuffer(tidSet.to_bytes((tidSet.bit_length() + 7) // 8, 'little'), dtype=_ab._np.uint8)
+        return _ab._np.flatnonzero(_ab._np.unpackbits(data, bitorder='little')).tolist()
+
     @staticmethod
     def _dictKeysToInt(iList):
         """Converting dictionary keys to integer elements
@@ -212,59 +250,35 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
             # print(sorted(temp))
         return sorted(temp)
 
-    def _eclatGeneration(self, cList):
-        """It will generate the combinations of frequent items
-
-        :param cList :it represents the items with their respective transaction identifiers
-        :type cList: dictionary
-        :return: returning transaction dictionary
-        :rtype: dict
+    def _depthFirstSearch(self, prefix, items, tidSets, neighbourhood):
+        """Mining the extensions of a prefix depth first. The items that can extend the prefix are the frequent ones
+        neighbouring every item of the prefix, so the candidates are pruned by the neighbourhood of the prefix before
+        their tidsets are intersected.
+
+        :param prefix: the prefix pattern
+        :type prefix: list
+        :param items: positions of the items that can extend the prefix, in increasing order
+        :type items: list
+        :param tidSets: tidset of the prefix extended by each of these items
+        :type tidSets: list
+        :param neighbourhood: bitset of the positions of the items neighbouring every item of the prefix
+        :type neighbourhood: int
         """
-        # to generate all
-        tidList = {}
-        key = list(cList.keys())
-        for i in range(0, len(key)):
-            NeighboursItems = self._getNeighbourItems(key[i])
-            for j in range(i + 1, len(key)):
-                # print(c[key[i]],c[key[j]])
-                if not key[j] in NeighboursItems:
+        for i in range(len(items)):
+            pattern = prefix + [self._items[items[i]]]
+            tidSetX = tidSets[i]
+            self._finalPatterns[pattern[0] if len(pattern) == 1 else tuple(sorted(pattern))] = self._tidList(tidSetX)
+            neighbourhoodX = neighbourhood & self._neighbourBits[items[i]]
+            classItems, classTidSets = [], []
+            for j in range(i + 1, len(items)):
+                if not neighbourhoodX >> items[j] & 1:
                     continue
-                intersectionList = list(set(cList[key[i]]).intersection(set(cList[key[j]])))
-                itemList = []
-                itemList += key[i]
-                itemList += key[j]
-                if len(intersectionList) >= self._minSup:
-                    itemList.sort()
-                    if tuple(itemList) not in tidList:
-                        tidList[tuple(set(itemList))] = intersectionList
-        return tidList
-
-    def _generateSpatialFrequentPatterns(self, tidList):
-        """It will generate the combinations of frequent items from a list of items
-
-        :param tidList :it represents the items with their respective transaction identifiers
-        :type tidList: dictionary
-        :return: returning transaction dictionary
-        :rtype: dict
-        """
-        tidList1 = {}
-        if len(tidList) == 0:
-            print("There are no more candidate sets")
-        else:
-            key = list(tidList.keys())
-            for i in range(0, len(key)):
-                NeighboursItems = self._getNeighbourItems(key[i])
-                for j in range(i + 1, len(key)):
-                    if not key[j] in NeighboursItems:
-                        continue
-                    intersectionList = list(set(tidList[key[i]]).intersection(set(tidList[key[j]])))
-                    itemList = []
-                    if len(intersectionList) >= self._minSup:
-                        itemList += key[i], key[j]
-                        itemList.sort()
-                        tidList1[tuple(itemList)] = intersectionList
-
-        return tidList1
+                tidSetY = tidSetX & tidSets[j]
+                if _support(tidSetY) >= self._minSup:
+                    classItems.append(items[j])
+                    classTidSets.append(tidSetY)
+            if classItems:
+                self._depthFirstSearch(pattern, classItems, classTidSets, neighbourhoodX)
 
     def _getNeighbourItems(self, keySet):
         """
@@ -274,56 +288,19 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
             :return: set of common neighbours 
             :rtype:set
         """
-        itemNeighbours = self._NeighboursMap.keys()
         if isinstance(keySet, str):
-            if self._NeighboursMap.get(keySet) is None:
-                return []
-            itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(keySet))))
-        if isinstance(keySet, tuple):
-            keySet = list(keySet)
-            # print(keySet)
-            for j in range(0, len(keySet)):
-                i = keySet[j]
-                itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(i))))
-        return itemNeighbours
+            keySet = [keySet]
+        return self._neighbourhood.commonNeighbourNames(keySet, listedOnly=True)
 
     def _mapNeighbours(self):
         """
             A function to map items to their Neighbours
         """
-        self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
-            data, items = [], []
-            if self._nFile.empty:
-                print("its empty..")
-            i = self._nFile.columns.values.tolist()
-            if 'item' in i:
-                items = self._nFile['items'].tolist()
-            if 'Neighbours' in i:
-                data = self._nFile['Neighbours'].tolist()
-            for k in range(len(items)):
-                self._NeighboursMap[items[k]] = data[k]
-            # print(self.Database)
-        if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
-                data = _ab._urlopen(self._nFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._NeighboursMap[temp[0]] = temp[1:]
-            else:
-                try:
-                    with open(self._nFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._NeighboursMap[temp[0]] = temp[1:]
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._neighbourhood = _NeighbourhoodGraph.read(self._nFile, self._sep)
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def startMine(self):
         """Frequent pattern mining process will start from here"""
@@ -336,19 +313,11 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
         self._minSup = self._convert(self._minSup)
         self._mapNeighbours()
         self._finalPatterns = {}
-        self._frequentOneItem()
-        #print(len(self._finalPatterns))
-        frequentSet = self._generateSpatialFrequentPatterns(self._finalPatterns)
-        for x, y in frequentSet.items():
-            if x not in self._finalPatterns:
-                self._finalPatterns[x] = y
-        while 1:
-            frequentSet = self._eclatGeneration(frequentSet)
-            for x, y in frequentSet.items():
-                if x not in self._finalPatterns:
-                    self._finalPatterns[x] = y
-            if len(frequentSet) == 0:
-                break
+        self._items, tidSets = self._frequentOneItem()
+        # only the neighbours having a line of their own in the neighbourhood file extend a pattern
+        listed = sum(1 << k for k in range(len(self._items)) if self._items[k] in self._neighbourhood)
+        self._neighbourBits = [bitset & listed for bitset in self._neighbourhood.bitsets(self._items).values()]
+        self._depthFirstSearch([], list(range(len(self._items))), tidSets, -1)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -38,7 +38,10 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 from collections import OrderedDict as _OrderedDict
+import numpy as _np
 
 
 class _spatialFrequentPatterns(_ABC):
@@ -95,7 +98,7 @@ class _spatialFrequentPatterns(_ABC):
     def __init__(self, iFile, nFile, minSup, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param nFile: Neighbourhood name of the input
         :type nFile: str
         :param minSup: The user can specify minSup either in count or proportion of database size.
@@ -107,7 +110,7 @@ class _spatialFrequentPatterns(_ABC):
         :type sep: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._nFile = nFile
         self._sep = sep
         self._minSup = minSup
@@ -27,9 +27,10 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.fuzzyCorrelatedPattern.basic import abstract as _ab
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyList import FuzzyList as _FuzzyList
 
 
-class _FFList:
+class _FFList(_FuzzyList):
     """
      A class represent a Fuzzy List of an element
 
@@ -37,15 +38,17 @@ class _FFList:
     ----------
          item: int
              the item name
+         region: str
+             the fuzzy region of the item
          sumIUtil: float
              the sum of utilities of an fuzzy item in database
          sumRUtil: float
              the sum of resting values of a fuzzy item in database
-         elements: list
-             a list of elements contain tid,Utility and resting values of element in each transaction
+         tids, iUtils, rUtils: numpy.ndarray
+             the tid, Utility and resting value of the element of each transaction
     Methods :
     -------
-        addElement(element)
+        addElement(tid, iUtil, rUtil)
             Method to add an element to this fuzzy list and update the sums at the same time.
 
         printElement(e)
@@ -54,42 +57,8 @@ class _FFList:
     """
 
     def __init__(self, itemName, region):
-        self.item = itemName
+        super().__init__(itemName)
         self.region = region
-        self.sumIUtil = 0.0
-        self.sumRUtil = 0.0
-        self.elements = []
-
-    def addElement(self, element):
-        """
-            A Method that add a new element to FFList
-
-            :param element: an element to be add to FFList
-            :pram type: Element
-        """
-        self.sumIUtil += element.IUtils
-        self.sumRUtil += element.RUtils
-        self.elements.append(element)
-
-
-class Element:
-    """
-        A class represents an Element of a fuzzy list
-
-    Attributes :
-    ----------
-        tid : int
-            keep tact of transaction id
-        IUtils: float
-            the utility of an fuzzy item in the transaction
-        RUtil : float
-            the neighbourhood resting value of an fuzzy item in the transaction
-    """
-
-    def __init__(self, tid, IUtil, RUtil):
-        self.tid = tid
-        self.IUtils = IUtil
-        self.RUtils = RUtil
 
 
 class _Regions:
@@ -239,8 +208,6 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
             Method generate FFI from prefix
         construct(px, py)
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,ratio)
             To Store the patten      
 
@@ -329,29 +296,6 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         else:
             return compare
 
-    def _findElementWithTID(self, uList, tid):
-        """
-        To find element with same tid as given
-        :param uList: fuzzyList
-        :type uList: FFI-List
-        :param tid: transaction id
-        :type tid: int
-        :return: element eith tid as given
-        :rtype: element if exists or None
-        """
-        List = uList.elements
-        first = 0
-        last = len(List) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None
-
     def _convert(self, value):
         """
         To convert the given user specified value
@@ -500,8 +444,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
                     remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(pair.item) is not None:
                     FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
+                    FFListOfItem.addElement(tid, pair.quantity, remainingUtility)
             tid += 1
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFIList, self._minSup)
         self._endTime = _ab._time.time()
@@ -552,12 +495,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
             :rtype :FFI-List
         """
         pxyUL = _FFList(py.item, py.region)
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = Element(ex.tid, min([ex.IUtils, ey.IUtils], key=lambda x: float(x)), ey.RUtils)
-            pxyUL.addElement(eXY)
+        pxyUL.setElements(*px.joinElements(py))
         return pxyUL
 
     def getMemoryUSS(self):
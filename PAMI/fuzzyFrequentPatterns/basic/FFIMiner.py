@@ -20,9 +20,11 @@
 
 
 from PAMI.fuzzyFrequentPatterns.basic import abstract as _ab
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyList import FuzzyList as _FuzzyList
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyDatabase import FuzzyDatabase as _FuzzyDatabase, FuzzyRegions as _FuzzyRegions
 
 
-class _FFList:
+class _FFList(_FuzzyList):
     """
      A class represent a Fuzzy List of an element
 
@@ -34,11 +36,11 @@ class _FFList:
              the sum of utilities of an fuzzy item in database
          sumRUtil: float
              the sum of resting values of a fuzzy item in database
-         elements: list
-             a list of elements contain tid,Utility and resting values of element in each transaction
+         tids, iUtils, rUtils: numpy.ndarray
+             the tid, Utility and resting value of the element of each transaction
     Methods :
     -------
-        addElement(element)
+        addElement(tid, iUtil, rUtil)
             Method to add an element to this fuzzy list and update the sums at the same time.
 
         printElement(e)
@@ -46,97 +48,6 @@ class _FFList:
 
     """
 
-    def __init__(self, itemName):
-        self.item = itemName
-        self.sumIUtil = 0.0
-        self.sumRUtil = 0.0
-        self.elements = []
-
-    def addElement(self, element):
-        """
-            A Method that add a new element to FFList
-
-            :param element: an element to be add to FFList
-            :pram type: Element
-        """
-        self.sumIUtil += element.iUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
-
-    def printElement(self):
-        """
-            A method to print elements
-        """
-        for ele in self.elements:
-            print(ele.tid, ele.iUtils, ele.rUtils)
-
-
-class _Element:
-    """
-        A class represents an Element of a fuzzy list
-
-    Attributes:
-    ----------
-            tid : int
-                keep tact of transaction id
-            iUtils: float
-                the utility of an fuzzy item in the transaction
-            rUtils : float
-                the  resting value of an fuzzy item in the transaction
-    """
-
-    def __init__(self, tid, iUtil, rUtil):
-        self.tid = tid
-        self.iUtils = iUtil
-        self.rUtils = rUtil
-
-
-class _Regions:
-    """
-        A class calculate the regions
-
-    Attributes:
-    ----------
-            low : int
-                low region value
-            middle: int
-                middle region value
-            high : int
-                high region values
-        """
-
-    def __init__(self, quantity, regionsNumber):
-        self.low = 0
-        self.middle = 0
-        self.high = 0
-        if regionsNumber == 3:
-            if 0 < quantity <= 1:
-                self.low = 1
-                self.high = 0
-                self.middle = 0
-            elif 1 < quantity <= 6:
-                self.low = float((6 - quantity) / 5)
-                self.middle = float((quantity - 1) / 5)
-                self.high = 0
-            elif 6 < quantity <= 11:
-                self.low = 0
-                self.middle = float((11 - quantity) / 5)
-                self.high = float((quantity - 6) / 5)
-            else:
-                self.low = 0
-                self.middle = 0
-                self.high = 1
-
-
-class _Pair:
-    """
-        A class to store item and it's quantity together
-    """
-
-    def __init__(self):
-        self.item = 0
-        self.quantity = 0
-
 
 class FFIMiner(_ab._fuzzyFrequentPattenrs):
     """
@@ -162,12 +73,10 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             To record the completion time of the mining process
         itemsCnt: int
             To record the number of fuzzy spatial itemSets generated
-        mapItemsLowSum: map
-            To keep track of low region values of items
-        mapItemsMidSum: map
-            To keep track of middle region values of items
-        mapItemsHighSum: map
-            To keep track of high region values of items
+        regions: FuzzyRegions
+            The fuzzy regions of the quantities, low, middle and high with the breakpoints 1, 6 and 11 by default
+        database: FuzzyDatabase
+            The quantities of the database stored as flat arrays
         mapItemSum: map
             To keep track of sum of Fuzzy Values of items
         mapItemRegions: map
@@ -202,8 +111,6 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             Method generate ffi from prefix
         construct(px, py)
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil)
             To Store the patten
 
@@ -263,22 +170,23 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
     _memoryRSS = float()
     _sep = "\t"
 
-    def __init__(self, iFile, minSup, sep="\t"):
+    def __init__(self, iFile, minSup, sep="\t", regions=None):
+        """
+            :param regions: the fuzzy regions of the quantities, low, middle and high with the breakpoints 1, 6 and 11
+                when None
+            :type regions: FuzzyRegions
+        """
         super().__init__(iFile, minSup, sep)
         self._startTime = 0
         self._endTime = 0
         self._itemsCnt = 0
-        self._mapItemsLowSum = {}
-        self._mapItemsMidSum = {}
-        self._mapItemsHighSum = {}
+        self._regions = regions if regions is not None else _FuzzyRegions()
         self._mapItemSum = {}
         self._mapItemRegions = {}
-        self._regionReferenceMap = {}
         self._joinsCnt = 0
         self._BufferSize = 200
         self._itemSetBuffer = []
-        self._transactionsDB = []
-        self._fuzzyValueDB = []
+        self._database = None
         self._finalPatterns = {}
         self._dbLen = 0
 
@@ -316,143 +224,93 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         return value
 
     def _creatingItemsets(self):
-        self._transactionsDB, self._fuzzyValueDB, self._Database = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._transactionsDB = self._iFile['Transactions'].tolist()
-            if 'fuzzyValues' in i:
-                self._fuzzyValueDB = self._iFile['fuzzyValues'].tolist()
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    line = line.split("\n")[0]
-                    parts = line.split(":")
-                    parts[0] = parts[0].strip()
-                    parts[2] = parts[2].strip()
-                    items = parts[0].split(self._sep)
-                    quantities = parts[2].split(self._sep)
-                    self._transactionsDB.append([x for x in items])
-                    self._fuzzyValueDB.append([x for x in quantities])
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.split("\n")[0]
-                            parts = line.split(":")
-                            parts[0] = parts[0].strip()
-                            parts[2] = parts[2].strip()
-                            items = parts[0].split(self._sep)
-                            quantities = parts[2].split(self._sep)
-                            self._transactionsDB.append([x for x in items])
-                            self._fuzzyValueDB.append([x for x in quantities])
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        """
+            Storing the quantities of the database as flat arrays
+        """
+        if isinstance(self._iFile, _ab._pd.DataFrame) and self._iFile.empty:
+            print("its empty..")
+        try:
+            self._database = _FuzzyDatabase.read(self._iFile, self._sep)
+        except IOError:
+            print("File Not Found")
+            quit()
+
+    def _revisedTransactions(self, memberships, dominant, rank):
+        """
+            Keep in every transaction the first occurrence of each ranked item having a positive membership to its
+            dominant region, ordered by increasing rank
+
+            :param memberships: membership of every position of the database to every region
+            :type memberships: numpy.ndarray
+            :param dominant: the dominant region of every item id
+            :type dominant: numpy.ndarray
+            :param rank: rank of every item id, -1 for the infrequent items
+            :type rank: numpy.ndarray
+            :return: tid, rank, fuzzy value and resting value of the kept positions
+            :rtype: tuple
+        """
+        database = self._database
+        items = database.items
+        tids = database.transactionIds()
+        positions = _ab._np.arange(len(items))
+        values = memberships[positions, dominant[items]]
+        order = _ab._np.lexsort((positions, items, tids))
+        first = _ab._np.ones(len(order), dtype=bool)
+        first[1:] = (tids[order][1:] != tids[order][:-1]) | (items[order][1:] != items[order][:-1])
+        keep = _ab._np.zeros(len(items), dtype=bool)
+        keep[order[first]] = True
+        itemRanks = rank[items]
+        kept = _ab._np.flatnonzero(keep & (itemRanks >= 0) & (values > 0))
+        kept = kept[_ab._np.lexsort((itemRanks[kept], tids[kept]))]
+        tids, ranks, values = tids[kept], itemRanks[kept], values[kept]
+        # resting values added from the last item of every transaction, all transactions at once
+        starts = _ab._np.flatnonzero(_ab._np.diff(tids, prepend=-1))
+        ends = _ab._np.r_[starts[1:], len(tids)]
+        lengths = ends - starts
+        remaining = _ab._np.zeros(len(tids), dtype=_ab._np.float64)
+        totals = _ab._np.zeros(len(starts), dtype=_ab._np.float64)
+        for offset in range(1, int(lengths.max(initial=0)) + 1):
+            active = _ab._np.flatnonzero(lengths >= offset)
+            last = ends[active] - offset
+            remaining[last] = totals[active]
+            totals[active] += values[last]
+        return tids, ranks, values, remaining
 
     def startMine(self):
         """
          fuzzy-Frequent pattern mining process will start from here
         """
-        low = 0
-        mid = 1
-        high = 2
-
         self._startTime = _ab._time.time()
         self._creatingItemsets()
-
-        for j in range(len(self._transactionsDB)):
-            item_list = self._transactionsDB[j]
-            value_list = self._fuzzyValueDB[j]
-            self._dbLen += 1
-
-            for i in range(0, len(item_list)):
-                item = item_list[i]
-                fuzzy_val = value_list[i]
-                if fuzzy_val not in self._regionReferenceMap:
-                    regions = _Regions(float(fuzzy_val), 3)
-                    self._regionReferenceMap[fuzzy_val] = [regions.low, regions.middle, regions.high]
-                else:
-                    if item in self._mapItemsLowSum.keys():
-                        item_total_low = self._mapItemsLowSum[item]
-                        item_total_low += self._regionReferenceMap[fuzzy_val][low]
-                        self._mapItemsLowSum[item] = item_total_low
-                    else:
-                        self._mapItemsLowSum[item] = self._regionReferenceMap[fuzzy_val][low]
-                    if item in self._mapItemsMidSum.keys():
-                        item_total_mid = self._mapItemsMidSum[item]
-                        item_total_mid += self._regionReferenceMap[fuzzy_val][mid]
-                        self._mapItemsMidSum[item] = item_total_mid
-                    else:
-                        self._mapItemsMidSum[item] = self._regionReferenceMap[fuzzy_val][mid]
-                    if item in self._mapItemsHighSum.keys():
-                        item_total_high = self._mapItemsHighSum[item]
-                        item_total_high += self._regionReferenceMap[fuzzy_val][high]
-                        self._mapItemsHighSum[item] = item_total_high
-                    else:
-                        self._mapItemsHighSum[item] = self._regionReferenceMap[fuzzy_val][high]
-        listOfffilist = []
-        mapItemsToFFLIST = {}
+        database = self._database
+        self._dbLen = len(database)
+        memberships = self._regions.memberships(database.quantities)
+        regionSums = database.regionSums(memberships)
+        # the first region of the highest sum, low before middle before high on ties
+        dominant = _ab._np.argmax(regionSums, axis=1)
+        itemSums = regionSums[_ab._np.arange(len(regionSums)), dominant]
         self._minSup = self._convert(self._minSup)
-        keyList = self._mapItemsLowSum.keys()
-        for item1 in keyList:
-            item = item1
-            item_total_low = self._mapItemsLowSum[item]
-            item_total_mid = self._mapItemsMidSum[item]
-            item_total_high = self._mapItemsHighSum[item]
-            if item_total_low >= item_total_mid and item_total_low >= item_total_high:
-                self._mapItemSum[item] = item_total_low
-                self._mapItemRegions[item] = "L"
-            elif item_total_mid >= item_total_low and item_total_mid >= item_total_high:
-                self._mapItemSum[item] = item_total_mid
-                self._mapItemRegions[item] = "M"
-            elif item_total_high >= item_total_low and item_total_high >= item_total_mid:
-                self._mapItemRegions[item] = "H"
-                self._mapItemSum[item] = item_total_high
-            if self._mapItemSum[item] >= self._minSup:
-                fuList = _FFList(item)
-                mapItemsToFFLIST[item] = fuList
-                listOfffilist.append(fuList)
-            else:
-                del self._mapItemSum[item]
-
-        listOfffilist.sort(key=_ab._functools.cmp_to_key(self._compareItems))
-        tid = 0
-        for j in range(len(self._transactionsDB)):
-
-            item_list = list(set(self._transactionsDB[j]).intersection(set(self._mapItemSum.keys())))
-            revisedTransaction = []
-            for i in range(0, len(item_list)):
-                pair = _Pair()
-                pair.item = item_list[i]
-                fuzzy_val = self._fuzzyValueDB[j][self._transactionsDB[j].index(pair.item)]
-
-                if self._mapItemRegions[pair.item] == "L":
-                    pair.quantity = self._regionReferenceMap[str(fuzzy_val)][low]
-                elif self._mapItemRegions[pair.item] == "M":
-                    pair.quantity = self._regionReferenceMap[str(fuzzy_val)][mid]
-                elif self._mapItemRegions[pair.item] == "H":
-                    pair.quantity = self._regionReferenceMap[str(fuzzy_val)][high]
-                if pair.quantity > 0:
-                    revisedTransaction.append(pair)
-            revisedTransaction.sort(key=_ab._functools.cmp_to_key(self._compareItems))
-            for i in range(len(revisedTransaction) - 1, -1, -1):
-                pair = revisedTransaction[i]
-                remainUtil = 0
-                for j in range(len(revisedTransaction) - 1, i, -1):
-                    remainUtil += revisedTransaction[j].quantity
-                remainingUtility = remainUtil
-                if mapItemsToFFLIST.get(pair.item) is not None:
-                    FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = _Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
-            tid += 1
-
-
+        names = database.itemNames
+        present = _ab._np.flatnonzero(_ab._np.bincount(database.items, minlength=len(names)))
+        frequent = []
+        for item in present.tolist():
+            self._mapItemRegions[names[item]] = self._regions.labels[dominant[item]]
+            if itemSums[item] >= self._minSup:
+                self._mapItemSum[names[item]] = float(itemSums[item])
+                frequent.append(item)
+        frequent.sort(key=lambda x: (self._mapItemSum[names[x]], names[x]))
+        rank = _ab._np.full(len(names), -1, dtype=_ab._np.int64)
+        rank[frequent] = _ab._np.arange(len(frequent))
+        tids, ranks, values, remaining = self._revisedTransactions(memberships, dominant, rank)
+        order = _ab._np.argsort(ranks, kind='stable')
+        tids, ranks, values, remaining = tids[order], ranks[order], values[order], remaining[order]
+        bounds = _ab._np.searchsorted(ranks, _ab._np.arange(len(frequent) + 1))
+        listOfffilist = []
+        for r, item in enumerate(frequent):
+            fuList = _FFList(names[item])
+            start, end = bounds[r], bounds[r + 1]
+            fuList.setElements(tids[start:end], values[start:end], remaining[start:end])
+            listOfffilist.append(fuList)
         self._FSFIMining(self._itemSetBuffer, 0, listOfffilist, self._minSup)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -524,38 +382,9 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             :rtype :ffi-List
         """
         _newObject = _FFList(_FFListObject2.item)
-        for Ob1Element in _FFListObject1.elements:
-            Ob2Element = self._findElementWithTID(_FFListObject2, Ob1Element.tid)
-            if Ob2Element is None:
-                continue
-            newElement = _Element(Ob1Element.tid, min([Ob1Element.iUtils, Ob2Element.iUtils], key=lambda x: float(x)),
-                                  Ob2Element.rUtils)
-            _newObject.addElement(newElement)
+        _newObject.setElements(*_FFListObject1.joinElements(_FFListObject2))
         return _newObject
 
-    def _findElementWithTID(self, uList, tid):
-        """
-            To find element with same tid as given
-            :param uList: fuzzyList
-            :type uList: ffi-List
-            :param tid: transaction id
-            :type tid: int
-            :return: element  tid as given
-            :rtype: element if exit or None
-        """
-        List = uList.elements
-        first = 0
-        last = len(List) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None
-
     def _WriteOut(self, prefix, prefixLen, item, sumIUtil):
         """
             To Store the patten
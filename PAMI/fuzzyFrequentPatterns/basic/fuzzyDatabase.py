@@ -0,0 +1,232 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+from urllib.request import urlopen as _urlopen
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+
+
+class FuzzyRegions:
+    """
+        Piecewise-linear membership functions of the fuzzy regions of a quantity, defined by increasing breakpoints
+        c[0] < ... < c[k - 1]. The first region is 1 up to c[0] and falls to 0 at c[1], region i rises from 0 at
+        c[i - 1] to 1 at c[i] and falls to 0 at c[i + 1], the last region is 1 from c[k - 1] on.
+        The memberships of a quantity sum to 1. The default regions are the low, middle and high regions with
+        the breakpoints 1, 6 and 11.
+
+    Attributes:
+    ----------
+        breakpoints: numpy.ndarray
+            the quantity at which each region is 1
+        labels: list
+            the name of each region
+
+    Methods:
+    -------
+        memberships(quantities)
+            return the membership of the quantities to every region
+    """
+
+    def __init__(self, breakpoints=(1, 6, 11), labels=None):
+        """
+            :param breakpoints: increasing quantities at which each region is 1
+            :type breakpoints: list
+            :param labels: the name of each region, L, M and H for three regions and the region numbers otherwise
+            :type labels: list
+        """
+        self.breakpoints = _np.asarray(breakpoints, dtype=_np.float64)
+        if len(self.breakpoints) == 0 or _np.any(_np.diff(self.breakpoints) <= 0):
+            raise ValueError("breakpoints must be a non-empty increasing sequence")
+        if labels is None:
+            labels = ['L', 'M', 'H'] if len(self.breakpoints) == 3 else [str(i) for i in range(len(self.breakpoints))]
+        if len(labels) != len(self.breakpoints):
+            raise ValueError("one label is needed for every breakpoint")
+        self.labels = list(labels)
+
+    def __len__(self):
+        return len(self.breakpoints)
+
+    def memberships(self, quantities):
+        """
+            A method to calculate the membership of every quantity to every region
+
+            :param quantities: the quantities
+            :type quantities: numpy.ndarray
+            :return: array of len(quantities) rows and one column per region
+            :rtype: numpy.ndarray
+        """
+        quantities = _np.asarray(quantities, dtype=_np.float64)
+        breakpoints = self.breakpoints
+        k = len(breakpoints)
+        memberships = _np.zeros((len(quantities), k), dtype=_np.float64)
+        # quantities in (breakpoints[s - 1], breakpoints[s]] are between the regions s - 1 and s
+        segments = _np.searchsorted(breakpoints, quantities, side='left')
+        memberships[segments == 0, 0] = 1.0
+        memberships[segments == k, k - 1] = 1.0
+        inside = _np.flatnonzero((segments > 0) & (segments < k))
+        upper = segments[inside]
+        lower = upper - 1
+        values = quantities[inside]
+        width = breakpoints[upper] - breakpoints[lower]
+        memberships[inside, lower] = (breakpoints[upper] - values) / width
+        memberships[inside, upper] = (values - breakpoints[lower]) / width
+        return memberships
+
+
+def _parseLine(line, sep):
+    """
+    Parse one line of a fuzzy database, items:total:quantities
+
+    :param line: the line
+    :type line: str
+    :param sep: separator of the items and of the quantities
+    :type sep: str
+    :return: items and quantities, or None for an empty line
+    :rtype: tuple
+    """
+    line = line.split("\n")[0]
+    if not line.strip():
+        return None
+    parts = line.split(":")
+    return parts[0].strip().split(sep), [float(x) for x in parts[2].strip().split(sep)]
+
+
+def readFuzzyTransactions(iFile, sep='\t'):
+    """
+    Read the transactions of a fuzzy database one at a time. iFile is a file path, a URL or a DataFrame with the
+    columns Transactions and fuzzyValues.
+
+    :param iFile: the fuzzy database
+    :type iFile: str or pandas.DataFrame
+    :param sep: separator of the items and of the quantities
+    :type sep: str
+    :return: generator of the items and quantities of every transaction
+    :rtype: generator
+    """
+    if isinstance(iFile, _pd.DataFrame):
+        for items, quantities in zip(iFile['Transactions'].tolist(), iFile['fuzzyValues'].tolist()):
+            yield [str(x) for x in items], [float(x) for x in quantities]
+    elif _validators.url(iFile):
+        for line in _urlopen(iFile):
+            transaction = _parseLine(line.decode("utf-8"), sep)
+            if transaction is not None:
+                yield transaction
+    else:
+        with open(iFile, 'r', encoding='utf-8') as f:
+            for line in f:
+                transaction = _parseLine(line, sep)
+                if transaction is not None:
+                    yield transaction
+
+
+class FuzzyDatabase:
+    """
+        A database of quantities stored as flat arrays, items are numbered from 1 in the order of their first
+        occurrence. Transaction i holds the items items[bounds[i]:bounds[i + 1]] with the quantities at the same
+        positions.
+
+    Attributes:
+    ----------
+        items: numpy.ndarray
+            item ids of all transactions, one transaction after the other
+        quantities: numpy.ndarray
+            quantities of the items
+        bounds: numpy.ndarray
+            start position of every transaction, followed by the total number of items
+        itemNames: list
+            name of every item id, itemNames[0] is unused
+
+    Methods:
+    -------
+        read(iFile, sep)
+            Read a fuzzy database
+        transactionIds()
+            return the transaction of every position
+        regionSums(memberships)
+            return the sum of the memberships of every item to every region
+    """
+
+    def __init__(self, items, quantities, bounds, itemNames):
+        self.items = items
+        self.quantities = quantities
+        self.bounds = bounds
+        self.itemNames = itemNames
+
+    def __len__(self):
+        return len(self.bounds) - 1
+
+    @classmethod
+    def fromTransactions(cls, transactions):
+        """
+            Store transactions given one at a time
+
+            :param transactions: items and quantities of every transaction
+            :type transactions: iterable
+            :rtype: FuzzyDatabase
+        """
+        ids = {}
+        itemNames = [None]
+        items = _array('i')
+        quantities = _array('d')
+        bounds = _array('q', [0])
+        for transactionItems, transactionQuantities in transactions:
+            for item in transactionItems:
+                itemId = ids.get(item)
+                if itemId is None:
+                    itemId = ids[item] = len(itemNames)
+                    itemNames.append(item)
+                items.append(itemId)
+            quantities.extend(transactionQuantities)
+            bounds.append(len(items))
+        return cls(_np.array(items, dtype=_np.int32), _np.array(quantities, dtype=_np.float64),
+                   _np.array(bounds, dtype=_np.int64), itemNames)
+
+    @classmethod
+    def read(cls, iFile, sep='\t'):
+        """
+            Read a fuzzy database
+
+            :param iFile: file path, URL, DataFrame or an already read FuzzyDatabase
+            :type iFile: str or pandas.DataFrame or FuzzyDatabase
+            :param sep: separator of the items and of the quantities
+            :type sep: str
+            :rtype: FuzzyDatabase
+        """
+        if isinstance(iFile, FuzzyDatabase):
+            return iFile
+        return cls.fromTransactions(readFuzzyTransactions(iFile, sep))
+
+    def transactionIds(self):
+        """
+            A method to return the transaction of every position
+
+            :rtype: numpy.ndarray
+        """
+        return _np.repeat(_np.arange(len(self), dtype=_np.int64), _np.diff(self.bounds))
+
+    def regionSums(self, memberships):
+        """
+            A method to sum the memberships of the occurrences of every item to every region, in the order of the
+            transactions
+
+            :param memberships: membership of every position to every region
+            :type memberships: numpy.ndarray
+            :return: array of len(itemNames) rows and one column per region
+            :rtype: numpy.ndarray
+        """
+        return _np.stack([_np.bincount(self.items, weights=memberships[:, r], minlength=len(self.itemNames))
+                          for r in range(memberships.shape[1])], axis=1)
@@ -0,0 +1,164 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+import numpy as _np
+
+
+def _sequentialSum(values):
+    """
+    Sum the values one after the other, as the element by element updates of the fuzzy lists do
+
+    :param values: the values
+    :type values: numpy.ndarray
+    :rtype: float
+    """
+    if len(values) == 0:
+        return 0.0
+    return float(_np.cumsum(values)[-1])
+
+
+class FuzzyList:
+    """
+        A fuzzy list stored as three parallel arrays sorted by transaction id: the tids, the fuzzy values (iUtils)
+        and the resting values (rUtils) of the item set in each transaction containing it.
+        The lists of the single items are filled one element at a time with addElement, the lists of the larger
+        item sets are built at once by joining two lists with joinElements and setElements.
+
+    Attributes:
+    ----------
+        item: int or str
+            the item name
+        sumIUtil: float
+            the sum of the fuzzy values
+        sumRUtil: float
+            the sum of the resting values
+        tids: numpy.ndarray
+            the transaction ids, in increasing order
+        iUtils: numpy.ndarray
+            the fuzzy value of the item set in each transaction
+        rUtils: numpy.ndarray
+            the resting value of the item set in each transaction
+
+    Methods:
+    -------
+        addElement(tid, iUtil, rUtil)
+            Append an element and update the sums
+        setElements(tids, iUtils, rUtils)
+            Replace the elements by arrays
+        joinElements(other)
+            Return the elements of the item set extended by the item of other
+        printElement()
+            Print the elements
+    """
+
+    def __init__(self, itemName):
+        self.item = itemName
+        self.sumIUtil = 0.0
+        self.sumRUtil = 0.0
+        self._tids = _np.empty(0, dtype=_np.int64)
+        self._iUtils = _np.empty(0, dtype=_np.float64)
+        self._rUtils = _np.empty(0, dtype=_np.float64)
+        self._pending = None
+
+    def __len__(self):
+        return len(self._tids) + (len(self._pending[0]) if self._pending is not None else 0)
+
+    def addElement(self, tid, iUtil, rUtil):
+        """
+            A method to append the element of a transaction with a larger tid than the previous ones
+
+            :param tid: the transaction id
+            :type tid: int
+            :param iUtil: the fuzzy value in the transaction
+            :type iUtil: float
+            :param rUtil: the resting value in the transaction
+            :type rUtil: float
+        """
+        if self._pending is None:
+            self._pending = (_array('q'), _array('d'), _array('d'))
+        self._pending[0].append(tid)
+        self._pending[1].append(iUtil)
+        self._pending[2].append(rUtil)
+        self.sumIUtil += iUtil
+        self.sumRUtil += rUtil
+
+    def _flush(self):
+        """
+            Move the elements appended by addElement to the arrays
+        """
+        if self._pending is not None:
+            tids, iUtils, rUtils = self._pending
+            self._pending = None
+            self._tids = _np.concatenate((self._tids, _np.array(tids, dtype=_np.int64)))
+            self._iUtils = _np.concatenate((self._iUtils, _np.array(iUtils, dtype=_np.float64)))
+            self._rUtils = _np.concatenate((self._rUtils, _np.array(rUtils, dtype=_np.float64)))
+
+    @property
+    def tids(self):
+        self._flush()
+        return self._tids
+
+    @property
+    def iUtils(self):
+        self._flush()
+        return self._iUtils
+
+    @property
+    def rUtils(self):
+        self._flush()
+        return self._rUtils
+
+    def setElements(self, tids, iUtils, rUtils):
+        """
+            A method to replace the elements of the list and compute its sums
+
+            :param tids: the transaction ids, in increasing order
+            :type tids: numpy.ndarray
+            :param iUtils: the fuzzy values
+            :type iUtils: numpy.ndarray
+            :param rUtils: the resting values
+            :type rUtils: numpy.ndarray
+        """
+        self._pending = None
+        self._tids, self._iUtils, self._rUtils = tids, iUtils, rUtils
+        self.sumIUtil = _sequentialSum(iUtils)
+        self.sumRUtil = _sequentialSum(rUtils)
+
+    def joinElements(self, other):
+        """
+            A method to join the list of an item set px with the list of py, by a vectorised merge of their tids.
+            The fuzzy value of pxy in a transaction is the smallest of the values of px and py, its resting value
+            is the one of py.
+
+            :param other: the fuzzy list of py
+            :type other: FuzzyList
+            :return: tids, iUtils and rUtils of pxy
+            :rtype: tuple
+        """
+        tids, otherTids = self.tids, other.tids
+        positions = _np.searchsorted(otherTids, tids)
+        found = positions < len(otherTids)
+        found[found] = otherTids[positions[found]] == tids[found]
+        x = _np.flatnonzero(found)
+        y = positions[x]
+        return tids[x], _np.minimum(self.iUtils[x], other.iUtils[y]), other.rUtils[y]
+
+    def printElement(self):
+        """
+            A method to print elements
+        """
+        for tid, iUtil, rUtil in zip(self.tids.tolist(), self.iUtils.tolist(), self.rUtils.tolist()):
+            print(tid, iUtil, rUtil)
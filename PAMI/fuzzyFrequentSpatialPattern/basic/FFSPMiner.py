@@ -27,9 +27,11 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.fuzzyFrequentSpatialPattern.basic import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyList import FuzzyList as _FuzzyList
 
 
-class _FFList:
+class _FFList(_FuzzyList):
     """
      A class represent a Fuzzy List of an element
 
@@ -41,11 +43,11 @@ class _FFList:
              the sum of utilities of an fuzzy item in database
          sumRUtil: float
              the sum of resting values of a fuzzy item in database
-         elements: list
-             a list of elements contain tid,Utility and resting values of element in each transaction
+         tids, iUtils, rUtils: numpy.ndarray
+             the tid, Utility and resting value of the element of each transaction
     Methods :
     -------
-        addElement(element)
+        addElement(tid, iUtil, rUtil)
             Method to add an element to this fuzzy list and update the sums at the same time.
 
         printElement(e)
@@ -53,50 +55,6 @@ class _FFList:
 
     """
 
-    def __init__(self, itemName):
-        self.item = itemName
-        self.sumIUtil = 0.0
-        self.sumRUtil = 0.0
-        self.elements = []
-
-    def addElement(self, element):
-        """
-            A Method that add a new element to FFList
-
-            :param element: an element to be add to FFList
-            :pram type: Element
-        """
-        self.sumIUtil += element.iUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
-
-    def printElement(self):
-        """
-            A Method to Print elements in the FFList
-        """
-        for ele in self.elements:
-            print(ele.tid, ele.iUtils, ele.rUtils)
-
-
-class _Element:
-    """
-        A class represents an Element of a fuzzy list
-
-    Attributes :
-    ----------
-        tid : int
-            keep tact of transaction id
-        iUtils: float
-            the utility of an fuzzy item in the transaction
-        rUtils : float
-            the neighbourhood resting value of an fuzzy item in the transaction
-    """
-
-    def __init__(self, tid, iUtil, rUtil):
-        self.tid = tid
-        self.iUtils = iUtil
-        self.rUtils = rUtil
-
 
 class _Regions:
     """
@@ -209,8 +167,6 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
         Intersection(neighbourX,neighbourY)
             Return common neighbours of 2 itemSet Neighbours
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,period)
             To Store the patten
     
@@ -353,47 +309,11 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                     quit()
 
     def _mapNeighbours(self):
-        self._mapItemNeighbours = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
-            data, items = [], []
-            if self._nFile.empty:
-                print("its empty..")
-            i = self._nFile.columns.values.tolist()
-            if 'items' in i:
-                items = self._nFile['items'].tolist()
-            if 'Neighbours' in i:
-                data = self._nFile['Neighbours'].tolist()
-            for k in range(len(items)):
-                self._mapItemNeighbours[items[k]] = data[k]
-
-        if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
-                data = _ab._urlopen(self._nFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    line = line.split("\n")[0]
-                    parts = [i.rstrip() for i in line.split(self._sep)]
-                    parts = [x for x in parts]
-                    item = parts[0]
-                    neigh1 = []
-                    for i in range(1, len(parts)):
-                        neigh1.append(parts[i])
-                    self._mapItemNeighbours[item] = neigh1
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.split("\n")[0]
-                            parts = [i.rstrip() for i in line.split(self._sep)]
-                            parts = [x for x in parts]
-                            item = parts[0]
-                            neigh1 = []
-                            for i in range(1, len(parts)):
-                                neigh1.append(parts[i])
-                            self._mapItemNeighbours[item] = neigh1
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._mapItemNeighbours = _NeighbourhoodGraph.read(self._nFile, self._sep).neighbourSets()
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def startMine(self):
         """ Frequent pattern mining process will start from here
@@ -480,8 +400,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                 remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(pair.item) is not None:
                     FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = _Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
+                    FFListOfItem.addElement(tid, pair.quantity, remainingUtility)
             tid += 1
         itemNeighbours = list(self._mapItemNeighbours.keys())
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFList, self._minSup, itemNeighbours)
@@ -577,37 +496,9 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
             :rtype :FFI-List
         """
         pxyUL = _FFList(py.item)
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = _Element(ex.tid, min([ex.iUtils, ey.iUtils], key=lambda x: float(x)), ey.rUtils)
-            pxyUL.addElement(eXY)
+        pxyUL.setElements(*px.joinElements(py))
         return pxyUL
 
-    def _findElementWithTID(self, uList, tid):
-        """
-            To find element with same tid as given
-            :param uList:fuzzyList
-            :type uList:FFI-List
-            :param tid:transaction id
-            :type tid:int
-            :return:element tid as given
-            :rtype: element if exist or None
-        """
-        List = uList.elements
-        first = 0
-        last = len(List) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None
-
     def _WriteOut(self, prefix, prefixLen, item, sumIUtil):
         """
             To Store the patten
@@ -27,9 +27,10 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.fuzzyPeriodicFrequentPattern.basic import abstract as _ab
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyList import FuzzyList as _FuzzyList
 
 
-class _FFList:
+class _FFList(_FuzzyList):
     """
         A class represent a Fuzzy List of an element
 
@@ -37,18 +38,20 @@ class _FFList:
     ----------
         item: int
             the item name
-        sumLUtil: float
+        sumIUtil: float
             the sum of utilities of an fuzzy item in database
         sumRUtil: float
             the sum of resting values of a fuzzy item in database
-        elements: list
-            list of elements contain tid,Utility and resting values of element in each transaction
+        tids, iUtils, rUtils: numpy.ndarray
+            the tid, Utility and resting value of the element of each transaction
         maxPeriod: int
             it represent the max period of a item
+        lastTid: int
+            the tid of the last element added
 
     Methods:
     -------
-        addElement(element)
+        addElement(tid, lUtil, rUtil, period)
             Method to add an element to this fuzzy list and update the sums at the same time.
 
         printElement(e)
@@ -57,53 +60,42 @@ class _FFList:
     """
 
     def __init__(self, itemName):
-        self.item = itemName
-        self.sumLUtil = 0.0
-        self.sumRUtil = 0.0
-        self.elements = []
+        super().__init__(itemName)
         self.maxPeriod = 0
+        self.lastTid = None
 
-    def addElement(self, element):
+    def addElement(self, tid, lUtil, rUtil, period):
         """
             A Method that add a new element to FFList
 
-            :param element: an element to be add to FFList
-            :pram type: Element
+            :param tid: the transaction id
+            :type tid: int
+            :param lUtil: the utility of the fuzzy item in the transaction
+            :type lUtil: float
+            :param rUtil: the resting value of the fuzzy item in the transaction
+            :type rUtil: float
+            :param period: the period of the element
+            :type period: int
         """
-        self.sumLUtil += element.lUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
-        self.maxPeriod = max(self.maxPeriod, element.period)
+        super().addElement(tid, lUtil, rUtil)
+        self.maxPeriod = max(self.maxPeriod, period)
+        self.lastTid = tid
 
-    def printElement(self):
+    def setElements(self, tids, lUtils, rUtils):
         """
-            A Method to Print elements in the FFList
+            A Method that set the elements of a joined FFList, the period of an element being the difference
+            with the tid of the previous one
+
+            :param tids: the transaction ids
+            :type tids: numpy.ndarray
+            :param lUtils: the utilities of the fuzzy item set
+            :type lUtils: numpy.ndarray
+            :param rUtils: the resting values of the fuzzy item set
+            :type rUtils: numpy.ndarray
         """
-        for ele in self.elements:
-            print(ele.tid, ele.lUtils, ele.rUtils, ele.period)
-
-
-class _Element:
-    """
-        A class represents an Element of a fuzzy list
-
-        Attributes:
-        ----------
-        tid : int
-            keep tact of transaction id
-        lUtils: float
-            the utility of an fuzzy item in the transaction
-        rUtils : float
-            the resting value of an fuzzy item in the transaction
-        period: int
-            represent the period of the element
-    """
-
-    def __init__(self, tid, iUtil, rUtil, period):
-        self.tid = tid
-        self.lUtils = iUtil
-        self.rUtils = rUtil
-        self.period = period
+        super().setElements(tids, lUtils, rUtils)
+        self.maxPeriod = max(0, int(_ab._np.diff(tids, prepend=0).max())) if len(tids) else 0
+        self.lastTid = int(tids[-1]) if len(tids) else None
 
 
 class _Regions:
@@ -222,8 +214,6 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
             Method generate FFI from prefix
         construct(px, py)
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
-        findElementWithTID(UList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,period)
             To Store the patten
     
@@ -477,16 +467,14 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
                     remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(tuple([pair.item, itemsToRegion[pair.item]])) is not None:
                     FFListOfItem = mapItemsToFFLIST[tuple([pair.item, itemsToRegion[pair.item]])]
-                    if len(FFListOfItem.elements) == 0:
-                        element = _Element(tid, pair.quantity, remainingUtility, 0)
+                    if len(FFListOfItem) == 0:
+                        FFListOfItem.addElement(tid, pair.quantity, remainingUtility, 0)
                     else:
                         if lastTIDs[pair.item] == tid:
-                            element = _Element(tid, pair.quantity, remainingUtility, maxTID - tid)
+                            FFListOfItem.addElement(tid, pair.quantity, remainingUtility, maxTID - tid)
                         else:
-                            lastTid = FFListOfItem.elements[-1].tid
-                            curPer = tid - lastTid
-                            element = _Element(tid, pair.quantity, remainingUtility, curPer)
-                    FFListOfItem.addElement(element)
+                            curPer = tid - FFListOfItem.lastTid
+                            FFListOfItem.addElement(tid, pair.quantity, remainingUtility, curPer)
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFIList, self._minSup)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -510,8 +498,8 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         """
         for i in range(0, len(fsFim)):
             X = fsFim[i]
-            if X.sumLUtil >= minSup and X.maxPeriod <= self._maxPer:
-                self._WriteOut(prefix, prefixLen, X.item, X.sumLUtil, X.maxPeriod)
+            if X.sumIUtil >= minSup and X.maxPeriod <= self._maxPer:
+                self._WriteOut(prefix, prefixLen, X.item, X.sumIUtil, X.maxPeriod)
             if X.sumRUtil >= minSup:
                 exULs = []
                 for j in range(i + 1, len(fsFim)):
@@ -559,39 +547,9 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
             :rtype :FFI-List
         """
         pxyUL = _FFList(py.item)
-        prev = 0
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = _Element(ex.tid, min([ex.lUtils, ey.lUtils], key=lambda x: float(x)), ey.rUtils, ex.tid - prev)
-            pxyUL.addElement(eXY)
-            prev = ex.tid
+        pxyUL.setElements(*px.joinElements(py))
         return pxyUL
 
-    def _findElementWithTID(self, UList, tid):
-        """
-            To find element with same tid as given
-            :param UList: fuzzy list
-            :type UList:FFI-List
-            :param tid:transaction id
-            :type tid:int
-            :return:element eith tid as given
-            :rtype: element if exist or None
-        """
-        List = UList.elements
-        first = 0
-        last = len(List) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None
-
     def _WriteOut(self, prefix, prefixLen, item, sumLUtil, period):
         """
             To Store the patten
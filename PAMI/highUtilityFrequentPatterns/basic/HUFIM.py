@@ -27,135 +27,16 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.highUtilityFrequentPatterns.basic import abstract as _ab
+from PAMI.highUtilityPatterns.basic.parallelEFIM import mineBranches as _mineBranches
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction as _Transaction
+from PAMI.highUtilityPatterns.basic.projectedTransaction import projectDatabase as _projectDatabase
+from PAMI.highUtilityPatterns.basic.projectedTransaction import sortKey as _sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import itemUtilities as _itemUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import localUtilities as _localUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import subtreeUtilities as _subtreeUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import upperBounds as _upperBounds
 
 
-class _Transaction:
-    """
-        A class to store Transaction of a database
-
-    Attributes:
-    ----------
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilities of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-        support:
-            maintains the support of the transaction
-    Methods:
-    --------
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing starting from offsetE until the end
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items which are having low values when compared with minUtil
-        insertionSort():
-            A method to sort all items in the transaction
-        getSupport():
-            returns the support of the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-    support = 1
-
-    def __init__(self, items, utilities, transactionUtility):
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-        self.support = 1
-
-    def projectTransaction(self, offsetE):
-        """
-            A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        Parameters:
-        ----------
-            :param offsetE: an offset over the original transaction for projecting the transaction
-            :type offsetE: int
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        new_transaction.support = self.support
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self):
-        """
-            A method to return items in transaction
-        """
-        return self.items
-
-    def getUtilities(self):
-        """
-            A method to return utilities in transaction
-        """
-        return self.utilities
-
-    def getLastPosition(self):
-        """
-            A method to return last position in a transaction
-        """
-
-        return len(self.items) - 1
-
-    def getSupport(self):
-        """
-            A method to return support in a transaction
-        """
-
-        return self.support
-
-    def removeUnpromisingItems(self, oldNamesToNewNames):
-        """
-            A method to remove items which are not present in the map passed to the function
-
-            Parameters:
-            -----------
-            :param oldNamesToNewNames: A map represent old names to new names
-            :type oldNamesToNewNames: map
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self):
-        """
-            A method to sort items in order
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-        
-
 class _Dataset:
     """
         A class represent the list of transactions in this dataset
@@ -301,6 +182,8 @@ class HUFIM(_ab._utilityPatterns):
             The user given minUtil value
         minSup : float
             The user given minSup value
+        numWorkers: int
+            Number of processes mining the first level branches in parallel, 1 mines them serially
         highUtilityFrequentItemSets: map
             set of high utility frequent itemSets
         candidateCount: int
@@ -348,14 +231,10 @@ class HUFIM(_ab._utilityPatterns):
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a relative-high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
         sortDatabase(self, transactions)
               A Method to sort transaction
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to calculate local utility values for single itemSets
 
@@ -375,6 +254,8 @@ class HUFIM(_ab._utilityPatterns):
 
         obj=alg.HUFIM("input.txt", 35, 20)
 
+        # or obj=alg.HUFIM("input.txt", 35, 20, numWorkers=4) to mine the branches in 4 processes
+
         obj.startMine()
 
         Patterns = obj.getPatterns()
@@ -426,9 +307,11 @@ class HUFIM(_ab._utilityPatterns):
     _minSup = 0
     _memoryUSS = float()
     _memoryRSS = float()
+    _numWorkers = 1
 
-    def __init__(self, iFile, minUtil, minSup, sep="\t"):
+    def __init__(self, iFile, minUtil, minSup, sep="\t", numWorkers=1):
         super().__init__(iFile, minUtil, minSup, sep)
+        self._numWorkers = numWorkers
 
     def _convert(self, value):
         """
@@ -454,8 +337,6 @@ class HUFIM(_ab._utilityPatterns):
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
         self._dataset = _Dataset(self._iFile, self._sep)
-        self._singleItemSetsSupport = _ab._defaultdict(int)
-        self._singleItemSetsUtility = _ab._defaultdict(int)
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         self._minUtil = int(self._minUtil)
         self._minSup = self._convert(self._minSup)
@@ -463,7 +344,7 @@ class HUFIM(_ab._utilityPatterns):
         #print("given minimum support is", self.minSup)
         #print("given minimum utility is", self.minUtil)
         itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
+        for key in range(1, len(self._utilityBinArrayLU)):
             if self._utilityBinArrayLU[key] >= self._minUtil and self._singleItemSetsSupport[key] >= self._minSup:
                 itemsToKeep.append(key)
         # sorting items in decreasing order of utilities
@@ -499,7 +380,12 @@ class HUFIM(_ab._utilityPatterns):
         for item in piItems:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
-        self._backTrackingHUFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._dataset.transactions = _Transaction.pack(self._dataset.getTransactions())
+        if self._numWorkers > 1:
+            _mineBranches(self, '_backTrackingHUFIM', self._dataset.getTransactions(), itemsToKeep, itemsToExplore,
+                          self._numWorkers)
+        else:
+            self._backTrackingHUFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -508,7 +394,7 @@ class HUFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility Frequent patterns were generated successfully using HUFIM algorithm")
 
-    def _backTrackingHUFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def _backTrackingHUFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, branches=None):
         """
             A method to mine the HUFIs Recursively
 
@@ -522,72 +408,21 @@ class HUFIM(_ab._utilityPatterns):
             :type itemsToExplore: list
             :param prefixLength: current prefixLength
             :type prefixLength: int
+            :param branches: positions of itemsToExplore to mine, all of them when None
+            :type branches: list
         """
         # print("###############")
         # print("P is", [self.dataset.intToStr.get(x) for x in self.temp[:prefixLength]])
         # print("items to explore", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y  in itemsToExplore]])
         # print("items to keep", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y in itemsToKeep]])
         # print("--------------")
-        self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
+        if branches is None:
+            self._candidateCount += len(itemsToExplore)
+            branches = range(len(itemsToExplore))
+        for idx in branches:
+            e = itemsToExplore[idx]
             # print("exploring item", self.dataset.intToStr.get(self.newNamesToOldNames[e]))
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
+            transactionsPe, utilityPe, supportPe = _projectDatabase(transactionsOfP, e)
             # print("support is", supportPe)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if (utilityPe >= self._minUtil) and (supportPe >= self._minSup):
@@ -620,20 +455,8 @@ class HUFIM(_ab._utilityPatterns):
             :type itemsToKeep: list or Dataset
 
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+        self._utilityBinArrayLU, self._utilityBinArraySU = _upperBounds(transactionsPe, itemsToKeep,
+                                                                        len(self._newNamesToOldNames))
 
     def _output(self, tempPosition, utility, support):
         """
@@ -656,32 +479,6 @@ class HUFIM(_ab._utilityPatterns):
                 s1 += " "
         self._finalPatterns[s1] = str(utility) + ":" + str(support)
 
-    def _isEqual(self, transaction1, transaction2):
-        """
-         A method to Check if two transaction are identical
-
-         Attributes:
-         ----------
-         :param  transaction1: the first transaction
-         :type  transaction1: Transaction
-         :param  transaction2:    the second transaction
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each items using a utility-bin array
@@ -691,18 +488,7 @@ class HUFIM(_ab._utilityPatterns):
         :param dataset: the transaction database
         :type dataset: Dataset
         """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                currentUtility = transaction.getUtilities()[i]
-                sumSU += currentUtility
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
+        self._utilityBinArraySU = _subtreeUtilities(dataset.getTransactions(), len(self._newNamesToOldNames))
 
     def _sortDatabase(self, transactions):
         """
@@ -715,50 +501,8 @@ class HUFIM(_ab._utilityPatterns):
             :return: sorted transactions
             :rtype: Transactions or list
         """
-        compareItems = _ab._functools.cmp_to_key(self._sortTransaction)
-        transactions.sort(key=compareItems)
+        transactions.sort(key=_sortKey)
 
-    def _sortTransaction(self, trans1, trans2):
-        """
-            A Method to sort transaction
-
-            Attributes:
-            ----------
-            :param trans1: the first transaction 
-            :type trans1: Transaction 
-            :param trans2:the second transaction 
-            :type trans2: Transaction
-            :return: sorted transaction
-            :rtype:    Transaction
-        """
-        transItemsX = trans1.getItems()
-        transItemsY = trans2.getItems()
-        pos1 = len(transItemsX) - 1
-        pos2 = len(transItemsY) - 1
-        if len(transItemsX) < len(transItemsY):
-            while pos1 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(transItemsX) > len(transItemsY):
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
 
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
@@ -769,14 +513,9 @@ class HUFIM(_ab._utilityPatterns):
             :type dataset: database
 
         """
-        for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                self._singleItemSetsSupport[item] += 1
-                self._singleItemSetsUtility[item] += transaction.getUtilities()[idx]
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility
-                else:
-                    self._utilityBinArrayLU[item] = transaction.transactionUtility
+        self._utilityBinArrayLU = _localUtilities(dataset.getTransactions(), dataset.getMaxItem())
+        self._singleItemSetsSupport, self._singleItemSetsUtility = _itemUtilities(dataset.getTransactions(),
+                                                                                  dataset.getMaxItem())
 
     def getPatternsAsDataFrame(self):
         """Storing final patterns in a dataframe
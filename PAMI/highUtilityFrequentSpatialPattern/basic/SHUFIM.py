@@ -1,140 +1,10 @@
 from PAMI.highUtilityFrequentSpatialPattern.basic import abstract as _ab
-from functools import cmp_to_key as _comToKey
-
-class _Transaction:
-    """
-        A class to store Transaction of a database
-
-    Attributes:
-    ----------
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilites of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        pmus: list
-            represent the pmu (probable maximum utility) of each element in the transaction
-        prefixutility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-        support:
-            maintains the support of the transaction
-    Methods:
-    --------
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getPmus():
-            return pmus in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items with low Utility than minUtil
-        insertionSort():
-            A method to sort all items in the transaction
-        getSupport():
-            returns the support of the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-    support = 1
-    
-    def __init__(self, items, utilities, transactionUtility, pmus=None):
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-        if pmus is not None:
-            self.pmus = pmus
-        self.support = 1
-
-    def projectTransaction(self, offsetE):
-        """
-            A method to create new Transaction from existing till offsetE
-
-        Parameters:
-        ----------
-            :param offsetE: an offset over the original transaction for projecting the transaction
-            :type offsetE: int
-        """
-        newTransaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        newTransaction.prefixUtility = self.prefixUtility + utilityE
-        newTransaction.transactionUtility = self.transactionUtility - utilityE
-        newTransaction.support = self.support
-        for i in range(self.offset, offsetE):
-            newTransaction.transactionUtility -= self.utilities[i]
-        newTransaction.offset = offsetE + 1
-        return newTransaction
-
-    def getItems(self):
-        """
-            A method to return items in transaction
-        """
-        return self.items
-
-    def getPmus(self):
-        """
-            A method to return pmus in transaction
-        """
-        return self.pmus
-
-    def getUtilities(self):
-        """
-            A method to return utilities in transaction
-        """
-        return self.utilities
-
-    # get the last position in this transaction
-    def getLastPosition(self):
-        """
-            A method to return last position in a transaction
-        """
-        return len(self.items) - 1
-
-    def getSupport(self):
-        """
-            A method to return support of a transaction (number of transactions in the original database having the items present in this transactions)
-        """
-        return self.support
-
-    def removeUnpromisingItems(self, oldNamesToNewNames):
-        """
-            A method to remove items with low Utility than minUtil
-            :param oldNamesToNewNames: A map represent old namses to new names
-            :type oldNamesToNewNames: map
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self):
-        """
-            A method to sort items in order
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction as _Transaction
+from PAMI.highUtilityPatterns.basic.projectedTransaction import projectDatabase as _projectDatabase
+from PAMI.highUtilityPatterns.basic.projectedTransaction import sortKey as _sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import itemUtilities as _itemUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import localUtilities as _localUtilities
 
 class _Dataset:
     """
@@ -291,16 +161,10 @@ class SHUFIM(_ab._utilityPatterns):
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
         sortDatabase(self, transactions)
               A Method to sort transaction in the order of PMU
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to scan the database using utility bin array to calculate the pmus
 
@@ -374,28 +238,16 @@ class SHUFIM(_ab._utilityPatterns):
         self._patternCount = 0
         self._finalPatterns = {}
         self._dataset = _Dataset(self._iFile, self._sep)
-        self._singleItemSetsSupport = _ab._defaultdict(int)
-        self._singleItemSetsUtility = _ab._defaultdict(int)
         self._minUtil = int(self._minUtil)
         self._minSup = int((self._minSup * len(self._dataset.getTransactions())) / 100)
         #print("######################################")
         #print("given minimum support is", self.minSup)
         #print("given minimum utility is", self.minUtil)
-        with open(self._nFile, 'r') as o:
-            lines = o.readlines()
-            for line in lines:
-                line = line.split("\n")[0]
-                line_split = line.split(self._sep)
-                item = self._dataset.strToint.get(line_split[0])
-                lst = []
-                for i in range(1, len(line_split)):
-                    lst.append(self._dataset.strToint.get(line_split[i]))
-                self._Neighbours[item] = lst
-        o.close()
+        self._Neighbours = _NeighbourhoodGraph.read(self._nFile, self._sep).neighbourSets(self._dataset.strToint)
         InitialMemory = _ab._psutil.virtual_memory()[3]
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         _itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
+        for key in range(1, len(self._utilityBinArrayLU)):
             if self._utilityBinArrayLU[key] >= self._minUtil and self._singleItemSetsSupport[key] >= self._minSup:
                 _itemsToKeep.append(key)
         # sorting items in decreasing order of their utilities
@@ -434,6 +286,7 @@ class SHUFIM(_ab._utilityPatterns):
         _commonitems = []
         for i in range(self._dataset.maxItem):
             _commonitems.append(i)
+        self._dataset.transactions = _Transaction.pack(self._dataset.getTransactions())
         self._backtrackingEFIM(self._dataset.getTransactions(), _itemsToKeep, _itemsToExplore, 0)
         _finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (_finalMemory - InitialMemory) / 10000
@@ -465,63 +318,7 @@ class SHUFIM(_ab._utilityPatterns):
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             initialMemory = _ab._psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
+            transactionsPe, utilityPe, supportPe = _projectDatabase(transactionsOfP, e)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil and supportPe >= self._minSup:
                 self._output(prefixLength, utilityPe, supportPe)
@@ -543,8 +340,8 @@ class SHUFIM(_ab._utilityPatterns):
                 self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
-            if self.maxMemory < memory:
-                self.maxMemory = memory
+            if self._maxMemory < memory:
+                self._maxMemory = memory
 
     def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
         """
@@ -565,7 +362,7 @@ class SHUFIM(_ab._utilityPatterns):
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
+            length = transaction.end
             i = length - 1
             while i >= transaction.offset:
                 item = transaction.getItems()[i]
@@ -592,16 +389,11 @@ class SHUFIM(_ab._utilityPatterns):
                 :type prefixLength:int
 
         """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
+        neighbourSets = [self._Neighbours.get(self._temp[i]) for i in range(prefixLength + 1)]
+        if any(neighbours is None for neighbours in neighbourSets):
+            return []
+        intersection = set.intersection(*sorted(neighbourSets, key=len))
+        return [self._oldNamesToNewNames[item] for item in intersection if item in self._oldNamesToNewNames]
     
     def _output(self, tempPosition, utility, support):
         """
@@ -624,47 +416,6 @@ class SHUFIM(_ab._utilityPatterns):
                 s1 += " "
         self._finalPatterns[s1] = str(utility) + ":" + str(support)
 
-    def _isEqual(self, transaction1, transaction2):
-        """
-         A method to Check if two transaction are identical
-
-         Attributes:
-         ----------
-         :param  transaction1: the first transaction
-         :type  transaction1: Transaction
-         :param  transaction2:   the second transaction
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def _intersection(self, lst1, lst2):
-        """
-            A method that return the intersection of 2 list
-            :param  lst1: items neighbour to item1
-            :type lst1: list
-            :param lst2: items neighbour to item2
-            :type lst2: list
-            :return :intersection of two lists
-            :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each items using a utility-bin array
@@ -702,50 +453,8 @@ class SHUFIM(_ab._utilityPatterns):
             :return: sorted transaction
             :rtype: Transaction
         """
-        cmp_items = _comToKey(self._sortTransaction)
-        transactions.sort(key=cmp_items)
+        transactions.sort(key=_sortKey)
 
-    def _sortTransaction(self, trans1, trans2):
-        """
-            A Method to sort transaction in the order of PMU
-
-            Attributes:
-            ----------
-            :param trans1: the first transaction 
-            :type trans1: Transaction 
-            :param trans2:the second transaction 
-            :type trans2: Transaction
-            :return: sorted transaction
-            :rtype:    Transaction
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
 
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
@@ -756,14 +465,9 @@ class SHUFIM(_ab._utilityPatterns):
             :type dataset: database
 
         """
-        for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                self._singleItemSetsSupport[item] += 1
-                self._singleItemSetsUtility[item] += transaction.getUtilities()[idx]
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.getPmus()[idx]
-                else:
-                    self._utilityBinArrayLU[item] = transaction.getPmus()[idx]
+        self._utilityBinArrayLU = _localUtilities(dataset.getTransactions(), dataset.getMaxItem(), pmus=True).tolist()
+        support, utility = _itemUtilities(dataset.getTransactions(), dataset.getMaxItem())
+        self._singleItemSetsSupport, self._singleItemSetsUtility = support.tolist(), utility.tolist()
 
     def getPatternsAsDataFrame(self):
         """Storing final patterns in a dataframe
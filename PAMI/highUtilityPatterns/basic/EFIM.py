@@ -16,121 +16,16 @@
 
 
 from PAMI.highUtilityPatterns.basic import abstract as _ab
+from PAMI.highUtilityPatterns.basic.parallelEFIM import mineBranches as _mineBranches
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction as _Transaction
+from PAMI.highUtilityPatterns.basic.projectedTransaction import projectDatabase as _projectDatabase
+from PAMI.highUtilityPatterns.basic.projectedTransaction import sortKey as _sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import localUtilities as _localUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import subtreeUtilities as _subtreeUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import upperBounds as _upperBounds
+from PAMI.highUtilityPatterns.basic.utilityDatabase import UtilityDatabase as _UtilityDatabase
 
 
-class _Transaction:
-    """
-        A class to store Transaction of a database
-
-    Attributes:
-    ----------
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilities of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-    Methods:
-    --------
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing starting from offsetE until the end
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items which are having low values when compared with minUtil
-        insertionSort():
-            A method to sort all items in the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-
-    def __init__(self, items, utilities, transactionUtility):
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-
-    def projectTransaction(self, offsetE):
-        """
-            A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        Parameters:
-        ----------
-            :param offsetE: an offset over the original transaction for projecting the transaction
-            :type offsetE: int
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self):
-        """
-            A method to return items in transaction
-        """
-        return self.items
-
-    def getUtilities(self):
-        """
-            A method to return utilities in transaction
-        """
-        return self.utilities
-
-    def getLastPosition(self):
-        """
-            A method to return last position in a transaction
-        """
-
-        return len(self.items) - 1
-
-    def removeUnpromisingItems(self, oldNamesToNewNames):
-        """
-            A method to remove items which are not present in the map passed to the function
-
-            Parameters:
-            -----------
-            :param oldNamesToNewNames: A map represent old names to new names
-            :type oldNamesToNewNames: map
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self):
-        """
-            A method to sort items in order
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-        
-
 class _Dataset:
     """
         A class represent the list of transactions in this dataset
@@ -144,8 +39,8 @@ class _Dataset:
         
     methods:
     --------
-        createTransaction(line):
-            Create a transaction object from a line from the input file
+        createItemsets(datasetPath):
+            Read the transactions of the dataset
         getMaxItem():
             return Maximum Item
         getTransactions():
@@ -155,88 +50,36 @@ class _Dataset:
     transactions = []
     maxItem = 0
     
-    def __init__(self,datasetPath, sep):
+    def __init__(self,datasetPath, sep, cache=False):
         self.strToInt = {}
         self.intToStr = {}
         self.transactions = []
         self.maxItem = 0
         self.cnt = 1
         self.sep = sep
-        self.createItemsets(datasetPath)
-
-    def createItemsets(self, datasetPath):
-        self.Database = []
-        if isinstance(datasetPath, _ab._pd.DataFrame):
-            utilities, data, transactionUtility = [], [], []
-            if datasetPath.empty:
-                print("its empty..")
-            i = datasetPath.columns.values.tolist()
-            if 'Transactions' in i:
-                data = datasetPath['Transactions'].tolist()
-            if 'Utilities' in i:
-                utilities = datasetPath['Utilities'].tolist()
-            if 'TransactionUtility' in i:
-                transactionUtility = datasetPath['TransactionUtility'].tolist()
-            self.transactions.append(self.createTransaction(data, utilities, transactionUtility))
-        if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
-                data = _ab._urlopen(datasetPath)
-                for line in data:
-                    line = line.decode("utf-8")
-                    trans_list = line.strip().split(':')
-                    transactionUtility = int(trans_list[1])
-                    itemsString = trans_list[0].strip().split(self.sep)
-                    itemsString = [x for x in itemsString if x]
-                    utilityString = trans_list[2].strip().split(self.sep)
-                    utilityString = [x for x in utilityString if x]
-                    self.transactions.append(self.createTransaction(itemsString, utilityString, transactionUtility))
-            else:
-                try:
-                    with open(datasetPath, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            trans_list = line.strip().split(':')
-                            transactionUtility = int(trans_list[1])
-                            itemsString = trans_list[0].strip().split(self.sep)
-                            itemsString = [x for x in itemsString if x]
-                            utilityString = trans_list[2].strip().split(self.sep)
-                            utilityString = [x for x in utilityString if x]
-                            self.transactions.append(
-                                self.createTransaction(itemsString, utilityString, transactionUtility))
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
-
-    def createTransaction(self, itemsString, utilityString, transactionUtility):
-        """
-            A method to create Transaction from dataset given
-            
-            Attributes:
-            -----------
-            :param line: represent a single line of database
-            :type line: string
-            :return : Transaction
-            :rtype: Transaction
-        """
-        '''trans_list = line.strip().split(':')
-        transactionUtility = int(trans_list[1])
-        itemsString = trans_list[0].strip().split(self.sep)
-        itemsString = [x for x in itemsString if x]
-        utilityString = trans_list[2].strip().split(self.sep)
-        utilityString = [x for x in utilityString if x]'''
-        items = []
-        utilities = []
-        for idx, item in enumerate(itemsString):
-            if self.strToInt.get(item) is None:
-                self.strToInt[item] = self.cnt
-                self.intToStr[self.cnt] = item
-                self.cnt += 1
-            item_int = self.strToInt.get(item)
-            if item_int > self.maxItem:
-                self.maxItem = item_int
-            items.append(item_int)
-            utilities.append(int(utilityString[idx]))
-        return _Transaction(items, utilities, transactionUtility)
+        self.createItemsets(datasetPath, cache)
+
+    def createItemsets(self, datasetPath, cache=False):
+        """
+            A method to read the transactions of the dataset, the items being numbered from 1 in the order of their
+            first occurrence
+
+            :param datasetPath: file path, URL, DataFrame or UtilityDatabase of the dataset
+            :type datasetPath: str or pandas.DataFrame or UtilityDatabase
+            :param cache: read a local file through its binary sidecar file
+            :type cache: bool
+        """
+        try:
+            database = _UtilityDatabase.read(datasetPath, self.sep, cache)
+        except IOError:
+            print("File Not Found")
+            quit()
+        self.strToInt = database.getItemIds()
+        self.intToStr = {itemId: name for name, itemId in self.strToInt.items()}
+        self.cnt = len(database.itemNames)
+        self.maxItem = self.cnt - 1
+        self.transactions = [_Transaction(items, utilities, transactionUtility)
+                             for items, utilities, transactionUtility in database.transactions()]
 
     def getMaxItem(self):
         """
@@ -274,6 +117,11 @@ class EFIM(_ab._utilityPatterns):
             To record the completion time of the mining process
         minUtil : int
             The user given minUtil value
+        numWorkers: int
+            Number of processes mining the first level branches in parallel, 1 mines them serially
+        cache : bool
+            Keep the database read from a local file in a binary sidecar file, read instead of the text by the next
+            runs while the file is unchanged
         highUtilityitemSets: map
             set of high utility itemSets
         candidateCount: int
@@ -317,14 +165,10 @@ class EFIM(_ab._utilityPatterns):
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
         sortDatabase(self, transactions)
               A Method to sort transaction
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to calculate local utility values for single itemsets
 
@@ -341,6 +185,10 @@ class EFIM(_ab._utilityPatterns):
 
         obj=alg.EFIM("input.txt",35)
 
+        # or obj=alg.EFIM("input.txt", 35, numWorkers=4) to mine the branches in 4 processes
+
+        # and obj=alg.EFIM("input.txt", 35, cache=True) parses input.txt once for the next runs
+
         obj.startMine()
 
         Patterns = obj.getPatterns()
@@ -390,10 +238,14 @@ class EFIM(_ab._utilityPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _startTime = _ab._time.time()
+    _numWorkers = 1
+    _cache = False
 
-    def __init__(self, iFile, minUtil, sep="\t"):
+    def __init__(self, iFile, minUtil, sep="\t", numWorkers=1, cache=False):
         super().__init__(iFile, minUtil, sep)
         self._sep = sep
+        self._numWorkers = numWorkers
+        self._cache = cache
         self._highUtilityitemSets = []
         self._candidateCount = 0
         self._utilityBinArrayLU = {}
@@ -414,11 +266,11 @@ class EFIM(_ab._utilityPatterns):
 
     def startMine(self):
         self._startTime = _ab._time.time()
-        self._dataset = _Dataset(self._iFile, self._sep)
+        self._dataset = _Dataset(self._iFile, self._sep, self._cache)
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         minUtil = int(self._minUtil)
         itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
+        for key in range(1, len(self._utilityBinArrayLU)):
             if self._utilityBinArrayLU[key] >= self._minUtil:
                 itemsToKeep.append(key)
         itemsToKeep = sorted(itemsToKeep, key=lambda x: self._utilityBinArrayLU[x])
@@ -441,7 +293,12 @@ class EFIM(_ab._utilityPatterns):
         for item in itemsToKeep:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
-        self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._dataset.transactions = _Transaction.pack(self._dataset.getTransactions())
+        if self._numWorkers > 1:
+            _mineBranches(self, '_backTrackingEFIM', self._dataset.getTransactions(), itemsToKeep, itemsToExplore,
+                          self._numWorkers)
+        else:
+            self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -450,7 +307,7 @@ class EFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using EFIM algorithm")
 
-    def _backTrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def _backTrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, branches=None):
         """
             A method to mine the HUIs Recursively
 
@@ -464,58 +321,15 @@ class EFIM(_ab._utilityPatterns):
             :type itemsToExplore: list
             :param prefixLength: current prefixLength
             :type prefixLength: int
-        """
-        self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            :param branches: positions of itemsToExplore to mine, all of them when None
+            :type branches: list
+        """
+        if branches is None:
+            self._candidateCount += len(itemsToExplore)
+            branches = range(len(itemsToExplore))
+        for idx in branches:
+            e = itemsToExplore[idx]
+            transactionsPe, utilityPe, _ = _projectDatabase(transactionsOfP, e)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
@@ -546,20 +360,8 @@ class EFIM(_ab._utilityPatterns):
             :type itemsToKeep: list
 
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+        self._utilityBinArrayLU, self._utilityBinArraySU = _upperBounds(transactionsPe, itemsToKeep,
+                                                                        len(self._newNamesToOldNames))
 
     def _output(self, tempPosition, utility):
         """
@@ -580,32 +382,6 @@ class EFIM(_ab._utilityPatterns):
                 s1 += " "
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1, transaction2):
-        """
-         A method to Check if two transaction are identical
-
-         Attributes:
-         ----------
-         :param  transaction1: the first transaction
-         :type  transaction1: Transaction
-         :param  transaction2:    the second transaction
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each items using a utility-bin array
@@ -615,17 +391,7 @@ class EFIM(_ab._utilityPatterns):
         :param dataset: the transaction database
         :type dataset: list
         """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                sumSU += transaction.getUtilities()[i]
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
+        self._utilityBinArraySU = _subtreeUtilities(dataset.getTransactions(), len(self._newNamesToOldNames))
 
     def _sortDatabase(self, transactions):
         """
@@ -638,50 +404,7 @@ class EFIM(_ab._utilityPatterns):
             :return: sorted transactions
             :rtype: Transactions
         """
-        cmp_items = _ab._functools.cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
-
-    def sort_transaction(self, trans1, trans2):
-        """
-            A Method to sort transaction
-
-            Attributes:
-            ----------
-            :param trans1: the first transaction 
-            :type trans1: Transaction 
-            :param trans2:the second transaction 
-            :type trans2: Transaction
-            :return: sorted transaction
-            :rtype:    Transaction
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
+        transactions.sort(key=_sortKey)
 
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
@@ -692,12 +415,7 @@ class EFIM(_ab._utilityPatterns):
             :type dataset: database
 
         """
-        for transaction in dataset.getTransactions():
-            for item in transaction.getItems():
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility
-                else:
-                    self._utilityBinArrayLU[item] = transaction.transactionUtility
+        self._utilityBinArrayLU = _localUtilities(dataset.getTransactions(), dataset.getMaxItem())
 
     def getPatternsAsDataFrame(self):
         """Storing final patterns in a dataframe
@@ -1,35 +1,13 @@
 
 from PAMI.highUtilityPatterns.basic import abstract as _ab
-
-
-class _Element:
-    """
-    A class represents an Element of a utility list .
-    Attributes :
-    ----------
-        ts : int
-            keep tact of transaction id
-        nu : int
-            non closed itemSet utility
-        nru : int
-             non closed remaining utility
-        pu : int
-            prefix utility
-        ppos: int
-            position of previous item in the list
-    """
-
-    def __init__(self, tid, nu, nru, pu, ppos):
-        self.tid = tid
-        self.nu = nu
-        self.nru = nru
-        self.pu = pu
-        self.ppos = ppos
+from PAMI.highUtilityPatterns.basic.utilityDatabase import UtilityDatabase as _UtilityDatabase
 
 
 class _CUList:
     """
-        A class represents a UtilityList
+        A class represents a UtilityList.
+        The elements are stored as five parallel int64 arrays, element i being
+        (tids[i], nu[i], nru[i], pu[i], ppos[i]).
     Attributes :
     ----------
         item: int
@@ -44,12 +22,24 @@ class _CUList:
             the sum of closed remaining utilities
         sumCpu: long
             the sum of closed prefix utilities
-        elements: list
-            the list of elements 
+        tids: array
+            transaction id of every element
+        nu: array
+            non closed itemSet utility of every element
+        nru: array
+            non closed remaining utility of every element
+        pu: array
+            prefix utility of every element
+        ppos: array
+            position of the element of the same transaction in the list of the previous item, -1 for the first item
     Methods :
     -------
-        addElement(element)
+        addElement(tid, nu, nru, pu, ppos)
             Method to add an element to this utility list and update the sums at the same time.
+        extend(tids, nu, nru, pu, ppos)
+            Method to add many elements to this utility list and update the sums at the same time.
+        getArrays()
+            Method to return the tids, nu, nru and pu of the elements as numpy arrays
     """
 
     def __init__(self, item):
@@ -59,17 +49,52 @@ class _CUList:
         self.sumCu = 0
         self.sumCru = 0
         self.sumCpu = 0
-        self.elements = []
+        self.tids = _ab.array('q')
+        self.nu = _ab.array('q')
+        self.nru = _ab.array('q')
+        self.pu = _ab.array('q')
+        self.ppos = _ab.array('q')
 
-    def addElements(self, element):
+    def addElement(self, tid, nu, nru, pu, ppos):
         """
             A method to add new element to CUList
-            :param element: element to be addeed to CUList
-            :type element: Element
+            :param tid: transaction id of the element
+            :type tid: int
+            :param nu: non closed itemSet utility
+            :type nu: int
+            :param nru: non closed remaining utility
+            :type nru: int
+            :param pu: prefix utility
+            :type pu: int
+            :param ppos: position of the element in the list of the previous item
+            :type ppos: int
+        """
+        self.sumnu += nu
+        self.sumnru += nru
+        self.tids.append(tid)
+        self.nu.append(nu)
+        self.nru.append(nru)
+        self.pu.append(pu)
+        self.ppos.append(ppos)
+
+    def extend(self, tids, nu, nru, pu, ppos):
+        """
+            A method to add elements given as numpy int64 arrays to CUList
+        """
+        self.sumnu += int(nu.sum())
+        self.sumnru += int(nru.sum())
+        self.tids.frombytes(tids.tobytes())
+        self.nu.frombytes(nu.tobytes())
+        self.nru.frombytes(nru.tobytes())
+        self.pu.frombytes(pu.tobytes())
+        self.ppos.frombytes(ppos.tobytes())
+
+    def getArrays(self):
         """
-        self.sumnu += element.nu
-        self.sumnru += element.nru
-        self.elements.append(element)
+            A method to return tids, nu, nru and pu of the elements as numpy arrays sharing the memory of the list
+        """
+        return tuple(_ab._np.frombuffer(values, dtype=_ab._np.int64) if len(values) else
+                     _ab._np.zeros(0, dtype=_ab._np.int64) for values in (self.tids, self.nu, self.nru, self.pu))
 
 
 class _Pair:
@@ -99,6 +124,9 @@ class HMiner(_ab._utilityPatterns):
             To record the completion time of the mining process
         minUtil : int
             The user given minUtil
+        cache : bool
+            Keep the database read from a local file in a binary sidecar file, read instead of the text by the next
+            runs while the file is unchanged
         mapFMAP: list
             EUCS map of the FHM algorithm
         candidates: int
@@ -125,12 +153,12 @@ class HMiner(_ab._utilityPatterns):
             Total amount of runtime taken by the mining process will be retrieved from this function
         Explore_SearchTree(prefix, uList, minUtil)
             A method to find all high utility itemSets
-        UpdateCLosed(x, culs, st, excul, newT, ex, ey_ts, length)
+        UpdateCLosed(excul, closed, pairItems, pairNu, pairNru, pairPu)
             A method to update closed values
         saveitemSet(prefix, prefixLen, item, utility)
             A method to save itemSets
-        updateElement(z, culs, st, excul, newT, ex, duppos, ey_ts)
-            A method to updates vales for duplicates
+        addElements(excul, elements, starts, ends, tids, pairElements, pairItems, pairNu, pairNru, pairPu)
+            A method to add new elements, merging the duplicates
         construcCUL(x, culs, st, minUtil, length, exnighbors)
             A method to construct CUL's database
     Executing the code on terminal :
@@ -179,7 +207,7 @@ class HMiner(_ab._utilityPatterns):
     _minSup = str()
     _maxPer = float()
     _finalPatterns = {}
-    _Database = {}
+    _database = None
     _transactions = []
     _utilities = []
     _utilitySum = []
@@ -187,11 +215,13 @@ class HMiner(_ab._utilityPatterns):
     _oFile = " "
     _minUtil = 0
     _sep = "\t"
+    _cache = False
     _memoryUSS = float()
     _memoryRSS = float()
 
-    def __init__(self, iFile1, minUtil, sep="\t"):
+    def __init__(self, iFile1, minUtil, sep="\t", cache=False):
         super().__init__(iFile1, minUtil, sep)
+        self._cache = cache
         self._huiCount = 0
         self._candidates = 0
         self._mapOfTWU = {}
@@ -211,43 +241,15 @@ class HMiner(_ab._utilityPatterns):
 
     def _creteItemsets(self):
         self._transactions, self._utilities, self._utilitySum = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._transactions = self._iFile['Transactions'].tolist()
-            if 'Utilities' in i:
-                self._utilities = self._iFile['Utilities'].tolist()
-            if 'UtilitySum' in i:
-                self._utilitySum = self._iFile['UtilitySum'].tolist()
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                #print("hey")
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    line = line.split("\n")[0]
-                    parts = line.split(":")
-                    items = parts[0].split(self._sep)
-                    self._transactions.append([x for x in items if x])
-                    utilities = parts[2].split(self._sep)
-                    self._utilities.append(utilities)
-                    self._utilitySum.append(int(parts[1]))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.split("\n")[0]
-                            parts = line.split(":")
-                            items = parts[0].split(self._sep)
-                            self._transactions.append([x for x in items if x])
-                            utilities = parts[2].split(self._sep)
-                            self._utilities.append(utilities)
-                            self._utilitySum.append(int(parts[1]))
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._database = _UtilityDatabase.read(self._iFile, self._sep, self._cache)
+        except IOError:
+            print("File Not Found")
+            quit()
+        for items, utilities, transactionUtility in self._database.transactions(names=True):
+            self._transactions.append(items)
+            self._utilities.append(utilities)
+            self._utilitySum.append(transactionUtility)
 
     def startMine(self):
         """
@@ -256,18 +258,9 @@ class HMiner(_ab._utilityPatterns):
         self._startTime = _ab._time.time()
         self._creteItemsets()
         self._finalPatterns = {}
-        for line in range(len(self._transactions)):
-            items_str = self._transactions[line]
-            utility_str = self._utilities[line]
-            transUtility = self._utilitySum[line]
-            for i in range(0, len(items_str)):
-                item = items_str[i]
-                twu = self._mapOfTWU.get(item)
-                if twu == None:
-                    twu = transUtility
-                else:
-                    twu += transUtility
-                self._mapOfTWU[item] = twu
+        twu = self._database.getTransactionWeightedUtilities()
+        for itemId in range(1, len(self._database.itemNames)):
+            self._mapOfTWU[self._database.itemNames[itemId]] = int(twu[itemId])
         listOfCUList = []
         hashTable = {}
         mapItemsToCUList = {}
@@ -289,7 +282,7 @@ class HMiner(_ab._utilityPatterns):
             for i in range(0, len(items)):
                 pair = _Pair()
                 pair.item = items[i]
-                pair.utility = int(utilities[i])
+                pair.utility = utilities[i]
                 if self._mapOfTWU.get(pair.item) >= self._minUtil:
                     revisedTrans.append(pair)
                     tx_key.append(pair.item)
@@ -298,28 +291,27 @@ class HMiner(_ab._utilityPatterns):
             tx_key1 = tuple(tx_key)
             if len(revisedTrans) > 0:
                 if tx_key1 not in hashTable.keys():
-                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item].elements)
+                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item].tids)
                     for i in range(len(revisedTrans) - 1, -1, -1):
                         pair = revisedTrans[i]
                         cuListoFItems = mapItemsToCUList.get(pair.item)
-                        element = _Element(tid, pair.utility, ru, 0, 0)
                         if i > 0:
-                            element.ppos = len(mapItemsToCUList[revisedTrans[i - 1].item].elements)
+                            ppos = len(mapItemsToCUList[revisedTrans[i - 1].item].tids)
                         else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
+                            ppos = - 1
+                        cuListoFItems.addElement(tid, pair.utility, ru, 0, ppos)
                         ru += pair.utility
                 else:
                     pos = hashTable[tx_key1]
                     ru = 0
                     for i in range(len(revisedTrans) - 1, -1, -1):
                         cuListoFItems = mapItemsToCUList[revisedTrans[i].item]
-                        cuListoFItems.elements[pos].nu += revisedTrans[i].utility
-                        cuListoFItems.elements[pos].nru += ru
+                        cuListoFItems.nu[pos] += revisedTrans[i].utility
+                        cuListoFItems.nru[pos] += ru
                         cuListoFItems.sumnu += revisedTrans[i].utility
                         cuListoFItems.sumnru += ru
                         ru += revisedTrans[i].utility
-                        pos = cuListoFItems.elements[pos].ppos
+                        pos = cuListoFItems.ppos[pos]
                     # EUCS
             for i in range(len(revisedTrans) - 1, -1, -1):
                 pair = revisedTrans[i]
@@ -370,7 +362,10 @@ class HMiner(_ab._utilityPatterns):
 
     def _construcCUL(self, x, culs, st, minutil, length):
         """
-            A method to construct CUL's database
+            A method to construct CUL's database.
+            The elements of x are merge-joined with the sorted tids of every list after it. The elements of x
+            containing the same set of extensions are merged into one element, the others only update the
+            closed values. An extension is pruned at the first element where its LA utility drops below minutil.
             Attributes:
             -----------
             :parm x: Compact utility list
@@ -386,74 +381,65 @@ class HMiner(_ab._utilityPatterns):
             :return: projectd database of list X
             :rtype: list
         """
-        excul = []
-        lau = []
-        cutil = []
-        ey_tid = []
-        for i in range(0, len(culs)):
-            uList = _CUList(culs[i].item)
-            excul.append(uList)
-            lau.append(0)
-            cutil.append(0)
-            ey_tid.append(0)
+        np = _ab._np
+        excul = [None] * len(culs)
         sz = len(culs) - (st + 1)
         exSZ = sz
+        mapOfTWUF = self._mapFMAP[x.item]
         for j in range(st + 1, len(culs)):
-            mapOfTWUF = self._mapFMAP[x.item]
-            if mapOfTWUF != None:
-                twuf = mapOfTWUF.get(culs[j].item)
-                if twuf != None and twuf < minutil:
-                    excul[j] = None
-                    exSZ = sz - 1
-                else:
-                    uList = _CUList(culs[j].item)
-                    excul[j] = uList
-                    ey_tid[j] = 0
-                    lau[j] = x.sumCu + x.sumCru + x.sumnu + x.sumnru
-                    cutil[j] = x.sumCu + x.sumCru
-        hashTable = {}
-        for ex in x.elements:
-            newT = []
-            for j in range(st + 1, len(culs)):
-                if excul[j] is None:
-                    continue
-                eylist = culs[j].elements
-                while ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid < ex.tid:
-                    ey_tid[j] = ey_tid[j] + 1
-                if ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid == ex.tid:
-                    newT.append(j)
-                else:
-                    lau[j] = lau[j] - ex.nu - ex.nru
-                    if lau[j] < minutil:
-                        excul[j] = None
-                        exSZ = exSZ - 1
-            if len(newT) == exSZ:
-                self._UpdateCLosed(x, culs, st, excul, newT, ex, ey_tid, length)
+            twuf = mapOfTWUF.get(culs[j].item)
+            if twuf is not None and twuf < minutil:
+                exSZ = sz - 1
             else:
-                if len(newT) == 0:
-                    continue
-                ru = 0
-                newT1 = tuple(newT)
-                if newT1 not in hashTable.keys():
-                    hashTable[newT1] = len(excul[newT[len(newT) - 1]].elements)
-                    for i in range(len(newT) - 1, -1, -1):
-                        cuListoFItems = excul[newT[i]]
-                        y = culs[newT[i]].elements[ey_tid[newT[i]]]
-                        element = _Element(ex.tid, ex.nu + y.nu - ex.pu, ru, ex.nu, 0)
-                        if i > 0:
-                            element.ppos = len(excul[newT[i - 1]].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += y.nu - ex.pu
-                else:
-                    dppos = hashTable[newT1]
-                    self._updateElement(x, culs, st, excul, newT, ex, dppos, ey_tid)
-            for j in range(st + 1, len(culs)):
-                cutil[j] = cutil[j] + ex.nu + ex.nru
+                excul[j] = _CUList(culs[j].item)
+        tids, nu, nru, pu = x.getArrays()
+        numElements = len(tids)
+        remaining = nu + nru
+        lau = x.sumCu + x.sumCru + x.sumnu + x.sumnru
+        pruned = np.zeros(numElements + 1, dtype=np.int64)
+        pairElements, pairItems, pairUtilities = [], [], []
+        for j in range(st + 1, len(culs)):
+            if excul[j] is None:
+                continue
+            eyTids, eyNu, _, _ = culs[j].getArrays()
+            positions = np.searchsorted(eyTids, tids)
+            found = positions < len(eyTids)
+            found[found] = eyTids[positions[found]] == tids[found]
+            missing = np.flatnonzero(~found)
+            below = np.flatnonzero(lau - np.cumsum(remaining[missing]) < minutil)
+            end = numElements
+            if len(below) > 0:
+                end = missing[below[0]]
+                excul[j] = None
+            pruned[end] += 1
+            elements = np.flatnonzero(found[:end])
+            pairElements.append(elements)
+            pairItems.append(np.full(len(elements), j, dtype=np.int64))
+            pairUtilities.append(eyNu[positions[elements]])
+        if pairElements:
+            order = np.argsort(np.concatenate(pairElements), kind='stable')
+            pairElements = np.concatenate(pairElements)[order]
+            pairItems = np.concatenate(pairItems)[order]
+            pairUtilities = np.concatenate(pairUtilities)[order]
+        else:
+            pairElements = pairItems = pairUtilities = np.zeros(0, dtype=np.int64)
+        counts = np.bincount(pairElements, minlength=numElements)
+        closed = counts == exSZ - np.cumsum(pruned[:numElements])
+        skipped = (counts == 0) & ~closed
+        cutil = x.sumCu + x.sumCru + int(remaining[~skipped].sum())
+        ends = np.cumsum(counts)
+        # utility of the extension y added to ex, and the sum of these for the extensions after y
+        added = pairUtilities - pu[pairElements]
+        prefixSums = np.cumsum(added)
+        pairNru = prefixSums[ends[pairElements] - 1] - prefixSums
+        pairNu = nu[pairElements] + added
+        pairPu = nu[pairElements]
+        self._UpdateCLosed(excul, closed[pairElements], pairItems, pairNu, pairNru, pairPu)
+        self._addElements(excul, np.flatnonzero(~closed & ~skipped), ends - counts, ends, tids, pairElements,
+                          pairItems, pairNu, pairNru, pairPu)
         filter_culs = []
         for j in range(st + 1, len(culs)):
-            if cutil[j] < minutil or excul[j] is None:
+            if cutil < minutil or excul[j] is None:
                 continue
             else:
                 if length > 1:
@@ -463,69 +449,88 @@ class HMiner(_ab._utilityPatterns):
                 filter_culs.append(excul[j])
         return filter_culs
 
-    def _UpdateCLosed(self, x, culs, st, excul, newT, ex, ey_tid, length):
+    def _UpdateCLosed(self, excul, closed, pairItems, pairNu, pairNru, pairPu):
         """
-            A method to update closed values
+            A method to update closed values with the elements of x containing all remaining extensions
             Attributes:
             -----------
-            :parm x: Compact utility list
-            :type x: list
-            :parm culs:list of Compact utility lists
-            :type culs:list
-            :parm st: starting pos of culs
-            :type st:int
-            :parm newT:transaction to be updated
-            :type newT:list
-            :parm ex: element ex
-            :type ex:element
-            :parm ey_tid:list of tss
-            :type ey_tid:ts
-            :parm length: length of x
-            :type length:int
+            :parm excul:list of culs
+            :type excul:list
+            :parm closed: for every (element, extension) pair, if the element contains all extensions
+            :type closed: numpy.ndarray
+            :parm pairItems: position of the extension in excul of every pair
+            :type pairItems: numpy.ndarray
+            :parm pairNu: utility of every pair
+            :type pairNu: numpy.ndarray
+            :parm pairNru: remaining utility of every pair
+            :type pairNru: numpy.ndarray
+            :parm pairPu: prefix utility of every pair
+            :type pairPu: numpy.ndarray
         """
-        nru = 0
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].sumCu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumCru += nru
-            excul[newT[j]].sumCpu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-
-    def _updateElement(self, z, culs, st, excul, newT, ex, duppos, ey_tid):
+        np = _ab._np
+        pairItems = pairItems[closed]
+        for values, name in ((pairNu, 'sumCu'), (pairNru, 'sumCru'), (pairPu, 'sumCpu')):
+            sums = np.zeros(len(excul), dtype=np.int64)
+            np.add.at(sums, pairItems, values[closed])
+            for j in np.flatnonzero(sums).tolist():
+                if excul[j] is not None:
+                    setattr(excul[j], name, getattr(excul[j], name) + int(sums[j]))
+
+    def _addElements(self, excul, elements, starts, ends, tids, pairElements, pairItems, pairNu, pairNru, pairPu):
         """
-            A method to updates vales for duplicates
+            A method to add the elements of the extensions, the elements of x containing the same extensions are merged
+            into the element of the first one
             Attributes:
             -----------
-            :parm z: Compact utility list
-            :type z: list
-            :parm culs:list of Compact utility lists
-            :type culs:list
-            :parm st: starting pos of culs
-            :type st:int
             :parm excul:list of culs
             :type excul:list
-            :parm newT:transaction to be updated
-            :type newT:list
-            :parm ex: element ex
-            :type ex:element
-            :parm duppos: position of z in excul
-            :type duppos:int
-            :parm ey_tid:list of tss
-            :type ey_tid:ts
+            :parm elements: the elements of x to add
+            :type elements: numpy.ndarray
+            :parm starts: position of the first pair of every element of x
+            :type starts: numpy.ndarray
+            :parm ends: position after the last pair of every element of x
+            :type ends: numpy.ndarray
+            :parm tids: tids of the elements of x
+            :type tids: numpy.ndarray
+            :parm pairElements: element of x of every pair
+            :type pairElements: numpy.ndarray
+            :parm pairItems: position of the extension in excul of every pair
+            :type pairItems: numpy.ndarray
         """
-        nru = 0
-        pos = duppos
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].elements[pos].nu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumnu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].elements[pos].nru += nru
-            excul[newT[j]].sumnru += nru
-            excul[newT[j]].elements[pos].pu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-            pos = excul[newT[j]].elements[pos].ppos
+        np = _ab._np
+        if len(elements) == 0:
+            return
+        keys = pairItems.astype(np.int32).tobytes()
+        groups = {}
+        groupOf = np.array([groups.setdefault(keys[start * 4:end * 4], len(groups)) for start, end in
+                            zip(starts[elements].tolist(), ends[elements].tolist())], dtype=np.int64)
+        first = elements[np.unique(groupOf, return_index=True)[1]]
+        # every pair of a merged element is added to the pair at the same offset in the first element of its group
+        lengths = ends[elements] - starts[elements]
+        offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        pairs = np.repeat(starts[elements], lengths) + offsets
+        targets = np.repeat(starts[first[groupOf]], lengths) + offsets
+        sums = []
+        for values in (pairNu, pairNru, pairPu):
+            total = np.zeros(len(values), dtype=np.int64)
+            np.add.at(total, targets, values[pairs])
+            sums.append(total)
+        lengths = ends[first] - starts[first]
+        offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        firstPairs = np.repeat(starts[first], lengths) + offsets
+        # position of every new element in the list of its extension, and in the list of the previous extension
+        items = pairItems[firstPairs]
+        order = np.argsort(items, kind='stable')
+        positions = np.empty(len(firstPairs), dtype=np.int64)
+        positions[order] = np.arange(len(firstPairs)) - np.searchsorted(items[order], items[order])
+        ppos = np.full(len(firstPairs), -1, dtype=np.int64)
+        ppos[offsets > 0] = positions[np.flatnonzero(offsets > 0) - 1]
+        for block in np.split(order, np.flatnonzero(np.diff(items[order])) + 1):
+            j = int(items[block[0]])
+            if excul[j] is None:
+                continue
+            chosen = firstPairs[block]
+            excul[j].extend(tids[pairElements[chosen]], sums[0][chosen], sums[1][chosen], sums[2][chosen], ppos[block])
 
     def _saveitemSet(self, prefix, prefixLen, item, utility):
         """
@@ -15,6 +15,7 @@
 
 
 from PAMI.highUtilityPatterns.basic import abstract as _ab
+from PAMI.highUtilityPatterns.basic.utilityDatabase import UtilityDatabase as _UtilityDatabase
 
 
 class _UPItem:
@@ -303,6 +304,9 @@ class UPGrowth(_ab._utilityPatterns):
             To record the completion time of the mining process
         minUtil : int
             The user given minUtil
+        cache : bool
+            Keep the database read from a local file in a binary sidecar file, read instead of the text by the next
+            runs while the file is unchanged
         NumberOfNodes : int
             Total number of nodes generated while building the tree
         ParentNumberOfNodes : int
@@ -313,6 +317,8 @@ class UPGrowth(_ab._utilityPatterns):
             A list to store the phuis
         MapItemToTwu : map
             A map to store the twu of each item in database
+        verticalIndex : map
+            A map from each promising item to the ids of its transactions and its utilities in them
 
     Methods :
     -------
@@ -324,6 +330,8 @@ class UPGrowth(_ab._utilityPatterns):
             A Method to Construct conditional pattern base
         UPGrowth( tree, alpha)
             A Method to Mine UP Tree recursively
+        verifyPHUIs()
+            A Method to calculate the exact utility of the phuis with the vertical index
         PrintStats()
             A Method to print no.of phuis
         savePatterns(oFile)
@@ -388,73 +396,54 @@ class UPGrowth(_ab._utilityPatterns):
     _MapItemToMinimumUtility = {}
     _MapItemsetsToUtilities = _ab._defaultdict(int)
     _phuis = []
-    _Database = []
+    _database = None
     _MapItemToTwu = {}
+    _verticalIndex = {}
     _sep = " "
+    _cache = False
 
-    def __init__(self, iFile, minUtil, sep='\t'):
+    def __init__(self, iFile, minUtil, sep='\t', cache=False):
         super().__init__(iFile, minUtil, sep)
+        self._cache = cache
+        self._MapItemToMinimumUtility = {}
+        self._MapItemsetsToUtilities = _ab._defaultdict(int)
+        self._phuis = []
 
     def _creatingItemSets(self):
         """
             Storing the complete transactions of the database/input file in a database variable
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            timeStamp, data = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            if 'Utilities' in i:
-                data = self._iFile['Patterns'].tolist()
-            for i in range(len(data)):
-                tr = [timeStamp[i]]
-                tr.append(data[i])
-                self._Database.append(tr)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    self._Database.append(line)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            self._Database.append(line)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._database = _UtilityDatabase.read(self._iFile, self._sep, self._cache)
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def startMine(self):
         self._startTime = _ab._time.time()
         tree = _UPTree()
         self._creatingItemSets()
         self._finalPatterns = {}
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            transactionUtility = int(transaction[1])
-            for item in items:
-                Item = int(item)
-                if Item in self._MapItemToTwu:
-                    self._MapItemToTwu[Item] += transactionUtility
-                else:
-                    self._MapItemToTwu[Item] = transactionUtility
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
+        twu = self._database.getTransactionWeightedUtilities()
+        itemNames = [None] + [int(name) for name in self._database.itemNames[1:]]
+        self._MapItemToTwu = {}
+        for itemId in range(1, len(itemNames)):
+            self._MapItemToTwu[itemNames[itemId]] = self._MapItemToTwu.get(itemNames[itemId], 0) + int(twu[itemId])
+        self._verticalIndex = {}
+        for tid, (items, utilities, transactionUtility) in enumerate(self._database.transactions()):
             remainingUtility = 0
             revisedTransaction = []
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
+            for itemId, utility in zip(items, utilities):
+                Item = itemNames[itemId]
                 if self._MapItemToTwu[Item] >= self._minUtil:
+                    if Item not in self._verticalIndex:
+                        self._verticalIndex[Item] = ([], [])
+                    tids, itemUtilities = self._verticalIndex[Item]
+                    if tids and tids[-1] == tid:
+                        itemUtilities[-1] = utility
+                    else:
+                        tids.append(tid)
+                        itemUtilities.append(utility)
                     element = _UPItem(Item, utility)
                     revisedTransaction.append(element)
                     remainingUtility += utility
@@ -473,29 +462,7 @@ class UPGrowth(_ab._utilityPatterns):
         self._UPGrowth(tree, alpha)
         # self.phuis = sorted(self.phuis, key=lambda x: len(x))
         # print(self.phuis[0:10])
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
-            mapItemToUtility = {}
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
-                if self._MapItemToTwu[Item] >= self._minUtil:
-                    mapItemToUtility[Item] = utility
-            for itemset in self._phuis:
-                l = len(itemset)
-                count = 0
-                utility = 0
-                for item in itemset:
-                    item = int(item)
-                    if item in mapItemToUtility:
-                        utility += mapItemToUtility[item]
-                        count += 1
-                if count == l:
-                    self._MapItemsetsToUtilities[tuple(itemset)] += utility
-
+        self._verifyPHUIs()
         for itemset in self._phuis:
             util = self._MapItemsetsToUtilities[tuple(itemset)]
             if util >= self._minUtil:
@@ -535,6 +502,52 @@ class UPGrowth(_ab._utilityPatterns):
                 if len(localTree.headerList) > 0:
                     self._UPGrowth(localTree, beta)
 
+    def _verifyPHUIs(self):
+        """
+            A Method to calculate the exact utility of the phuis.
+            The phuis are stored in a prefix trie, so the transactions of a shared prefix are intersected only once.
+        """
+        for item in self._verticalIndex:
+            tids, utilities = self._verticalIndex[item]
+            self._verticalIndex[item] = (_ab._np.array(tids, dtype=_ab._np.int64),
+                                         _ab._np.array(utilities, dtype=_ab._np.int64))
+        trie = {}
+        for itemset in self._phuis:
+            node = trie
+            for item in itemset:
+                node = node.setdefault(item, {})
+        itemsetUtilities = {}
+        self._verifyTrie(trie, (), None, None, itemsetUtilities)
+        for itemset in self._phuis:
+            self._MapItemsetsToUtilities[tuple(itemset)] += itemsetUtilities.get(tuple(itemset), 0)
+
+    def _verifyTrie(self, node, prefix, tids, utilities, itemsetUtilities):
+        """
+            A Method to calculate the utility of every itemset in a prefix trie
+
+            :param node: children of the trie node of the prefix
+            :type node: dict
+            :param prefix: the prefix itemset
+            :type prefix: tuple
+            :param tids: ids of the transactions containing the prefix, None for the empty prefix
+            :type tids: numpy.ndarray
+            :param utilities: utility of the prefix in each of these transactions
+            :type utilities: numpy.ndarray
+            :param itemsetUtilities: map to store the utility of each itemset
+            :type itemsetUtilities: dict
+        """
+        for item, child in node.items():
+            itemTids, itemUtilities = self._verticalIndex[item]
+            if tids is None:
+                itemsetTids, itemsetUtility = itemTids, itemUtilities
+            else:
+                itemsetTids, i, j = _ab._np.intersect1d(tids, itemTids, assume_unique=True, return_indices=True)
+                itemsetUtility = utilities[i] + itemUtilities[j]
+            itemset = prefix + (item,)
+            itemsetUtilities[itemset] = int(itemsetUtility.sum())
+            if child and len(itemsetTids) > 0:
+                self._verifyTrie(child, itemset, itemsetTids, itemsetUtility, itemsetUtilities)
+
     def _createLocalTree(self, tree, item):
         """
             A Method to Construct conditional pattern base
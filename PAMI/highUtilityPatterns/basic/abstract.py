@@ -28,6 +28,7 @@ import psutil as _psutil
 from array import *
 import functools as _functools
 import sys as _sys
+import numpy as _np
 
 class _utilityPatterns(_ABC):
     """ This abstract base class defines the variables and methods that every frequent pattern mining algorithm must
@@ -0,0 +1,231 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import copy as _copy
+import multiprocessing as _mp
+from multiprocessing import shared_memory as _sharedMemory
+import numpy as _np
+
+_worker = {}
+
+
+class _SharedDatabase:
+    """
+        The revised and sorted database stored in shared memory as flat arrays
+
+    Attributes:
+    ----------
+        items: numpy.ndarray
+            items of all transactions, one transaction after the other
+        utilities: numpy.ndarray
+            utilities of the items
+        bounds: numpy.ndarray
+            start position of every transaction in items, followed by the total number of items
+        transactionUtilities: numpy.ndarray
+            transaction utility of every transaction
+    """
+
+    _fields = (('items', _np.int32), ('utilities', _np.int64), ('bounds', _np.int64),
+               ('transactionUtilities', _np.int64))
+
+    def __init__(self, blocks, arrays):
+        self._blocks = blocks
+        for (name, dtype), array in zip(self._fields, arrays):
+            setattr(self, name, array)
+
+    @classmethod
+    def create(cls, transactions):
+        """
+            Copy the transactions into new shared memory blocks
+
+            :param transactions: transactions of the database
+            :type transactions: list
+            :return: the shared database
+            :rtype: _SharedDatabase
+        """
+        lengths = [transaction.getLastPosition() + 1 - transaction.offset for transaction in transactions]
+        bounds = _np.zeros(len(transactions) + 1, dtype=_np.int64)
+        _np.cumsum(lengths, out=bounds[1:])
+        values = (
+            [item for transaction in transactions
+             for item in transaction.getItems()[transaction.offset:transaction.getLastPosition() + 1]],
+            [utility for transaction in transactions
+             for utility in transaction.getUtilities()[transaction.offset:transaction.getLastPosition() + 1]],
+            bounds,
+            [transaction.transactionUtility for transaction in transactions],
+        )
+        blocks, arrays = [], []
+        for (name, dtype), value in zip(cls._fields, values):
+            value = _np.asarray(value, dtype=dtype)
+            block = _sharedMemory.SharedMemory(create=True, size=max(value.nbytes, 1))
+            array = _np.ndarray(value.shape, dtype=dtype, buffer=block.buf)
+            array[:] = value
+            blocks.append(block)
+            arrays.append(array)
+        return cls(blocks, arrays)
+
+    @classmethod
+    def attach(cls, handles):
+        """
+            Attach to shared memory blocks created by another process
+
+            :param handles: name and shape of every block, as returned by handles()
+            :type handles: list
+            :return: the shared database
+            :rtype: _SharedDatabase
+        """
+        blocks, arrays = [], []
+        for (name, dtype), (blockName, shape) in zip(cls._fields, handles):
+            block = _sharedMemory.SharedMemory(name=blockName)
+            blocks.append(block)
+            arrays.append(_np.ndarray(shape, dtype=dtype, buffer=block.buf))
+        return cls(blocks, arrays)
+
+    def handles(self):
+        """
+            Name and shape of every block, used by the workers to attach to the database
+        """
+        return [(block.name, getattr(self, name).shape) for block, (name, dtype) in zip(self._blocks, self._fields)]
+
+    def close(self, unlink=False):
+        """
+            Release the blocks of this process and remove them from the system when unlink is True
+        """
+        for name, dtype in self._fields:
+            setattr(self, name, None)
+        for block in self._blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+def _minerState(miner):
+    """
+        A copy of the miner without its transactions, which is sent to the workers.
+        Class level data attributes are copied as well because miners keep part of their state in them.
+
+        :param miner: the miner running the mining process
+        :return: the copy of the miner
+    """
+    state = {}
+    for cls in reversed(type(miner).__mro__):
+        for key, value in vars(cls).items():
+            if not key.startswith('__') and isinstance(value, (bool, int, float, str, list, tuple, set, dict)):
+                state[key] = value
+    state.update(vars(miner))
+    clone = object.__new__(type(miner))
+    clone.__dict__.update(state)
+    if getattr(clone, '_dataset', None) is not None:
+        clone._dataset = _copy.copy(clone._dataset)
+        clone._dataset.transactions = []
+    return clone
+
+
+def _initWorker(miner, handles, transactionClass, method, itemsToKeep, itemsToExplore, args):
+    """
+        Attach a worker to the shared database
+    """
+    database = _SharedDatabase.attach(handles)
+    positions = _np.arange(len(database.items))
+    explorable = _np.where(_np.isin(database.items, itemsToExplore), positions, -1)
+    previous = _np.full(len(database.items), -1, dtype=_np.int64)
+    if len(previous) > 1:
+        previous[1:] = _np.maximum.accumulate(explorable)[:-1]
+    _worker.update(miner=miner, database=database, previous=previous, bounds=database.bounds.tolist(),
+                   transactionClass=transactionClass, method=method, itemsToKeep=itemsToKeep,
+                   itemsToExplore=itemsToExplore, args=args)
+
+
+def _mineBranch(idx):
+    """
+        Mine the first level branch of itemsToExplore[idx] in a worker
+
+        :param idx: position of the item in itemsToExplore
+        :type idx: int
+        :return: idx, patterns, number of patterns, number of candidates and maximum memory of the branch
+        :rtype: tuple
+    """
+    miner = _worker['miner']
+    database = _worker['database']
+    bounds = _worker['bounds']
+    previous = _worker['previous']
+    transactionClass = _worker['transactionClass']
+    itemsToExplore = _worker['itemsToExplore']
+    occurrences = _np.flatnonzero(database.items == itemsToExplore[idx])
+    tids = _np.searchsorted(database.bounds, occurrences, side='right') - 1
+    transactions = []
+    for position, tid in zip(occurrences.tolist(), tids.tolist()):
+        start, end = bounds[tid], bounds[tid + 1]
+        transaction = transactionClass(database.items[start:end].tolist(), database.utilities[start:end].tolist(),
+                                       int(database.transactionUtilities[tid]))
+        # the serial loop leaves the offset of a transaction on the last explored item it contains
+        offset = int(previous[position])
+        if offset >= start:
+            transaction.offset = offset - start
+        transactions.append(transaction)
+    if hasattr(transactionClass, 'pack'):
+        transactions = transactionClass.pack(transactions)
+    miner._finalPatterns = {}
+    miner._patternCount = 0
+    miner._candidateCount = 0
+    miner._maxMemory = 0
+    getattr(miner, _worker['method'])(transactions, _worker['itemsToKeep'], itemsToExplore, 0, *_worker['args'],
+                                      branches=[idx])
+    return idx, miner._finalPatterns, miner._patternCount, miner._candidateCount, miner._maxMemory
+
+
+def mineBranches(miner, method, transactions, itemsToKeep, itemsToExplore, numWorkers, *args):
+    """
+    Mine the first level branches of an EFIM style miner in parallel processes.
+    The database is placed once in shared memory and every worker builds only the transactions of the branch it mines.
+    Branches are handed out one at a time, the largest first, because their sizes are very skewed.
+    The backtracking method of the miner must accept the keyword branches, the positions of itemsToExplore to mine.
+    The patterns, counts and memory of the branches are merged into the miner in the order of the serial run.
+
+    :param miner: the miner running the mining process
+    :param method: name of the backtracking method of the miner
+    :type method: str
+    :param transactions: the revised and sorted transactions of the database
+    :type transactions: list
+    :param itemsToKeep: the list of secondary items
+    :type itemsToKeep: list
+    :param itemsToExplore: the list of primary items
+    :type itemsToExplore: list
+    :param numWorkers: number of processes
+    :type numWorkers: int
+    :param args: remaining arguments of the backtracking method after prefixLength
+    """
+    miner._candidateCount += len(itemsToExplore)
+    if len(itemsToExplore) == 0 or len(transactions) == 0:
+        return
+    database = _SharedDatabase.create(transactions)
+    try:
+        counts = _np.bincount(database.items, minlength=max(itemsToExplore) + 1)
+        order = sorted(range(len(itemsToExplore)), key=lambda i: -counts[itemsToExplore[i]])
+        initArgs = (_minerState(miner), database.handles(), type(transactions[0]), method, itemsToKeep,
+                    itemsToExplore, args)
+        results = {}
+        with _mp.Pool(min(numWorkers, len(itemsToExplore)), initializer=_initWorker, initargs=initArgs) as pool:
+            for result in pool.imap_unordered(_mineBranch, order, chunksize=1):
+                results[result[0]] = result[1:]
+    finally:
+        database.close(unlink=True)
+    for idx in range(len(itemsToExplore)):
+        patterns, patternCount, candidateCount, maxMemory = results[idx]
+        miner._finalPatterns.update(patterns)
+        miner._patternCount += patternCount
+        miner._candidateCount += candidateCount
+        if maxMemory > getattr(miner, '_maxMemory', 0):
+            miner._maxMemory = maxMemory
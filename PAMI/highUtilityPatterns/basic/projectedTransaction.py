@@ -0,0 +1,320 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+from bisect import bisect_left as _bisectLeft
+from itertools import accumulate as _accumulate
+from operator import add as _add
+
+
+class Transaction:
+    """
+        A class to store a transaction of the EFIM style miners.
+        While the database is read a transaction holds its own lists, which are revised with removeUnpromisingItems.
+        Before mining, pack() copies all transactions into flat int32 item and int64 utility arrays with prefix sums.
+        A packed transaction is the slice [offset, end) of these arrays, so projecting it only moves offset.
+
+    Attributes:
+    ----------
+        items: list or array
+            items of the transaction, sorted in increasing order
+        utilities: list or array
+            utilities of the items
+        transactionUtility: int
+            remaining utility of the items from offset to end
+        prefixUtility:
+            prefix Utility values of item
+        offset:
+            position of the first item of the transaction
+        end:
+            position after the last item of the transaction
+        support: int
+            number of transactions of the database merged into this transaction
+        pmus: list
+            represent the pmu (probable maximum utility) of each element in the transaction
+
+    Methods:
+    --------
+        pack(transactions)
+            Store the transactions in flat arrays
+        projectTransaction(offsetE):
+            A method to create new Transaction from existing transaction starting from offsetE until the end
+        findItem(item):
+            return the position of an item in the transaction
+        merge(transaction):
+            add the utilities of an identical transaction
+        isEqual(transaction):
+            check if two transactions have the same items
+        getItems():
+            return items in transaction
+        getUtilities():
+            return utilities in transaction
+        getPmus():
+            return pmus in transaction
+        getLastPosition():
+            return last position in a transaction
+        getSupport():
+            return the support of the transaction
+        removeUnpromisingItems():
+            A method to remove items which are not present in the map passed to the function
+        insertionSort():
+            A method to sort all items in the transaction
+    """
+    __slots__ = ('items', 'utilities', 'transactionUtility', 'prefixUtility', 'offset', 'end', 'support', 'pmus',
+                 '_prefixSums', '_shared')
+
+    def __init__(self, items, utilities, transactionUtility, pmus=None):
+        self.items = items
+        self.utilities = utilities
+        self.transactionUtility = transactionUtility
+        self.prefixUtility = 0
+        self.offset = 0
+        self.end = len(items)
+        self.support = 1
+        self.pmus = pmus
+        self._prefixSums = None
+        self._shared = True
+
+    @classmethod
+    def pack(cls, transactions):
+        """
+            Copy transactions into flat arrays shared by all of them, keeping their offsets
+
+            :param transactions: the transactions
+            :type transactions: list
+            :return: the packed transactions
+            :rtype: list
+        """
+        items = _array('i')
+        utilities = _array('q')
+        starts = []
+        for transaction in transactions:
+            starts.append(len(items))
+            items.extend(transaction.items[:transaction.end])
+            utilities.extend(transaction.utilities[:transaction.end])
+        prefixSums = _array('q', _accumulate(utilities, initial=0))
+        packed = []
+        for start, transaction in zip(starts, transactions):
+            newTransaction = cls.__new__(cls)
+            newTransaction.items = items
+            newTransaction.utilities = utilities
+            newTransaction.transactionUtility = transaction.transactionUtility
+            newTransaction.prefixUtility = transaction.prefixUtility
+            newTransaction.offset = start + transaction.offset
+            newTransaction.end = start + transaction.end
+            newTransaction.support = transaction.support
+            newTransaction.pmus = None
+            newTransaction._prefixSums = prefixSums
+            newTransaction._shared = True
+            packed.append(newTransaction)
+        return packed
+
+    def projectTransaction(self, offsetE):
+        """
+            A method to create new Transaction from existing transaction starting from offsetE until the end
+
+        Parameters:
+        ----------
+            :param offsetE: an offset over the original transaction for projecting the transaction
+            :type offsetE: int
+        """
+        prefixSums = self._prefixSums
+        if prefixSums is None:
+            prefixSums = self._prefixSums = _array('q', _accumulate(self.utilities, initial=0))
+        newTransaction = Transaction.__new__(Transaction)
+        newTransaction.items = self.items
+        newTransaction.utilities = self.utilities
+        newTransaction.prefixUtility = self.prefixUtility + self.utilities[offsetE]
+        newTransaction.transactionUtility = self.transactionUtility - (prefixSums[offsetE + 1] - prefixSums[self.offset])
+        newTransaction.offset = offsetE + 1
+        newTransaction.end = self.end
+        newTransaction.support = self.support
+        newTransaction.pmus = None
+        newTransaction._prefixSums = prefixSums
+        newTransaction._shared = True
+        return newTransaction
+
+    def findItem(self, item):
+        """
+            A method to find an item with a binary search between offset and end
+
+            :param item: the item to search
+            :type item: int
+            :return: position of the item or -1 if the transaction does not contain it
+            :rtype: int
+        """
+        position = _bisectLeft(self.items, item, self.offset, self.end)
+        if position < self.end and self.items[position] == item:
+            return position
+        return -1
+
+    def merge(self, transaction):
+        """
+            A method to add the utilities of a transaction having the same items.
+            A transaction sharing its arrays is copied first, a merged transaction is updated in place.
+
+            :param transaction: the transaction to merge
+            :type transaction: Transaction
+            :return: the merged transaction
+            :rtype: Transaction
+        """
+        otherUtilities = transaction.utilities[transaction.offset:transaction.end]
+        if self._shared:
+            merged = Transaction.__new__(Transaction)
+            merged.items = self.items[self.offset:self.end]
+            merged.utilities = _array('q', map(_add, self.utilities[self.offset:self.end], otherUtilities))
+            merged.offset = 0
+            merged.end = len(merged.items)
+            merged.transactionUtility = self.transactionUtility + transaction.transactionUtility
+            merged.prefixUtility = self.prefixUtility + transaction.prefixUtility
+            merged.support = self.support + transaction.support
+            merged.pmus = None
+            merged._prefixSums = None
+            merged._shared = False
+            return merged
+        self.utilities = _array('q', map(_add, self.utilities, otherUtilities))
+        self.transactionUtility += transaction.transactionUtility
+        self.prefixUtility += transaction.prefixUtility
+        self.support += transaction.support
+        self._prefixSums = None
+        return self
+
+    def isEqual(self, transaction):
+        """
+            A method to check if two transactions have the same items
+
+            :param transaction: the other transaction
+            :type transaction: Transaction
+            :rtype: bool
+        """
+        if self.end - self.offset != transaction.end - transaction.offset:
+            return False
+        return self.items[self.offset:self.end] == transaction.items[transaction.offset:transaction.end]
+
+    def getItems(self):
+        """
+            A method to return items in transaction
+        """
+        return self.items
+
+    def getUtilities(self):
+        """
+            A method to return utilities in transaction
+        """
+        return self.utilities
+
+    def getPmus(self):
+        """
+            A method to return pmus in transaction
+        """
+        return self.pmus
+
+    def getLastPosition(self):
+        """
+            A method to return last position in a transaction
+        """
+        return self.end - 1
+
+    def getSupport(self):
+        """
+            A method to return support of a transaction (number of transactions in the original database having the items present in this transactions)
+        """
+        return self.support
+
+    def removeUnpromisingItems(self, oldNamesToNewNames):
+        """
+            A method to remove items which are not present in the map passed to the function
+
+            Parameters:
+            -----------
+            :param oldNamesToNewNames: A map represent old names to new names
+            :type oldNamesToNewNames: map
+        """
+        tempItems = []
+        tempUtilities = []
+        for idx, item in enumerate(self.items):
+            if item in oldNamesToNewNames:
+                tempItems.append(oldNamesToNewNames[item])
+                tempUtilities.append(self.utilities[idx])
+            else:
+                self.transactionUtility -= self.utilities[idx]
+        self.items = tempItems
+        self.utilities = tempUtilities
+        self.end = len(tempItems)
+        self.insertionSort()
+
+    def insertionSort(self):
+        """
+            A method to sort items in order
+        """
+        for i in range(1, len(self.items)):
+            key = self.items[i]
+            utilityJ = self.utilities[i]
+            j = i - 1
+            while j >= 0 and key < self.items[j]:
+                self.items[j + 1] = self.items[j]
+                self.utilities[j + 1] = self.utilities[j]
+                j -= 1
+            self.items[j + 1] = key
+            self.utilities[j + 1] = utilityJ
+
+
+def projectDatabase(transactions, item):
+    """
+    Create the projected database of an item.
+    Identical projected transactions are merged through a dict keyed on the bytes of their items, so they do not
+    need to be adjacent. The offset of every transaction containing the item is moved to the item, as the
+    EFIM style miners expect for the next items to explore.
+
+    :param transactions: packed transactions of the database of the prefix
+    :type transactions: list
+    :param item: the item to extend the prefix with
+    :type item: int
+    :return: the projected transactions, the utility and the support of the prefix extended with the item
+    :rtype: tuple
+    """
+    merged = {}
+    utility = 0
+    support = 0
+    for transaction in transactions:
+        position = transaction.findItem(item)
+        if position == -1:
+            continue
+        support += transaction.support
+        if position == transaction.end - 1:
+            utility += transaction.utilities[position] + transaction.prefixUtility
+        else:
+            projectedTransaction = transaction.projectTransaction(position)
+            utility += projectedTransaction.prefixUtility
+            key = projectedTransaction.items[projectedTransaction.offset:projectedTransaction.end].tobytes()
+            previousTransaction = merged.get(key)
+            if previousTransaction is None:
+                merged[key] = projectedTransaction
+            else:
+                merged[key] = previousTransaction.merge(projectedTransaction)
+        transaction.offset = position
+    return list(merged.values()), utility, support
+
+
+def sortKey(transaction):
+    """
+    Key ordering transactions by their items read from the last one, larger items first and shorter
+    transactions first when one is a suffix of the other
+
+    :param transaction: an unpacked transaction
+    :type transaction: Transaction
+    :rtype: tuple
+    """
+    return tuple([-item for item in reversed(transaction.items[:transaction.end])])
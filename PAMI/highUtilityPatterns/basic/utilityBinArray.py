@@ -0,0 +1,159 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+import numpy as _np
+
+
+def _flatten(transactions):
+    """
+    Concatenate the items and utilities of the transactions, between their offset and end
+
+    :param transactions: packed or unpacked transactions
+    :type transactions: list
+    :return: items, utilities and length of every transaction
+    :rtype: tuple
+    """
+    items = _array('i')
+    utilities = _array('q')
+    lengths = _array('q')
+    for transaction in transactions:
+        items.extend(transaction.items[transaction.offset:transaction.end])
+        utilities.extend(transaction.utilities[transaction.offset:transaction.end])
+        lengths.append(transaction.end - transaction.offset)
+    return (_np.frombuffer(items, dtype=_np.int32), _np.frombuffer(utilities, dtype=_np.int64),
+            _np.frombuffer(lengths, dtype=_np.int64))
+
+
+def _suffixSums(utilities, lengths):
+    """
+    Reverse cumulative sums of the utilities inside every transaction, the sum at a position including its own
+    utility
+
+    :param utilities: utilities of the flat transactions
+    :type utilities: numpy.ndarray
+    :param lengths: length of every transaction
+    :type lengths: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+    prefixSums = _np.zeros(len(utilities) + 1, dtype=_np.int64)
+    _np.cumsum(utilities, out=prefixSums[1:])
+    return _np.repeat(prefixSums[_np.cumsum(lengths)], lengths) - prefixSums[:-1]
+
+
+def _perTransaction(transactions, attribute, lengths):
+    """
+    Repeat an attribute of every transaction for each of its items
+
+    :param transactions: the transactions
+    :type transactions: list
+    :param attribute: transactionUtility or prefixUtility
+    :type attribute: str
+    :param lengths: length of every transaction
+    :type lengths: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+    values = _np.fromiter((getattr(transaction, attribute) for transaction in transactions), dtype=_np.int64,
+                          count=len(transactions))
+    return _np.repeat(values, lengths)
+
+
+def localUtilities(transactions, maxItem, pmus=False):
+    """
+    Calculate the local utility of every item, the sum of the utilities of the transactions containing it
+
+    :param transactions: unpacked transactions of the database
+    :type transactions: list
+    :param maxItem: the largest item
+    :type maxItem: int
+    :param pmus: sum the pmus of the items instead of the transaction utilities
+    :type pmus: bool
+    :return: local utility of the items 0 to maxItem
+    :rtype: numpy.ndarray
+    """
+    items, utilities, lengths = _flatten(transactions)
+    localUtility = _np.zeros(maxItem + 1, dtype=_np.int64)
+    if pmus:
+        values = _np.fromiter((pmu for transaction in transactions for pmu in transaction.pmus), dtype=_np.int64,
+                              count=len(items))
+    else:
+        values = _perTransaction(transactions, 'transactionUtility', lengths)
+    _np.add.at(localUtility, items, values)
+    return localUtility
+
+
+def itemUtilities(transactions, maxItem):
+    """
+    Calculate the support and the utility of every item
+
+    :param transactions: unpacked transactions of the database
+    :type transactions: list
+    :param maxItem: the largest item
+    :type maxItem: int
+    :return: support and utility of the items 0 to maxItem
+    :rtype: tuple
+    """
+    items, utilities, lengths = _flatten(transactions)
+    utility = _np.zeros(maxItem + 1, dtype=_np.int64)
+    _np.add.at(utility, items, utilities)
+    return _np.bincount(items, minlength=maxItem + 1).astype(_np.int64), utility
+
+
+def subtreeUtilities(transactions, maxItem):
+    """
+    Calculate the subtree utility of every item, the utility of the item and of the items after it in the
+    transactions containing it
+
+    :param transactions: unpacked transactions of the database, with items in increasing order
+    :type transactions: list
+    :param maxItem: the largest item
+    :type maxItem: int
+    :return: subtree utility of the items 0 to maxItem
+    :rtype: numpy.ndarray
+    """
+    items, utilities, lengths = _flatten(transactions)
+    subtreeUtility = _np.zeros(maxItem + 1, dtype=_np.int64)
+    _np.add.at(subtreeUtility, items, _suffixSums(utilities, lengths))
+    return subtreeUtility
+
+
+def upperBounds(transactions, itemsToKeep, maxItem):
+    """
+    Calculate the local and subtree utilities of the items to keep in a projected database.
+    The items not kept are ignored in the remaining utilities, as the item by item scan of EFIM does.
+
+    :param transactions: transactions of the projected database
+    :type transactions: list
+    :param itemsToKeep: the promising items
+    :type itemsToKeep: list
+    :param maxItem: the largest item
+    :type maxItem: int
+    :return: local and subtree utility of the items 0 to maxItem, zero for the items not kept
+    :rtype: tuple
+    """
+    items, utilities, lengths = _flatten(transactions)
+    keep = _np.zeros(maxItem + 1, dtype=bool)
+    keep[itemsToKeep] = True
+    kept = keep[items]
+    utilities = _np.where(kept, utilities, 0)
+    prefixUtilities = _perTransaction(transactions, 'prefixUtility', lengths)
+    localUtilityValues = _perTransaction(transactions, 'transactionUtility', lengths) + prefixUtilities
+    subtreeUtilityValues = _suffixSums(utilities, lengths) + prefixUtilities
+    items = items[kept]
+    localUtility = _np.zeros(maxItem + 1, dtype=_np.int64)
+    subtreeUtility = _np.zeros(maxItem + 1, dtype=_np.int64)
+    _np.add.at(localUtility, items, localUtilityValues[kept])
+    _np.add.at(subtreeUtility, items, subtreeUtilityValues[kept])
+    return localUtility, subtreeUtility
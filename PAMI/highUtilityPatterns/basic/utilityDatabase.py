@@ -0,0 +1,274 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os as _os
+from array import array as _array
+from urllib.request import urlopen as _urlopen
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase
+from PAMI.extras.DF2DB.transactionDatabase import isSparseMatrix as _isSparseMatrix
+
+
+def _parseLine(line, sep):
+    """
+    Parse one line of a utility database, items:transactionUtility:utilities
+
+    :param line: the line
+    :type line: str
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :return: items, utilities and transaction utility, or None for an empty line
+    :rtype: tuple
+    """
+    line = line.strip()
+    if not line:
+        return None
+    parts = line.split(':')
+    items = [x for x in parts[0].strip().split(sep) if x]
+    utilities = [int(x) for x in parts[2].strip().split(sep) if x]
+    return items, utilities, int(parts[1])
+
+
+def readUtilityTransactions(iFile, sep='\t'):
+    """
+    Read the transactions of a utility database one at a time, each line being parsed once.
+    iFile is a file path, a URL or a DataFrame with the columns Transactions, Utilities and, optionally,
+    TransactionUtility (or UtilitySum), the sum of the utilities being used when it is missing.
+
+    :param iFile: the utility database
+    :type iFile: str or pandas.DataFrame
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :return: generator of the items, utilities and transaction utility of every transaction
+    :rtype: generator
+    """
+    if isinstance(iFile, _pd.DataFrame):
+        columns = iFile.columns.values.tolist()
+        transactionUtilities = None
+        for column in ('TransactionUtility', 'UtilitySum'):
+            if column in columns:
+                transactionUtilities = iFile[column].tolist()
+        for row, (items, utilities) in enumerate(zip(iFile['Transactions'].tolist(), iFile['Utilities'].tolist())):
+            if isinstance(items, str):
+                items = [x for x in items.strip().split(sep) if x]
+            if isinstance(utilities, str):
+                utilities = [x for x in utilities.strip().split(sep) if x]
+            items = [str(x) for x in items]
+            utilities = [int(x) for x in utilities]
+            if transactionUtilities is None:
+                yield items, utilities, sum(utilities)
+            else:
+                yield items, utilities, int(transactionUtilities[row])
+    elif _validators.url(iFile):
+        for line in _urlopen(iFile):
+            transaction = _parseLine(line.decode("utf-8"), sep)
+            if transaction is not None:
+                yield transaction
+    else:
+        with open(iFile, 'r', encoding='utf-8') as f:
+            for line in f:
+                transaction = _parseLine(line, sep)
+                if transaction is not None:
+                    yield transaction
+
+
+class UtilityDatabase:
+    """
+        A utility database stored as flat arrays, items are numbered from 1 in the order of their first occurrence.
+        Transaction i holds the items items[bounds[i]:bounds[i + 1]] with the utilities at the same positions.
+
+    Attributes:
+    ----------
+        items: numpy.ndarray
+            item ids of all transactions, one transaction after the other
+        utilities: numpy.ndarray
+            utilities of the items
+        bounds: numpy.ndarray
+            start position of every transaction, followed by the total number of items
+        transactionUtilities: numpy.ndarray
+            transaction utility of every transaction
+        itemNames: list
+            name of every item id, itemNames[0] is unused
+
+    Methods:
+    --------
+        fromTransactions(transactions)
+            Store transactions given as items, utilities and transaction utility
+        read(iFile, sep, cache)
+            Read a utility database, optionally through a binary sidecar file
+        save(path) / load(path)
+            Write and read the arrays in the numpy npz format
+        transactions(names)
+            Iterate over the transactions
+        getItemIds()
+            return the id of every item name
+        getTransactionWeightedUtilities()
+            return the TWU of every item id
+    """
+
+    _cacheSuffix = '.udb.npz'
+
+    def __init__(self, items, utilities, bounds, transactionUtilities, itemNames):
+        self.items = items
+        self.utilities = utilities
+        self.bounds = bounds
+        self.transactionUtilities = transactionUtilities
+        self.itemNames = itemNames
+
+    def __len__(self):
+        return len(self.transactionUtilities)
+
+    @classmethod
+    def fromTransactions(cls, transactions):
+        """
+            Store transactions given one at a time
+
+            :param transactions: items, utilities and transaction utility of every transaction
+            :type transactions: iterable
+            :rtype: UtilityDatabase
+        """
+        ids = {}
+        itemNames = [None]
+        items = _array('i')
+        utilities = _array('q')
+        bounds = _array('q', [0])
+        transactionUtilities = _array('q')
+        for transactionItems, transactionUtilityValues, transactionUtility in transactions:
+            for item in transactionItems:
+                itemId = ids.get(item)
+                if itemId is None:
+                    itemId = ids[item] = len(itemNames)
+                    itemNames.append(item)
+                items.append(itemId)
+            utilities.extend(transactionUtilityValues)
+            bounds.append(len(items))
+            transactionUtilities.append(transactionUtility)
+        return cls(_np.array(items, dtype=_np.int32), _np.array(utilities, dtype=_np.int64),
+                   _np.array(bounds, dtype=_np.int64), _np.array(transactionUtilities, dtype=_np.int64), itemNames)
+
+    @classmethod
+    def read(cls, iFile, sep='\t', cache=False):
+        """
+            Read a utility database.
+            With cache, the arrays of a local file are saved in the sidecar file iFile + '.udb.npz' and read from it
+            by the next runs, as long as the size and modification time of iFile and the separator are unchanged.
+
+            :param iFile: file path, URL, DataFrame, an already read UtilityDatabase, or in-memory transactions with
+                utilities, whose arrays are used directly
+            :type iFile: str or pandas.DataFrame or UtilityDatabase or TransactionDatabase or scipy.sparse matrix
+            :param sep: separator of the items and of the utilities
+            :type sep: str
+            :param cache: use the binary sidecar file
+            :type cache: bool
+            :rtype: UtilityDatabase
+        """
+        if isinstance(iFile, UtilityDatabase):
+            return iFile
+        if isinstance(iFile, _TransactionDatabase) or _isSparseMatrix(iFile):
+            return _TransactionDatabase.read(iFile).toUtilityDatabase()
+        if not cache or not isinstance(iFile, str) or _validators.url(iFile):
+            return cls.fromTransactions(readUtilityTransactions(iFile, sep))
+        status = _os.stat(iFile)
+        key = '%d:%d:%s' % (status.st_size, status.st_mtime_ns, sep)
+        sidecar = iFile + cls._cacheSuffix
+        if _os.path.exists(sidecar):
+            database, sidecarKey = cls._load(sidecar)
+            if sidecarKey == key:
+                return database
+        database = cls.fromTransactions(readUtilityTransactions(iFile, sep))
+        try:
+            database._save(sidecar, key)
+        except OSError:
+            pass
+        return database
+
+    def _save(self, path, key):
+        names = '\n'.join(self.itemNames[1:]).encode('utf-8')
+        with open(path, 'wb') as f:
+            _np.savez(f, items=self.items, utilities=self.utilities, bounds=self.bounds,
+                      transactionUtilities=self.transactionUtilities, itemNames=_np.frombuffer(names, dtype=_np.uint8),
+                      numItems=_np.array([len(self.itemNames) - 1]), key=_np.frombuffer(key.encode('utf-8'), _np.uint8))
+
+    @classmethod
+    def _load(cls, path):
+        with _np.load(path) as data:
+            itemNames = [None]
+            if data['numItems'][0] > 0:
+                itemNames += data['itemNames'].tobytes().decode('utf-8').split('\n')
+            database = cls(data['items'], data['utilities'], data['bounds'], data['transactionUtilities'], itemNames)
+            return database, data['key'].tobytes().decode('utf-8')
+
+    def save(self, path):
+        """
+            Write the database in the numpy npz format
+
+            :param path: the output file
+            :type path: str
+        """
+        self._save(path, '')
+
+    @classmethod
+    def load(cls, path):
+        """
+            Read a database written by save()
+
+            :param path: the input file
+            :type path: str
+            :rtype: UtilityDatabase
+        """
+        return cls._load(path)[0]
+
+    def transactions(self, names=False, chunkSize=1 << 16):
+        """
+            Iterate over the transactions, chunkSize transactions being converted to lists at a time
+
+            :param names: give the item names instead of the item ids
+            :type names: bool
+            :param chunkSize: number of transactions converted at a time
+            :type chunkSize: int
+            :return: generator of the items, utilities and transaction utility of every transaction
+            :rtype: generator
+        """
+        for first in range(0, len(self), chunkSize):
+            last = min(first + chunkSize, len(self))
+            start = int(self.bounds[first])
+            bounds = (self.bounds[first:last + 1] - start).tolist()
+            items = self.items[start:bounds[-1] + start].tolist()
+            utilities = self.utilities[start:bounds[-1] + start].tolist()
+            transactionUtilities = self.transactionUtilities[first:last].tolist()
+            if names:
+                items = [self.itemNames[item] for item in items]
+            for i in range(last - first):
+                yield items[bounds[i]:bounds[i + 1]], utilities[bounds[i]:bounds[i + 1]], transactionUtilities[i]
+
+    def getItemIds(self):
+        """
+            A method to return the id of every item name
+
+            :rtype: dict
+        """
+        return {name: itemId for itemId, name in enumerate(self.itemNames) if itemId > 0}
+
+    def getTransactionWeightedUtilities(self):
+        """
+            A method to return the TWU of every item id, an item repeated in a transaction is counted again
+
+            :rtype: numpy.ndarray
+        """
+        twu = _np.zeros(len(self.itemNames), dtype=_np.int64)
+        _np.add.at(twu, self.items, _np.repeat(self.transactionUtilities, _np.diff(self.bounds)))
+        return twu
@@ -0,0 +1,443 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+from PAMI.highUtilityPatterns.topk import abstract as _ab
+from PAMI.highUtilityPatterns.basic.EFIM import _Dataset
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction as _Transaction
+from PAMI.highUtilityPatterns.basic.projectedTransaction import projectDatabase as _projectDatabase
+from PAMI.highUtilityPatterns.basic.projectedTransaction import sortKey as _sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import itemUtilities as _itemUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import localUtilities as _localUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import subtreeUtilities as _subtreeUtilities
+from PAMI.highUtilityPatterns.basic.utilityBinArray import upperBounds as _upperBounds
+from PAMI.highUtilityPatterns.topk.thresholdRaising import TopKPatterns as _TopKPatterns
+from PAMI.highUtilityPatterns.topk.thresholdRaising import kthLargest as _kthLargest
+from PAMI.highUtilityPatterns.topk.thresholdRaising import pairUtilities as _pairUtilities
+
+
+class TKEH(_ab._utilityPatterns):
+    """
+    TKEH mines the top-k High Utility ItemSets of a transactional database with the search of EFIM.
+    As minUtil is not known, it starts from one and is raised without losing any of the top-k itemsets:
+    to the k-th largest real utility of the items (RIU), then to the k-th largest utility of the items and of the
+    pairs of items in the co-occurrence matrix (CUD), and during the search to the utility of the k-th itemset found.
+
+    Reference:
+    ---------
+        Singh, K., Singh, S.S., Kumar, A. et al. TKEH: an efficient algorithm for mining top-k high utility itemsets.
+        Appl Intell 49, 1078–1097 (2019). https://doi.org/10.1007/s10489-018-1316-x
+
+    Attributes:
+    -----------
+        iFile : file
+            Name of the input file to mine the top-k high utility patterns
+        oFile : file
+            Name of the output file to store the top-k high utility patterns
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        startTime:float
+            To record the start time of the mining process
+        endTime:float
+            To record the completion time of the mining process
+        k : int
+            The user given number of patterns
+        minUtil : int
+            The utility threshold, raised during the mining process
+        cache : bool
+            Keep the database read from a local file in a binary sidecar file, read instead of the text by the next
+            runs while the file is unchanged
+        topK: TopKPatterns
+            The k patterns with the highest utility found so far
+        candidateCount: int
+             Number of candidates
+        realItemUtilities: numpy.ndarray
+             A map to hold the utility of the items in database
+        utilityBinArrayLU: list
+             A map to hold the local utility values of the items in database
+        utilityBinArraySU: list
+            A map to hold the subtree utility values of the items is database
+        oldNamesToNewNames: list
+            A map which contains old names, new names of items as key value pairs
+        newNamesToOldNames: list
+            A map which contains new names, old names of items as key value pairs
+        patternCount: int
+            Number of patterns found with a utility above the threshold of that time
+        itemsToKeep: list
+            keep only the promising items ie items having local utility values greater than or equal to minUtil
+        itemsToExplore: list
+            list of items that have subtreeUtility value greater than or equal to minUtil
+
+    Methods :
+    -------
+        startMine()
+                Mining process will start from here
+        getPatterns()
+                Complete set of patterns will be retrieved with this function
+        savePatterns(oFile)
+                Complete set of patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+                Complete set of patterns will be loaded in to a dataframe
+        getMemoryUSS()
+                Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+                Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+               Total amount of runtime taken by the mining process will be retrieved from this function
+        backTrackingTKEH(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+               A method to mine the top-k HUIs Recursively
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+               A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
+        output(tempPosition, utility)
+               A method to add a high-utility itemSet to the top-k patterns and raise minUtil
+        raiseThresholdWithPairs(transactions)
+               A method to raise minUtil with the utilities of the items and pairs of items
+        useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
+              A method to calculate the sub tree utility values for single items
+        sortDatabase(self, transactions)
+              A Method to sort transaction
+        useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
+             A method to calculate local utility values and real utility values for single itemsets
+
+    Executing the code on terminal :
+    -------
+        Format: python3 TKEH.py <inputFile> <outputFile> <k> <sep>
+        Examples: python3 TKEH.py sampleTDB.txt output.txt 10  (it will consider "\t" as separator)
+                  python3 TKEH.py sampleTDB.txt output.txt 10 , (it will consider "," as separator)
+
+    Sample run of importing the code:
+    -------------------------------
+
+        from PAMI.highUtilityPatterns.topk import TKEH as alg
+
+        obj=alg.TKEH("input.txt",10)
+
+        obj.startMine()
+
+        Patterns = obj.getPatterns()
+
+        print("Total number of top-k high utility Patterns:", len(Patterns))
+
+        obj.savePatterns("output")
+
+        memUSS = obj.getMemoryUSS()
+
+        print("Total Memory in USS:", memUSS)
+
+        memRSS = obj.getMemoryRSS()
+
+        print("Total Memory in RSS", memRSS)
+
+        run = obj.getRuntime()
+
+        print("Total ExecutionTime in seconds:", run)
+
+    Credits:
+    -------
+        The complete program was written by pradeep pallikila under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _candidateCount = 0
+    _realItemUtilities = {}
+    _utilityBinArrayLU = {}
+    _utilityBinArraySU = {}
+    _oldNamesToNewNames = {}
+    _newNamesToOldNames = {}
+    _temp = [0] * 5000
+    _patternCount = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _sep = "\t"
+    _cache = False
+    _k = 0
+    _minUtil = 0
+    _topK = None
+    _memoryUSS = float()
+    _memoryRSS = float()
+
+    def __init__(self, iFile, k, sep="\t", cache=False):
+        super().__init__(iFile, k, sep)
+        self._sep = sep
+        self._cache = cache
+        self._candidateCount = 0
+        self._realItemUtilities = {}
+        self._utilityBinArrayLU = {}
+        self._utilityBinArraySU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._temp = [0] * 5000
+        self._patternCount = 0
+        self._endTime = float()
+        self._finalPatterns = {}
+        self._minUtil = 0
+        self._topK = None
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+
+    def startMine(self):
+        self._startTime = _ab._time.time()
+        self._k = int(self._k)
+        self._dataset = _Dataset(self._iFile, self._sep, self._cache)
+        # itemSets occurring in the database have a positive utility, so minUtil starts from 1
+        self._topK = _TopKPatterns(self._k, 1)
+        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
+        self._topK.raiseThreshold(_kthLargest(self._realItemUtilities[1:], self._k))
+        self._minUtil = self._topK.minUtil
+        itemsToKeep = []
+        for key in range(1, len(self._utilityBinArrayLU)):
+            if self._utilityBinArrayLU[key] >= self._minUtil:
+                itemsToKeep.append(key)
+        itemsToKeep = sorted(itemsToKeep, key=lambda x: self._utilityBinArrayLU[x])
+        currentName = 1
+        for idx, item in enumerate(itemsToKeep):
+            self._oldNamesToNewNames[item] = currentName
+            self._newNamesToOldNames[currentName] = item
+            itemsToKeep[idx] = currentName
+            currentName += 1
+        for transaction in self._dataset.getTransactions():
+            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
+        self._sortDatabase(self._dataset.getTransactions())
+        emptyTransactionCount = 0
+        for transaction in self._dataset.getTransactions():
+            if len(transaction.getItems()) == 0:
+                emptyTransactionCount += 1
+        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
+        self._raiseThresholdWithPairs(self._dataset.getTransactions())
+        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
+        itemsToKeep = [item for item in itemsToKeep
+                       if self._utilityBinArrayLU[self._newNamesToOldNames[item]] >= self._minUtil]
+        itemsToExplore = []
+        for item in itemsToKeep:
+            if self._utilityBinArraySU[item] >= self._minUtil:
+                itemsToExplore.append(item)
+        self._dataset.transactions = _Transaction.pack(self._dataset.getTransactions())
+        self._backTrackingTKEH(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._finalPatterns = self._topK.getPatterns()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Top-k High Utility patterns were generated successfully using TKEH algorithm")
+
+    def _raiseThresholdWithPairs(self, transactions):
+        """
+            A method to raise minUtil to the k-th largest utility of the items and of the pairs of items.
+            Items and pairs are distinct itemsets, so at least k itemsets have a utility above that value.
+
+            Attributes:
+            ----------
+            :param transactions: the revised transactions of the database
+            :type transactions: list
+        """
+        first, second, utilities = _pairUtilities(transactions)
+        utilities = _ab._np.concatenate([utilities, self._realItemUtilities[1:]])
+        self._topK.raiseThreshold(_kthLargest(utilities, self._k))
+        self._minUtil = self._topK.minUtil
+
+    def _backTrackingTKEH(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+        """
+            A method to mine the top-k HUIs Recursively, minUtil may be raised by every itemSet found
+
+            Attributes:
+            ----------
+            :param transactionsOfP: the list of transactions containing the current prefix P
+            :type transactionsOfP: list
+            :param itemsToKeep: the list of secondary items in the p-projected database
+            :type itemsToKeep: list
+            :param itemsToExplore: the list of primary items in the p-projected database
+            :type itemsToExplore: list
+            :param prefixLength: current prefixLength
+            :type prefixLength: int
+        """
+        self._candidateCount += len(itemsToExplore)
+        positions = {item: idx for idx, item in enumerate(itemsToKeep)}
+        for e in itemsToExplore:
+            transactionsPe, utilityPe, _ = _projectDatabase(transactionsOfP, e)
+            self._temp[prefixLength] = self._newNamesToOldNames[e]
+            if utilityPe >= self._minUtil:
+                self._output(prefixLength, utilityPe)
+            j = positions[e]
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+            newItemsToKeep = []
+            newItemsToExplore = []
+            for l in range(j + 1, len(itemsToKeep)):
+                itemK = itemsToKeep[l]
+                if self._utilityBinArraySU[itemK] >= self._minUtil:
+                    newItemsToExplore.append(itemK)
+                    newItemsToKeep.append(itemK)
+                elif self._utilityBinArrayLU[itemK] >= self._minUtil:
+                    newItemsToKeep.append(itemK)
+            if len(transactionsPe) != 0:
+                self._backTrackingTKEH(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep):
+        """
+            A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P U {e}
+
+            Attributes:
+            -----------
+            :param transactionsPe: transactions the projected database for P U {e}
+            :type transactionsPe: list
+            :param j:he position of e in the list of promising items
+            :type j:int
+            :param itemsToKeep :the list of promising items
+            :type itemsToKeep: list
+
+        """
+        self._utilityBinArrayLU, self._utilityBinArraySU = _upperBounds(transactionsPe, itemsToKeep[j + 1:],
+                                                                        len(self._newNamesToOldNames))
+
+    def _output(self, tempPosition, utility):
+        """
+         Method to add an itemSet to the top-k patterns, minUtil is raised when k patterns are held
+
+         Attributes:
+         ----------
+         :param tempPosition: position of last item
+         :type tempPosition : int
+         :param utility: total utility of itemSet
+         :type utility: int
+        """
+        self._patternCount += 1
+        s1 = ""
+        for i in range(0, tempPosition+1):
+            s1 += self._dataset.intToStr.get((self._temp[i]))
+            if i != tempPosition:
+                s1 += " "
+        self._topK.add(s1, utility)
+        self._minUtil = self._topK.minUtil
+
+    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
+        """
+        Scan the initial database to calculate the subtree utility of each items using a utility-bin array
+
+        Attributes:
+        ----------
+        :param dataset: the transaction database
+        :type dataset: list
+        """
+        self._utilityBinArraySU = _subtreeUtilities(dataset.getTransactions(), len(self._newNamesToOldNames))
+
+    def _sortDatabase(self, transactions):
+        """
+            A Method to sort transaction
+
+            Attributes:
+            ----------
+            :param transactions: transaction of items
+            :type transactions: Transaction
+            :return: sorted transactions
+            :rtype: Transactions
+        """
+        transactions.sort(key=_sortKey)
+
+    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
+        """
+            A method to calculate local utility and real utility of single itemsets
+            Attributes:
+            ----------
+            :param dataset: the transaction database
+            :type dataset: database
+
+        """
+        self._utilityBinArrayLU = _localUtilities(dataset.getTransactions(), dataset.getMaxItem())
+        _, self._realItemUtilities = _itemUtilities(dataset.getTransactions(), dataset.getMaxItem())
+
+    def getPatternsAsDataFrame(self):
+        """Storing final patterns in a dataframe
+
+        :return: returning patterns in a dataframe
+        :rtype: pd.DataFrame
+            """
+        dataFrame = {}
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a, b])
+            dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Utility'])
+
+        return dataFrame
+
+    def getPatterns(self):
+        """ Function to send the top-k patterns after completion of the mining process
+
+        :return: returning patterns ordered by decreasing utility
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def savePatterns(self, outFile):
+        """The top-k patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: file
+        """
+        self.oFile = outFile
+        writer = open(self.oFile, 'w+')
+        for x, y in self._finalPatterns.items():
+            patternsAndSupport = str(x) + " : " + str(y)
+            writer.write("%s \n" % patternsAndSupport)
+
+    def getMemoryUSS(self):
+        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+       """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """Calculating the total amount of runtime taken by the mining process
+
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+       """
+        return self._endTime-self._startTime
+
+
+if __name__ == '__main__':
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:    #includes separator
+            _ap = TKEH(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
+            _ap = TKEH(_ab._sys.argv[1], int(_ab._sys.argv[3]))
+        _ap.startMine()
+        _patterns = _ap.getPatterns()
+        print("Total number of top-k High Utility Patterns:", len(_patterns))
+        _ap.savePatterns(_ab._sys.argv[2])
+        _memUSS = _ap.getMemoryUSS()
+        print("Total Memory in USS:", _memUSS)
+        _memRSS = _ap.getMemoryRSS()
+        print("Total Memory in RSS", _memRSS)
+        _run = _ap.getRuntime()
+        print("Total ExecutionTime in seconds:", _run)
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -0,0 +1,162 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import heapq as _heapq
+import numpy as _np
+
+
+class TopKPatterns:
+    """
+        A bounded min-heap holding the k patterns with the highest utility found so far.
+        Once k patterns are held, the root of the heap is the utility threshold of the top-k miners.
+
+    Attributes:
+    ----------
+        k: int
+            number of patterns to keep
+        minUtil: int
+            current threshold, raised to the root of the heap when it is full
+        heap: list
+            (utility, pattern) entries, the smallest utility at the root
+
+    Methods:
+    --------
+        raiseThreshold(utility)
+            raise minUtil to a lower bound of the utility of the k-th pattern found by other means
+        add(pattern, utility)
+            insert a pattern if it belongs to the current top-k patterns
+        getPatterns()
+            return the patterns ordered by decreasing utility
+    """
+    __slots__ = ('k', 'minUtil', 'heap')
+
+    def __init__(self, k, minUtil=0):
+        self.k = k
+        self.minUtil = minUtil
+        self.heap = []
+
+    def raiseThreshold(self, utility):
+        """
+            A method to raise minUtil, it is never lowered
+
+            :param utility: a lower bound of the utility of the k-th pattern
+            :type utility: int
+        """
+        if utility > self.minUtil:
+            self.minUtil = utility
+
+    def add(self, pattern, utility):
+        """
+            A method to insert a pattern in O(log k) time
+
+            :param pattern: the pattern
+            :type pattern: str
+            :param utility: utility of the pattern
+            :type utility: int
+            :return: True if the pattern was kept
+            :rtype: bool
+        """
+        if utility < self.minUtil or self.k <= 0:
+            return False
+        if len(self.heap) < self.k:
+            _heapq.heappush(self.heap, (utility, pattern))
+        elif utility > self.heap[0][0]:
+            _heapq.heapreplace(self.heap, (utility, pattern))
+        else:
+            return False
+        if len(self.heap) == self.k:
+            self.raiseThreshold(self.heap[0][0])
+        return True
+
+    def getPatterns(self):
+        """
+            A method to return the patterns ordered by decreasing utility
+
+            :rtype: dict
+        """
+        return {pattern: utility for utility, pattern in sorted(self.heap, reverse=True)}
+
+
+def kthLargest(values, k):
+    """
+    Return the k-th largest value, or 0 when there are fewer than k values
+
+    :param values: utilities of distinct itemsets
+    :type values: list or numpy.ndarray
+    :param k: the rank
+    :type k: int
+    :rtype: int
+    """
+    values = _np.asarray(values, dtype=_np.int64)
+    if k <= 0 or len(values) < k:
+        return 0
+    return int(_np.partition(values, len(values) - k)[len(values) - k])
+
+
+def _sumPairs(pairs, values):
+    """
+    Sum the values of equal pair keys
+
+    :param pairs: pair keys
+    :type pairs: numpy.ndarray
+    :param values: utility of every key
+    :type values: numpy.ndarray
+    :return: distinct keys in increasing order and their summed values
+    :rtype: tuple
+    """
+    if len(pairs) == 0:
+        return pairs, values
+    order = _np.argsort(pairs, kind='stable')
+    pairs, values = pairs[order], values[order]
+    starts = _np.flatnonzero(_np.r_[True, pairs[1:] != pairs[:-1]])
+    return pairs[starts], _np.add.reduceat(values, starts)
+
+
+def pairUtilities(transactions, maxPairs=1 << 22):
+    """
+    Calculate the utility of every pair of items occurring together in the transactions.
+    Transactions of the same length are stacked into a matrix, so the pairs of all of them are generated at
+    once by numpy, at most maxPairs at a time. The utility of a pair is the sum of the utilities of both items
+    over the transactions containing them, which is also the utility of the 2-itemset.
+
+    :param transactions: transactions with items in increasing order, between offset and end
+    :type transactions: list
+    :param maxPairs: number of pairs generated at a time
+    :type maxPairs: int
+    :return: first items, second items and utilities of the pairs
+    :rtype: tuple
+    """
+    groups = {}
+    numItems = 1
+    for transaction in transactions:
+        length = transaction.end - transaction.offset
+        if length > 1:
+            groups.setdefault(length, []).append(transaction)
+            numItems = max(numItems, transaction.items[transaction.end - 1] + 1)
+    pairs = [_np.zeros(0, dtype=_np.int64)]
+    values = [_np.zeros(0, dtype=_np.int64)]
+    for length, group in groups.items():
+        items = _np.array([t.items[t.offset:t.end] for t in group], dtype=_np.int64)
+        utilities = _np.array([t.utilities[t.offset:t.end] for t in group], dtype=_np.int64)
+        first, second = _np.triu_indices(length, 1)
+        step = max(1, maxPairs // len(first))
+        for i in range(0, len(group), step):
+            chunkPairs = items[i:i + step, first] * numItems + items[i:i + step, second]
+            chunkValues = utilities[i:i + step, first] + utilities[i:i + step, second]
+            chunkPairs, chunkValues = _sumPairs(chunkPairs.ravel(), chunkValues.ravel())
+            pairs.append(chunkPairs)
+            values.append(chunkValues)
+    pairs, values = _sumPairs(_np.concatenate(pairs), _np.concatenate(values))
+    return pairs // numItems, pairs % numItems, values
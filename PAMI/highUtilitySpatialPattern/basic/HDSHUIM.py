@@ -1,4 +1,5 @@
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
 
 
 class _Element:
@@ -228,15 +229,7 @@ class HDSHUIM(_ab._utilityPatterns):
         """
         minUtil = self._minUtil
         self._startTime = _ab._time.time()
-        with open(self._nFile, 'r') as file1:
-            for line in file1:
-                line = line.split("\n")[0]
-                parts = line.split(self._sep)
-                item = parts[0]
-                neigh1 = set()
-                for i in range(1, len(parts)):
-                    neigh1.add(parts[i])
-                self._neighbors[item] = neigh1
+        self._neighbors = _NeighbourhoodGraph.read(self._nFile, self._sep).neighbourSets()
         with open(self._iFile, 'r') as file:
             for line in file:
                 parts = line.split(":")
@@ -1,127 +1,10 @@
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
-from functools import cmp_to_key as _cmpToKey
-
-class _Transaction:
-    """
-        A class to store Transaction of a database
-
-    Attributes:
-    ----------
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilites of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        pmus: list
-            represent the pmu (probable maximum utility) of each element in the transaction
-        prefixutility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-    Methods:
-    --------
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getPmus():
-            return pmus in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items with low Utility than minUtil
-        insertionSort():
-            A method to sort all items in the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-    
-    def __init__(self, items, utilities, transactionUtility, pmus=None):
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-        if pmus is not None:
-            self.pmus = pmus
-
-    def projectTransaction(self, offsetE):
-        """
-            A method to create new Transaction from existing till offsetE
-
-        Parameters:
-        ----------
-            :param offsetE: an offset over the original transaction for projecting the transaction
-            :type offsetE: int
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self):
-        """
-            A method to return items in transaction
-        """
-        return self.items
-
-    def getPmus(self):
-        """
-            A method to return pmus in transaction
-        """
-        return self.pmus
-
-    def getUtilities(self):
-        """
-            A method to return utilities in transaction
-        """
-        return self.utilities
-
-    # get the last position in this transaction
-    def getLastPosition(self):
-        """
-            A method to return last position in a transaction
-        """
-        return len(self.items) - 1
-
-    def removeUnpromisingItems(self, oldNamesToNewNames):
-        """
-            A method to remove items with low Utility than minUtil
-            :param oldNamesToNewNames: A map represent old namses to new names
-            :type oldNamesToNewNames: map
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self):
-        """
-            A method to sort items in order
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
+from PAMI.highUtilityPatterns.basic.parallelEFIM import mineBranches as _mineBranches
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction as _Transaction
+from PAMI.highUtilityPatterns.basic.projectedTransaction import projectDatabase as _projectDatabase
+from PAMI.highUtilityPatterns.basic.projectedTransaction import sortKey as _sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import localUtilities as _localUtilities
 
 class _Dataset:
     """
@@ -148,6 +31,8 @@ class _Dataset:
     maxItem = 0
     
     def __init__(self, datasetpath, sep):
+        self.transactions = []
+        self.maxItem = 0
         self.strToint = {}
         self.intTostr = {}
         self.cnt = 1
@@ -227,6 +112,8 @@ class SHUIM(_ab._utilityPatterns):
             To record the completion time of the mining process
         minUtil : int
             The user given minUtil
+        numWorkers: int
+            Number of processes mining the first level branches in parallel, 1 mines them serially
         highUtilityItemSets: map
             set of high utility itemSets
         candidateCount: int
@@ -239,8 +126,8 @@ class SHUIM(_ab._utilityPatterns):
             A map to hold the subtree utility values of the items is database
         newNamesToOldNames: list
             A map to store the old name corresponding to new name
-        Neighbours : map
-            A dictionary to store the neighbours of a item
+        neighbourBits : list
+            The neighbours of every item as a bitset, bit n being set for the neighbour whose new name is n
         maxMemory:Maximum memory used by this program for running
         patternCount: int
             Number of SHUI's
@@ -265,24 +152,18 @@ class SHUIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        neighbourBitsets(neighbourhood, itemsToKeep)
+               A method to store the neighbours of the promising items as bitsets
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, neighbourhood)
                A method to mine the SHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhood)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        _isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
         sortDatabase(self, transactions)
               A Method to sort transaction in the order of PMU
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to scan the database using utility bin array to calculate the pmus                   
 
@@ -299,6 +180,8 @@ class SHUIM(_ab._utilityPatterns):
 
         obj=alg.SHUIM("input.txt","Neighbours.txt",35)
 
+        # or obj=alg.SHUIM("input.txt","Neighbours.txt",35, numWorkers=4) to mine the branches in 4 processes
+
         obj.startMine()
 
         frequentPatterns = obj.getPatterns()
@@ -331,7 +214,7 @@ class SHUIM(_ab._utilityPatterns):
     _newNamesToOldNames = {}
     _strToint = {}
     _intTostr = {}
-    _Neighbours = {}
+    _neighbourBits = []
     _temp = [0] * 5000
     _maxMemory = 0
     _startTime = float()
@@ -346,30 +229,24 @@ class SHUIM(_ab._utilityPatterns):
     _minUtil = 0
     _memoryUSS = float()
     _memoryRSS = float()
+    _numWorkers = 1
     
-    def __init__(self, iFile, nFile, minUtil, sep="\t"):
+    def __init__(self, iFile, nFile, minUtil, sep="\t", numWorkers=1):
         super().__init__(iFile, nFile, minUtil, sep)
+        self._numWorkers = numWorkers
 
     def startMine(self):
         self._startTime = _ab._time.time()
         self._patternCount = 0
         self._finalPatterns = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
         self._dataset = _Dataset(self._iFile, self._sep)
-        with open(self._nFile, 'r') as o:
-            lines = o.readlines()
-            for line in lines:
-                line = line.split("\n")[0]
-                line_split = line.split(self._sep)
-                item = self._dataset.strToint.get(line_split[0])
-                lst = []
-                for i in range(1, len(line_split)):
-                    lst.append(self._dataset.strToint.get(line_split[i]))
-                self._Neighbours[item] = lst
-        o.close()
+        neighbourhood = _NeighbourhoodGraph.read(self._nFile, self._sep)
         InitialMemory = _ab._psutil.virtual_memory()[3]
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
+        for key in range(1, len(self._utilityBinArrayLU)):
             if self._utilityBinArrayLU[key] >= self._minUtil:
                 itemsToKeep.append(key)
         itemsToKeep = sorted(itemsToKeep, key=lambda x: self._utilityBinArrayLU[x])
@@ -379,6 +256,7 @@ class SHUIM(_ab._utilityPatterns):
             self._newNamesToOldNames[currentName] = item
             itemsToKeep[idx] = currentName
             currentName += 1
+        self._neighbourBitsets(neighbourhood, itemsToKeep)
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
         self._sortDatabase(self._dataset.getTransactions())
@@ -395,7 +273,12 @@ class SHUIM(_ab._utilityPatterns):
         commonitems = []
         for i in range(self._dataset.maxItem):
             commonitems.append(i)
-        self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._dataset.transactions = _Transaction.pack(self._dataset.getTransactions())
+        if self._numWorkers > 1:
+            _mineBranches(self, '_backtrackingEFIM', self._dataset.getTransactions(), itemsToKeep, itemsToExplore,
+                          self._numWorkers, -1)
+        else:
+            self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0, -1)
         finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (finalMemory - InitialMemory) / 10000
         if memory > self._maxMemory:
@@ -407,7 +290,8 @@ class SHUIM(_ab._utilityPatterns):
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
 
-    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, neighbourhood,
+                          branches=None):
         """
             A method to mine the SHUIs Recursively
 
@@ -421,83 +305,42 @@ class SHUIM(_ab._utilityPatterns):
             :type itemsToExplore: list
             :param prefixLength: current prefixLength
             :type prefixLength: int
-        """
-        self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
+            :param neighbourhood: bitset of the items neighbouring every item of P, -1 for the empty prefix
+            :type neighbourhood: int
+            :param branches: positions of itemsToExplore to mine, all of them when None
+            :type branches: list
+        """
+        if branches is None:
+            self._candidateCount += len(itemsToExplore)
+            branches = range(len(itemsToExplore))
+        for idx in branches:
+            e = itemsToExplore[idx]
             initialMemory = _ab._psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            transactionsPe, utilityPe, _ = _projectDatabase(transactionsOfP, e)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-            #print(neighbourhoodList)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhoodPe = neighbourhood & self._neighbourBits[e]
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodPe)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
                 if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
+                    if neighbourhoodPe >> itemK & 1:
                         newItemsToExplore.append(itemK)
                         newItemsToKeep.append(itemK)
                 elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
+                    if neighbourhoodPe >> itemK & 1:
                         newItemsToKeep.append(itemK)
-            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1,
+                                   neighbourhoodPe)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhood):
         """
             A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -509,51 +352,52 @@ class SHUIM(_ab._utilityPatterns):
             :type j:int
             :param itemsToKeep :the list of promising items
             :type itemsToKeep: list
+            :param neighbourhood: bitset of the items neighbouring every item of P U {e}
+            :type neighbourhood: int
 
         """
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
+        keep = set(itemsToKeep)
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = transaction.end
             i = length - 1
             while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
+                item = items[i]
+                if item in keep:
                     remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        item_neighbours = self._Neighbours[self._newNamesToOldNames[item]]
+                    # the items after item neighbouring both item and every item of P U {e}
+                    neighbours = self._neighbourBits[item] & neighbourhood
+                    if neighbours:
                         for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
+                            if neighbours >> items[k] & 1:
+                                remainingUtility += utilities[k]
 
-                    remainingUtility += transaction.getUtilities()[i]
+                    remainingUtility += utilities[i]
                     self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
                     self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
                 i -= 1
 
-    def _calculateNeighbourIntersection(self, prefixLength):
+    def _neighbourBitsets(self, neighbourhood, itemsToKeep):
         """
-            A method to find common Neighbours
+            A method to store the neighbours of every promising item as a bitset over the new names of the items
+
             Attributes:
             ----------
-                :param prefixLength: the prefix itemSet
-                :type prefixLength:int
+                :param neighbourhood: the neighbourhood of the items
+                :type neighbourhood: NeighbourhoodGraph
+                :param itemsToKeep: the new names of the promising items, 1 to their number
+                :type itemsToKeep: list
 
         """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+        names = [None] + [self._dataset.intTostr[self._newNamesToOldNames[item]] for item in itemsToKeep]
+        bitsets = neighbourhood.bitsets(names)
+        self._neighbourBits = [bitsets[name] for name in names]
+
     def _output(self, tempPosition, utility):
         """
          A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -573,47 +417,6 @@ class SHUIM(_ab._utilityPatterns):
                 s1 += " "
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1, transaction2):
-        """
-         A method to Check if two transaction are identical
-
-         Attributes:
-         ----------
-         :param  transaction1: the first transaction
-         :type  transaction1: Transaction
-         :param  transaction2:   the second transaction
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def _intersection(self, lst1, lst2):
-        """
-            A method that return the intersection of 2 list
-            :param  lst1: items neighbour to item1
-            :type lst1: list
-            :param lst2: items neighbour to item2
-            :type lst2: list
-            :return :intersection of two lists
-            :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each items using a utility-bin array
@@ -629,15 +432,12 @@ class SHUIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
-                    self._utilityBinArraySU[item] += utilities[idx]
-                    continue
-                i = idx + 1
+                neighbours = self._neighbourBits[item]
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
-                        sumSu += utilities[i]
-                    i += 1
+                if neighbours:
+                    for i in range(idx + 1, len(items)):
+                        if neighbours >> items[i] & 1:
+                            sumSu += utilities[i]
                 self._utilityBinArraySU[item] += sumSu
 
     def _sortDatabase(self, transactions):
@@ -651,50 +451,8 @@ class SHUIM(_ab._utilityPatterns):
             :return: sorted transaction
             :rtype: Transaction
         """
-        cmp_items = _cmpToKey(self._sortTransaction)
-        transactions.sort(key=cmp_items)
-
-    def _sortTransaction(self, trans1, trans2):
-        """
-            A Method to sort transaction in the order of PMU
+        transactions.sort(key=_sortKey)
 
-            Attributes:
-            ----------
-            :param trans1: the first transaction 
-            :type trans1: Transaction 
-            :param trans2:the second transaction 
-            :type trans2: Transaction
-            :return: sorted transaction
-            :rtype:    Transaction
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
 
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
@@ -705,12 +463,7 @@ class SHUIM(_ab._utilityPatterns):
             :type dataset: database
 
         """
-        for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.getPmus()[idx]
-                else:
-                    self._utilityBinArrayLU[item] = transaction.getPmus()[idx]
+        self._utilityBinArrayLU = _localUtilities(dataset.getTransactions(), dataset.getMaxItem(), pmus=True).tolist()
 
     def getPatternsAsDataFrame(self):
         """Storing final patterns in a dataframe
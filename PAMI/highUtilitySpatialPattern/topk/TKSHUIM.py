@@ -1,128 +1,8 @@
 from PAMI.highUtilitySpatialPattern.topk.abstract import *
-from functools import cmp_to_key
-import heapq
-
-class Transaction:
-    """
-        A class to store Transaction of a database
-
-    Attributes:
-    ----------
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilites of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        pmus: list
-            represent the pmu (probable maximum utility) of each element in the transaction
-        prefixutility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-    Methods:
-    --------
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getPmus():
-            return pmus in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items with low Utility than minUtil
-        insertionSort():
-            A method to sort all items in the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-    
-    def __init__(self, items, utilities, transactionUtility, pmus=None):
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-        if pmus is not None:
-            self.pmus = pmus
-
-    def projectTransaction(self, offsetE):
-        """
-            A method to create new Transaction from existing till offsetE
-
-        Parameters:
-        ----------
-            :param offsetE: an offset over the original transaction for projecting the transaction
-            :type offsetE: int
-        """
-        new_transaction = Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self):
-        """
-            A method to return items in transaction
-        """
-        return self.items
-
-    def getPmus(self):
-        """
-            A method to return pmus in transaction
-        """
-        return self.pmus
-
-    def getUtilities(self):
-        """
-            A method to return utilities in transaction
-        """
-        return self.utilities
-
-    # get the last position in this transaction
-    def getLastPosition(self):
-        """
-            A method to return last position in a transaction
-        """
-        return len(self.items) - 1
-
-    def removeUnpromisingItems(self, oldNamesToNewNames):
-        """
-            A method to remove items with low Utility than minUtil
-            :param oldNamesToNewNames: A map represent old namses to new names
-            :type oldNamesToNewNames: map
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self):
-        """
-            A method to sort items in order
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph
+from PAMI.highUtilityPatterns.basic.projectedTransaction import Transaction, projectDatabase, sortKey
+from PAMI.highUtilityPatterns.basic.utilityBinArray import itemUtilities, localUtilities
+from PAMI.highUtilityPatterns.topk.thresholdRaising import TopKPatterns, kthLargest, pairUtilities
 
 class Dataset:
     """
@@ -228,6 +108,12 @@ class TKSHUIM(utilityPatterns):
             To record the completion time of the mining process
         k : int
             The user given k value
+        minUtil : int
+            The utility threshold, raised to the utility of the k-th pattern found so far
+        topK: TopKPatterns
+            Bounded heap of the k patterns with the highest utility found so far
+        realItemUtilities: list
+            A map to hold the utility of the items in database
         candidateCount: int
              Number of candidates 
         utilityBinArrayLU: list
@@ -238,8 +124,8 @@ class TKSHUIM(utilityPatterns):
             A map to hold the subtree utility values of the items is database
         newNamesToOldNames: list
             A map to store the old name corresponding to new name
-        Neighbours : map
-            A dictionary to store the neighbours of a item
+        neighbourBits : list
+            The neighbours of every item as a bitset, bit n being set for the neighbour whose new name is n
         maxMemory: float
             Maximum memory used by this program for running
         itemsToKeep: list
@@ -263,26 +149,24 @@ class TKSHUIM(utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        neighbourBitsets(neighbourhood, itemsToKeep)
+               A method to store the neighbours of the promising items as bitsets
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, neighbourhood)
                A method to mine the TKSHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhood)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
         sortDatabase(self, transactions)
               A Method to sort transaction in the order of PMU
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
-             A method to scan the database using utility bin array to calculate the pmus                   
+             A method to scan the database using utility bin array to calculate the pmus and the utility of the items
+        raiseThresholdWithPairs(self, transactions)
+             A method to raise minUtil with the utilities of the items and of the pairs of neighbouring items
+        additemset(self, itemset, utility)
+             A method to add a pattern to the top-k patterns and raise minUtil                   
 
     Executing the code on terminal :
     -------
@@ -326,7 +210,7 @@ class TKSHUIM(utilityPatterns):
     newNamesToOldNames = {}
     strToint = {}
     intTostr = {}
-    Neighbours = {}
+    neighbourBits = []
     temp = [0] * 5000
     maxMemory = 0
     startTime = float()
@@ -339,7 +223,8 @@ class TKSHUIM(utilityPatterns):
     minUtil = 0
     memoryUSS = float()
     memoryRSS = float()
-    heapList = []
+    topK = None
+    realItemUtilities = {}
 
     def __init__(self, iFile, nFile, k, sep="\t"):
         super().__init__(iFile, nFile, k, sep)
@@ -348,21 +233,17 @@ class TKSHUIM(utilityPatterns):
         self.startTime = time.time()
         self.finalPatterns = {}
         self.dataset = Dataset(self.iFile, self.sep)
-        with open(self.nFile, 'r') as o:
-            lines = o.readlines()
-            for line in lines:
-                line = line.split("\n")[0]
-                line_split = line.split(self.sep)
-                item = self.dataset.strToint.get(line_split[0])
-                lst = []
-                for i in range(1, len(line_split)):
-                    lst.append(self.dataset.strToint.get(line_split[i]))
-                self.Neighbours[item] = lst
-        o.close()
+        neighbourhood = NeighbourhoodGraph.read(self.nFile, self.sep)
         InitialMemory = psutil.virtual_memory()[3]
+        # itemSets occurring in the database have a positive utility, so minUtil starts from 1
+        self.topK = TopKPatterns(self.k, 1)
+        self.minUtil = self.topK.minUtil
+        self.realItemUtilities = {}
         self.useUtilityBinArrayToCalculateLocalUtilityFirstTime(self.dataset)
+        self.topK.raiseThreshold(kthLargest(self.realItemUtilities[1:], self.k))
+        self.minUtil = self.topK.minUtil
         itemsToKeep = []
-        for key in self.utilityBinArrayLU.keys():
+        for key in range(1, len(self.utilityBinArrayLU)):
             if self.utilityBinArrayLU[key] >= self.minUtil:
                 itemsToKeep.append(key)
         itemsToKeep = sorted(itemsToKeep, key=lambda x: self.utilityBinArrayLU[x])
@@ -372,6 +253,7 @@ class TKSHUIM(utilityPatterns):
             self.newNamesToOldNames[currentName] = item
             itemsToKeep[idx] = currentName
             currentName += 1
+        self.neighbourBitsets(neighbourhood, itemsToKeep)
         for transaction in self.dataset.getTransactions():
             transaction.removeUnpromisingItems(self.oldNamesToNewNames)
         self.sortDatabase(self.dataset.getTransactions())
@@ -380,8 +262,10 @@ class TKSHUIM(utilityPatterns):
             if len(transaction.getItems()) == 0:
                 emptyTransactionCount += 1
         self.dataset.transactions = self.dataset.transactions[emptyTransactionCount:]
+        self.raiseThresholdWithPairs(self.dataset.getTransactions())
         self.useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self.dataset)
-        self.heapList = []
+        itemsToKeep = [item for item in itemsToKeep
+                       if self.utilityBinArrayLU[self.newNamesToOldNames[item]] >= self.minUtil]
         itemsToExplore = []
         for item in itemsToKeep:
             if self.utilityBinArraySU[item] >= self.minUtil:
@@ -389,7 +273,8 @@ class TKSHUIM(utilityPatterns):
         commonitems = []
         for i in range(self.dataset.maxItem):
             commonitems.append(i)
-        self.backtrackingEFIM(self.dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self.dataset.transactions = Transaction.pack(self.dataset.getTransactions())
+        self.backtrackingEFIM(self.dataset.getTransactions(), itemsToKeep, itemsToExplore, 0, -1)
         finalMemory = psutil.virtual_memory()[3]
         memory = (finalMemory - InitialMemory) / 10000
         if memory > self.maxMemory:
@@ -400,11 +285,10 @@ class TKSHUIM(utilityPatterns):
         self.memoryRSS = float()
         self.memoryUSS = process.memory_full_info().uss
         self.memoryRSS = process.memory_info().rss
-        for item in self.heapList:
-            self.finalPatterns[item[1]] = item[0]
+        self.finalPatterns = self.topK.getPatterns()
         print('TOP-K mining process is completed by TKSHUIM')
 
-    def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, neighbourhood):
         """
             A method to mine the TKSHUIs Recursively
 
@@ -418,82 +302,37 @@ class TKSHUIM(utilityPatterns):
             :type itemsToExplore: list
             :param prefixLength: current prefixLength
             :type prefixLength: int
+            :param neighbourhood: bitset of the items neighbouring every item of P, -1 for the empty prefix
+            :type neighbourhood: int
         """
         self.candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             initialMemory = psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self.is_equal(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            transactionsPe, utilityPe, _ = projectDatabase(transactionsOfP, e)
             self.temp[prefixLength] = self.newNamesToOldNames[e]
             if utilityPe >= self.minUtil:
                 self.output(prefixLength, utilityPe)
-            neighbourhoodList = self.calculateNeighbourIntersection(prefixLength)
-            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhoodPe = neighbourhood & self.neighbourBits[e]
+            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodPe)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
                 if self.utilityBinArraySU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
+                    if neighbourhoodPe >> itemK & 1:
                         newItemsToExplore.append(itemK)
                         newItemsToKeep.append(itemK)
                 elif self.utilityBinArrayLU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
+                    if neighbourhoodPe >> itemK & 1:
                         newItemsToKeep.append(itemK)
-            self.backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+            self.backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1,
+                                  neighbourhoodPe)
             finalMemory = psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self.maxMemory < memory:
                 self.maxMemory = memory
 
-    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhood):
         """
             A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -505,51 +344,52 @@ class TKSHUIM(utilityPatterns):
             :type j:int
             :param itemsToKeep :the list of promising items
             :type itemsToKeep: list
+            :param neighbourhood: bitset of the items neighbouring every item of P U {e}
+            :type neighbourhood: int
 
         """
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self.utilityBinArrayLU[item] = 0
             self.utilityBinArraySU[item] = 0
+        keep = set(itemsToKeep)
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = transaction.end
             i = length - 1
             while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
+                item = items[i]
+                if item in keep:
                     remainingUtility = 0
-                    if self.newNamesToOldNames[item] in self.Neighbours:
-                        item_neighbours = self.Neighbours[self.newNamesToOldNames[item]]
+                    # the items after item neighbouring both item and every item of P U {e}
+                    neighbours = self.neighbourBits[item] & neighbourhood
+                    if neighbours:
                         for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self.newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
+                            if neighbours >> items[k] & 1:
+                                remainingUtility += utilities[k]
 
-                    remainingUtility += transaction.getUtilities()[i]
+                    remainingUtility += utilities[i]
                     self.utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
                     self.utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
                 i -= 1
 
-    def calculateNeighbourIntersection(self, prefixLength):
+    def neighbourBitsets(self, neighbourhood, itemsToKeep):
         """
-            A method to find common Neighbours
+            A method to store the neighbours of every promising item as a bitset over the new names of the items
+
             Attributes:
             ----------
-                :param prefixLength: the prefix itemSet
-                :type prefixLength:int
+                :param neighbourhood: the neighbourhood of the items
+                :type neighbourhood: NeighbourhoodGraph
+                :param itemsToKeep: the new names of the promising items, 1 to their number
+                :type itemsToKeep: list
 
         """
-        intersectionList = self.Neighbours.get(self.temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self.intersection(self.Neighbours[self.temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self.oldNamesToNewNames:
-                finalIntersectionList.append(self.oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+        names = [None] + [self.dataset.intTostr[self.newNamesToOldNames[item]] for item in itemsToKeep]
+        bitsets = neighbourhood.bitsets(names)
+        self.neighbourBits = [bitsets[name] for name in names]
+
     def output(self, tempPosition, utility):
         """
          A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -568,47 +408,6 @@ class TKSHUIM(utilityPatterns):
                 s1 += " "
         self.additemset(s1, utility)
 
-    def is_equal(self, transaction1, transaction2):
-        """
-         A method to Check if two transaction are identical
-
-         Attributes:
-         ----------
-         :param  transaction1: the first transaction
-         :type  transaction1: Transaction
-         :param  transaction2:   the second transaction
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def intersection(self, lst1, lst2):
-        """
-            A method that return the intersection of 2 list
-            :param  lst1: items neighbour to item1
-            :type lst1: list
-            :param lst2: items neighbour to item2
-            :type lst2: list
-            :return :intersection of two lists
-            :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each items using a utility-bin array
@@ -624,15 +423,12 @@ class TKSHUIM(utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self.utilityBinArraySU:
                     self.utilityBinArraySU[item] = 0
-                if self.newNamesToOldNames[item] not in self.Neighbours:
-                    self.utilityBinArraySU[item] += utilities[idx]
-                    continue
-                i = idx + 1
+                neighbours = self.neighbourBits[item]
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self.newNamesToOldNames[items[i]] in self.Neighbours[self.newNamesToOldNames[item]]:
-                        sumSu += utilities[i]
-                    i += 1
+                if neighbours:
+                    for i in range(idx + 1, len(items)):
+                        if neighbours >> items[i] & 1:
+                            sumSu += utilities[i]
                 self.utilityBinArraySU[item] += sumSu
 
     def sortDatabase(self, transactions):
@@ -646,50 +442,7 @@ class TKSHUIM(utilityPatterns):
             :return: sorted transaction
             :rtype: Transaction
         """
-        cmp_items = cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
-
-    def sort_transaction(self, trans1, trans2):
-        """
-            A Method to sort transaction in the order of PMU
-
-            Attributes:
-            ----------
-            :param trans1: the first transaction 
-            :type trans1: Transaction 
-            :param trans2:the second transaction 
-            :type trans2: Transaction
-            :return: sorted transaction
-            :rtype:    Transaction
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
+        transactions.sort(key=sortKey)
 
     def useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
@@ -700,43 +453,34 @@ class TKSHUIM(utilityPatterns):
             :type dataset: database
 
         """
-        utilityMatrix = defaultdict(lambda: defaultdict(int))
-        for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                if item in self.utilityBinArrayLU:
-                    self.utilityBinArrayLU[item] += transaction.getPmus()[idx]
-                else:
-                    self.utilityBinArrayLU[item] = transaction.getPmus()[idx]
-                utilityMatrix[item][item] += transaction.getUtilities()[idx]
-                if item in self.Neighbours:
-                    neighbors = self.Neighbours[item]
-                    utility = transaction.getUtilities()[idx]
-                    for i, itemj in enumerate(transaction.getItems()):
-                        if (itemj != item) and (itemj in neighbors):
-                            utilityMatrix[item][itemj] += (utility + transaction.getUtilities()[i])
-
-        for item in utilityMatrix.keys():
-            for itemj in utilityMatrix[item].keys():
-                if itemj >= item:
-                    val = utilityMatrix[item][itemj]
-                    if val != 0 and val > self.minUtil:
-                        if itemj == item:
-                            itemset = str(item)
-                        else:
-                            itemset = str(item) + str(itemj)
-                        self.additemset(itemset, val)
+        self.utilityBinArrayLU = localUtilities(dataset.getTransactions(), dataset.getMaxItem(), pmus=True).tolist()
+        self.realItemUtilities = itemUtilities(dataset.getTransactions(), dataset.getMaxItem())[1].tolist()
+
+    def raiseThresholdWithPairs(self, transactions):
+        """
+            A method to raise minUtil to the k-th largest utility of the items and of the pairs of neighbouring items.
+            A pair is a pattern found by the search when its second item, in the order of the search, is a neighbour of
+            the first one. Items and such pairs are distinct patterns, so at least k patterns have a utility above that value.
+
+            Attributes:
+            ----------
+            :param transactions: the revised transactions of the database
+            :type transactions: list
+        """
+        first, second, utilities = pairUtilities(transactions)
+        values = self.realItemUtilities[1:]
+        for itemX, itemY, utility in zip(first.tolist(), second.tolist(), utilities.tolist()):
+            if self.neighbourBits[itemX] >> itemY & 1:
+                values.append(utility)
+        self.topK.raiseThreshold(kthLargest(values, self.k))
+        self.minUtil = self.topK.minUtil
 
     def additemset(self, itemset, utility):
         """
-        adds the itemset to the priority queue
+        adds the itemset to the bounded heap of the top-k patterns in O(log k) time, minUtil follows its root
         """
-        heapq.heappush(self.heapList, (utility, itemset))
-        if len(self.heapList) > self.k:
-            while len(self.heapList) > self.k:
-                heapq.heappop(self.heapList)
-                if len(self.heapList) == 0:
-                    break
-            self.minUtil = heapq.nsmallest(1, self.heapList)[0][0]
+        self.topK.add(itemset, utility)
+        self.minUtil = self.topK.minUtil
 
     def getPatternsAsDataFrame(self):
         """Storing final patterns in a dataframe
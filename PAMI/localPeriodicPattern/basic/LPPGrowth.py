@@ -1,5 +1,7 @@
 
 from PAMI.localPeriodicPattern.basic.abstract import *
+from PAMI.localPeriodicPattern.basic.packedBitVector import createPackedTSList, bitPositions
+from PAMI.localPeriodicPattern.basic.periodicTimeInterval import calculatePTL
 
 
 class Node:
@@ -275,6 +277,7 @@ class LPPGrowth(localPeriodicPatterns):
     _localPeriodicPatterns__minDur = str()
     __tsMin = 0
     __tsMax = 0
+    __length = 0
     _localPeriodicPatterns__startTime = float()
     _localPeriodicPatterns__endTime = float()
     _localPeriodicPatterns__memoryUSS = float()
@@ -377,33 +380,7 @@ class LPPGrowth(localPeriodicPatterns):
         """
         Create tsList as bit vector from temporal data.
         """
-        # for line in self.__Database:
-        #     count = 1
-        #     bitVector = 0b1 << count
-        #     bitVector = bitVector | 0b1
-        #     self.__tsMin = int(line.pop(0))
-        #     self.__tsList = {item: bitVector for item in line}
-        #     count += 1
-        #     ts = ' '
-        count = 1
-        for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            # print(line)
-            ts = line[0]
-            for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
-            count += 1
-            self.__tsMax = int(ts)
-
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
+        self.__tsList, self.__length, self.__tsMax = createPackedTSList(self.__Database)
         self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
         self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
         self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
@@ -414,62 +391,9 @@ class LPPGrowth(localPeriodicPatterns):
         """
         PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            soPer = ' '
-            tsPre = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsMax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
+            PTL[item] = calculatePTL(bitPositions(self.__tsList[item], self.__length), self.__tsMax,
+                                     self._localPeriodicPatterns__maxPer, self._localPeriodicPatterns__maxSoPer,
+                                     self._localPeriodicPatterns__minDur, extendToEnd=True)
         self.__PTL = {k: v for k, v in PTL.items() if len(v) > 0}
         self.__items = list(self.__PTL.keys())
 
@@ -553,77 +477,19 @@ class LPPGrowth(localPeriodicPatterns):
         :type tsList: list
         :return: PTL
         """
-        start = -1
-        PTL = set()
-        tsList = sorted(tsList)
-        tsPre = tsList[0]
-        soPer = ' '
-        for ts in tsList[1:]:
-            per = ts - tsPre
-            if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                start = tsPre
-                soPer = self._localPeriodicPatterns__maxSoPer
-            if start != -1:
-                soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer:
-                    if tsPre - start >= self._localPeriodicPatterns__minDur:
-                        PTL.add((start, tsPre))
-                    start = -1
-            tsPre = ts
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, self.__tsMax))
-        return PTL
+        tsList = np.sort(np.fromiter(tsList, dtype=np.int64, count=len(tsList)))
+        return calculatePTL(tsList, self.__tsMax, self._localPeriodicPatterns__maxPer,
+                            self._localPeriodicPatterns__maxSoPer, self._localPeriodicPatterns__minDur, extendToEnd=True)
 
     def __calculatePTLbit(self, tsList):
         """
         Calculate PTL from input tsList as bit vector.
         :param tsList: It is tsList which store time stamp as bit vector.
-        :type tsList: list
+        :type tsList: numpy.ndarray
         :return: PTL
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return calculatePTL(bitPositions(tsList, self.__length), self.__tsMax, self._localPeriodicPatterns__maxPer,
+                            self._localPeriodicPatterns__maxSoPer, self._localPeriodicPatterns__minDur)
 
     def __convert(self, value):
         """
@@ -30,6 +30,7 @@ from abc import ABC, abstractmethod
 import time
 import csv
 import pandas as pd
+import numpy as np
 from collections import defaultdict
 from itertools import combinations as c
 import os
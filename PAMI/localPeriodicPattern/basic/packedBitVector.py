@@ -0,0 +1,64 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def createPackedTSList(database):
+    """
+    Create the tsList of every item as a numpy packed bit vector.
+    Bit i of a vector is set when the item occurs in the i-th transaction (counted from 1), so bit 0 is never set.
+    Vectors of all items have the same length and can be intersected with the & operator.
+
+    :param database: temporal transactions, the first element of every transaction is its timestamp
+    :type database: list
+    :return: tsList of each item, number of bits in every vector and the timestamp of the last transaction
+    :rtype: tuple
+    """
+    positions = {}
+    tsMax = 0
+    count = 1
+    for line in database:
+        for item in line[1:]:
+            if item in positions:
+                positions[item].append(count)
+            else:
+                positions[item] = [count]
+        tsMax = int(line[0])
+        count += 1
+    length = count
+    nBytes = (length + 7) >> 3
+    tsList = {}
+    for item in positions:
+        bits = np.array(positions[item], dtype=np.int64)
+        vector = np.zeros(nBytes, dtype=np.uint8)
+        np.bitwise_or.at(vector, bits >> 3, (0x80 >> (bits & 7)).astype(np.uint8))
+        tsList[item] = vector
+    return tsList, length, tsMax
+
+
+def bitPositions(vector, length):
+    """
+    Convert a packed bit vector into the sorted array of its set positions.
+
+    :param vector: packed bit vector
+    :type vector: numpy.ndarray
+    :param length: number of bits in the vector
+    :type length: int
+    :return: positions of the set bits
+    :rtype: numpy.ndarray
+    """
+    return np.flatnonzero(np.unpackbits(vector, count=length))
+
@@ -0,0 +1,79 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def calculatePTL(timeStamps, tsMax, maxPer, maxSoPer, minDur, extendToEnd=False):
+    """
+    Calculate PTL from the sorted timestamps of an item or pattern.
+    This is the shared kernel of LPPGrowth, LPPMBreadth and LPPMDepth; the bit vector based miners pass
+    the positions of the set bits as timestamps.
+    soPer follows soPer = max(0, soPer + per - maxPer), which is evaluated over a window of periods at once
+    as the cumulative sum of the excess periods minus its running minimum. Windows double in size until the
+    interval closes, so the cost of an interval grows with its length rather than with the database.
+
+    :param timeStamps: sorted timestamps of the pattern
+    :type timeStamps: numpy.ndarray or list
+    :param tsMax: last timestamp of the database
+    :type tsMax: int
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param maxSoPer: maximum spillover periodicity
+    :type maxSoPer: int or float
+    :param minDur: minimum duration of a time-interval
+    :type minDur: int or float
+    :param extendToEnd: if True, an interval still open at the end of the database ends at tsMax
+    :type extendToEnd: bool
+    :return: PTL
+    :rtype: set
+    """
+    PTL = set()
+    if len(timeStamps) < 2:
+        return PTL
+    timeStamps = np.asarray(timeStamps, dtype=np.int64)
+    excess = np.diff(timeStamps) - maxPer
+    starts = np.flatnonzero(excess <= 0)
+    i = 0
+    while True:
+        k = np.searchsorted(starts, i)
+        if k == len(starts):
+            break
+        first = starts[k]
+        start = int(timeStamps[first])
+        soPer, end, window = maxSoPer, -1, 64
+        while first < len(excess):
+            cumulative = np.cumsum(excess[first:first + window])
+            soPerList = cumulative - np.minimum(np.minimum.accumulate(cumulative), -soPer)
+            over = np.flatnonzero(soPerList > maxSoPer)
+            if len(over) > 0:
+                end = first + over[0]
+                break
+            soPer = soPerList[-1]
+            first += window
+            window <<= 1
+        if end >= 0:
+            if timeStamps[end] - start >= minDur:
+                PTL.add((start, int(timeStamps[end])))
+            i = end + 1
+            continue
+        tsPre = int(timeStamps[-1])
+        soPer = max(0, soPer + tsMax - tsPre - maxPer)
+        if soPer > maxSoPer and tsPre - start >= minDur:
+            PTL.add((start, tsPre))
+        if soPer <= maxSoPer and tsMax - start >= minDur:
+            PTL.add((start, tsMax if extendToEnd else tsPre))
+        break
+    return PTL
@@ -1,5 +1,6 @@
 import sys
 from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
+from PAMI.partialPeriodicPattern.periodicSupport import getIntervalPeriodicity, getIntervalPeriodicities
 
 orderOfItem = {}
 
@@ -171,8 +172,10 @@ class Tree:
         :return: return is PFlist which satisfy ip / (minSup+1) >= minPR
         """
         keys = list(PFList)
-        for item in keys:
-            ip = calculateIP(maxPer, PFList[item], last).run()
+        if not keys:
+            return PFList
+        ips, _ = getIntervalPeriodicities([PFList[item] for item in keys], maxPer, last)
+        for item, ip in zip(keys, ips):
             if ip / (minSup+1) >= minPR:
                 continue
             else:
@@ -209,18 +212,7 @@ class calculateIP:
         calculate ip from timeStamp list
         :return: it represents ip value
         """
-        ip = 0
-        self.timeStamp = sorted(list(self.timeStamp))
-        if len(self.timeStamp) <= 0:
-            return ip
-        if self.timeStamp[0] - 0 <= self.maxPer:
-            ip += 1
-        for i in range(len(self.timeStamp)-1):
-            if (self.timeStamp[i+1] - self.timeStamp[i]) <= self.maxPer:
-                ip += 1
-        if abs(self.timeStamp[(len(self.timeStamp)-1)] - self.timeStampFinal) <= self.maxPer:
-            ip += 1
-        return ip
+        return getIntervalPeriodicity(self.timeStamp, self.maxPer, self.timeStampFinal)
 
 
 class generatePFListver2:
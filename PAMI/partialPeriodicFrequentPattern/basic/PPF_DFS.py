@@ -2,6 +2,7 @@ import sys
 import validators
 from urllib.request import urlopen
 from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
+from PAMI.partialPeriodicPattern.periodicSupport import getIntervalPeriodicity, getIntervalPeriodicities, getPeriodicRatios
 
 
 class PPF_DFS(partialPeriodicPatterns):
@@ -179,27 +180,7 @@ class PPF_DFS(partialPeriodicPatterns):
         :type tids: list
         :return: ip / (sup+1)
         """
-        # print(lno)
-        tids = list(set(tids))
-        tids.sort()
-        per = 0
-        sup = 0
-        cur = 0
-        if len(tids) == 0:
-            return 0
-        if abs(0 - tids[0]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        for j in range(len(tids) - 1):
-            i = j + 1
-            per = abs(tids[i] - tids[j])
-            if (per <= self._partialPeriodicPatterns__maxPer):
-                sup += 1
-            cur = tids[j]
-        if abs(self.__last - tids[len(tids) - 1]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        if sup == 0:
-            return 0
-        return sup / (len(tids) + 1)
+        return float(getPeriodicRatios([tids], self._partialPeriodicPatterns__maxPer, self.__last)[0])
 
     def _partialPeriodicPatterns__getPerSup(self, tids):
         """
@@ -208,26 +189,7 @@ class PPF_DFS(partialPeriodicPatterns):
         :type tids: list
         :return: ip
         """
-        # print(lno)
-        tids = list(set(tids))
-        tids.sort()
-        per = 0
-        sup = 0
-        cur = 0
-        if len(tids) == 0:
-            return 0
-        if abs(0 - tids[0]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        for j in range(len(tids) - 1):
-            i = j + 1
-            per = abs(tids[i] - tids[j])
-            if (per <= self._partialPeriodicPatterns__maxPer):
-                sup += 1
-        if abs(tids[len(tids) - 1] - self.__last) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        if sup == 0:
-            return 0
-        return sup
+        return getIntervalPeriodicity(tids, self._partialPeriodicPatterns__maxPer, self.__last)
 
     def __convert(self, value):
         """
@@ -313,7 +275,7 @@ class PPF_DFS(partialPeriodicPatterns):
         else:
             prefix = prefix + suffix
         val = self._partialPeriodicPatterns__getPerSup(tidsetx)
-        val1 = self.__getPer_Sup(tidsetx)
+        val1 = val / (len(tidsetx) + 1)
         if len(tidsetx) >= self._partialPeriodicPatterns__minSup and val / (len(tidsetx) + 1) >= self._partialPeriodicPatterns__minPR:
             self._partialPeriodicPatterns__finalPatterns[tuple(prefix)] = [len(tidsetx), val1]
 
@@ -341,14 +303,16 @@ class PPF_DFS(partialPeriodicPatterns):
             classItemsets = []
             classtidsets = []
             itemsetx = [itemx]
-            for j in range(i + 1, len(itemsets)):
-                itemj = itemsets[j]
-                tidsetj = tidsets[j]
-                y = list(set(tidsetx) & set(tidsetj))
-                val = self._partialPeriodicPatterns__getPerSup(y)
-                if len(y) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
-                    classItemsets.append(itemj)
-                    classtidsets.append(y)
+            tidseti = set(tidsetx)
+            candidates = [list(tidseti & set(tidsets[j])) for j in range(i + 1, len(itemsets))]
+            if candidates:
+                values, _ = getIntervalPeriodicities(candidates, self._partialPeriodicPatterns__maxPer, self.__last)
+                for j in range(i + 1, len(itemsets)):
+                    y = candidates[j - i - 1]
+                    val = values[j - i - 1]
+                    if len(y) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
+                        classItemsets.append(itemsets[j])
+                        classtidsets.append(y)
             newprefix = list(set(itemsetx)) + prefix
             self.__Generation(newprefix, classItemsets, classtidsets)
             self.__save(prefix, list(set(itemsetx)), tidsetx)
@@ -370,15 +334,17 @@ class PPF_DFS(partialPeriodicPatterns):
             itemsetx = [itemx]
             itemsets = []
             tidsets = []
-            for j in range(i + 1, len(plist)):
-                itemj = plist[j]
-                tidsetj = self.__tidlist[itemj]
-                y1 = list(set(tidsetx) & set(tidsetj))
-                val = self._partialPeriodicPatterns__getPerSup(y1)
-                # if(len(y1)>=minsup and val/(len(y1)+1)>=minpr):
-                if len(y1) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
-                    itemsets.append(itemj)
-                    tidsets.append(y1)
+            tidseti = set(tidsetx)
+            candidates = [list(tidseti & set(self.__tidlist[plist[j]])) for j in range(i + 1, len(plist))]
+            if candidates:
+                values, _ = getIntervalPeriodicities(candidates, self._partialPeriodicPatterns__maxPer, self.__last)
+                for j in range(i + 1, len(plist)):
+                    y1 = candidates[j - i - 1]
+                    val = values[j - i - 1]
+                    # if(len(y1)>=minsup and val/(len(y1)+1)>=minpr):
+                    if len(y1) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
+                        itemsets.append(plist[j])
+                        tidsets.append(y1)
             self.__Generation(itemsetx, itemsets, tidsets)
             self.__save(None, itemsetx, tidsetx)
         self._partialPeriodicPatterns__endTime = time.time()
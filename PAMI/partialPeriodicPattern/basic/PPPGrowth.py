@@ -14,6 +14,8 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.partialPeriodicPattern.basic import abstract as _abstract
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupport as _getPeriodicSupport
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupports as _getPeriodicSupports
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
@@ -179,15 +181,7 @@ class _Tree(object):
 
 
         """
-        timeStamps.sort()
-        per = 0
-        sup = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= _period:
-                per += 1
-            sup += 1
-        return per
+        return _getPeriodicSupport(timeStamps, _period)
 
     def _conditionalTransactions(self, conditionalPatterns, conditionalTimeStamps):
         """ It generates the conditional patterns with periodic frequent items
@@ -208,9 +202,7 @@ class _Tree(object):
                     data1[j] = data1[j] + conditionalTimeStamps[i]
                 else:
                     data1[j] = conditionalTimeStamps[i]
-        updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self._getPeriodicSupport(data1[m])
+        updatedDictionary = dict(zip(data1, _getPeriodicSupports(list(data1.values()), _period).tolist()))
         updatedDictionary = {k: v for k, v in updatedDictionary.items() if v >= _periodicSupport}
         count = 0
         for p in conditionalPatterns:
@@ -15,6 +15,8 @@
 
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupport as _getPeriodicSupport
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupports as _getPeriodicSupports
 
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
@@ -178,13 +180,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
 
             :type timeStamps : list
         """
-        timeStamps.sort()
-        per = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= self._period:
-                per += 1
-        return per
+        return _getPeriodicSupport(timeStamps, self._period)
 
     def _creatingItemSets(self):
         self._Database = []
@@ -314,14 +310,14 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y)
-                if val >= self._periodicSupport:
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
+            tidSetI = set(tidSetX)
+            candidates = [list(tidSetI.intersection(tidSets[j])) for j in range(i + 1, len(itemSets))]
+            if candidates:
+                values = _getPeriodicSupports(candidates, self._period)
+                for j in range(i + 1, len(itemSets)):
+                    if values[j - i - 1] >= self._periodicSupport:
+                        classItemSets.append(itemSets[j])
+                        classTidSets.append(candidates[j - i - 1])
             newprefix = list(set(itemSetX)) + prefix
             self._Generation(newprefix, classItemSets, classTidSets)
             self._save(prefix, list(set(itemSetX)), tidSetX)
@@ -342,14 +338,14 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
-            for j in range(i + 1, len(plist)):
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y1)
-                if val >= self._periodicSupport:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
+            tidSetI = set(tidSetX)
+            candidates = [list(tidSetI.intersection(self._tidList[plist[j]])) for j in range(i + 1, len(plist))]
+            if candidates:
+                values = _getPeriodicSupports(candidates, self._period)
+                for j in range(i + 1, len(plist)):
+                    if values[j - i - 1] >= self._periodicSupport:
+                        itemSets.append(plist[j])
+                        tidSets.append(candidates[j - i - 1])
             self._Generation(itemSetX, itemSets, tidSets)
             self._save(None, itemSetX, tidSetX)
         print("Partial Periodic Frequent patterns were generated successfully using 3PEclat algorithm")
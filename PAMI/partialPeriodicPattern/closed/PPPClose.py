@@ -2,6 +2,7 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 from PAMI.partialPeriodicPattern.closed import abstract as _abstract
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupport as _getPeriodicSupport
 
 
 class PPPClose(_abstract._partialPeriodicPatterns):
@@ -281,13 +282,7 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         -------
             period and support
         """
-        timeStamps.sort()
-        sup = 0
-        for j in range(len(timeStamps) - 1):
-            per = abs(timeStamps[j + 1] - timeStamps[j])
-            if per <= self._period:
-                sup += 1
-        return sup
+        return _getPeriodicSupport(timeStamps, self._period)
 
     def _save(self, prefix, suffix, tidSetX):
         """
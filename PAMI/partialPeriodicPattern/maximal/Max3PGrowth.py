@@ -17,6 +17,8 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 from PAMI.partialPeriodicPattern.maximal import abstract as _abstract
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupport as _getPeriodicSupport
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupports as _getPeriodicSupports
 
 _periodicSupport = float()
 _period = float()
@@ -326,13 +328,7 @@ def _getPeriodAndSupport(timeStamps):
 
     :return: Support and periodicity
     """
-    timeStamps.sort()
-    per = 0
-    for i in range(len(timeStamps) - 1):
-        j = i + 1
-        if abs(timeStamps[j] - timeStamps[i]) <= _period:
-            per += 1
-    return per
+    return _getPeriodicSupport(timeStamps, _period)
 
 
 def _conditionalTransactions(condPatterns, condTimeStamps):
@@ -354,9 +350,7 @@ def _conditionalTransactions(condPatterns, condTimeStamps):
                 data1[j] = data1[j] + condTimeStamps[i]
             else:
                 data1[j] = condTimeStamps[i]
-    updatedDict = {}
-    for m in data1:
-        updatedDict[m] = _getPeriodAndSupport(data1[m])
+    updatedDict = dict(zip(data1, _getPeriodicSupports(list(data1.values()), _period).tolist()))
     updatedDict = {k: v for k, v in updatedDict.items() if v >= _periodicSupport}
     count = 0
     for p in condPatterns:
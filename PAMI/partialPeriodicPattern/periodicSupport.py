@@ -0,0 +1,134 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as _np
+from itertools import chain as _chain
+
+
+def _flatten(timeStampsList, unique):
+    """
+    Concatenate the timestamps of many candidates into one sorted array
+
+    :param timeStampsList: timestamps of every candidate
+    :type timeStampsList: list
+    :param unique: if True, repeated timestamps of a candidate are kept only once
+    :type unique: bool
+    :return: sorted timestamps and the candidate index of every timestamp
+    :rtype: tuple
+    """
+    lengths = _np.fromiter((len(i) for i in timeStampsList), dtype=_np.int64, count=len(timeStampsList))
+    values = _np.fromiter(_chain.from_iterable(timeStampsList), dtype=_np.int64, count=int(lengths.sum()))
+    candidate = _np.repeat(_np.arange(len(timeStampsList)), lengths)
+    order = _np.lexsort((values, candidate))
+    values, candidate = values[order], candidate[order]
+    if unique and len(values) > 1:
+        keep = _np.ones(len(values), dtype=bool)
+        keep[1:] = (values[1:] != values[:-1]) | (candidate[1:] != candidate[:-1])
+        values, candidate = values[keep], candidate[keep]
+    return values, candidate
+
+
+def getPeriodicSupports(timeStampsList, period):
+    """
+    Calculate the periodic support of many candidates at once.
+    The periodic support is the number of consecutive timestamps whose difference is at most period.
+
+    :param timeStampsList: timestamps of every candidate, in any order
+    :type timeStampsList: list
+    :param period: the maximum period
+    :type period: int or float
+    :return: periodic support of every candidate
+    :rtype: numpy.ndarray
+    """
+    values, candidate = _flatten(timeStampsList, False)
+    periodic = (candidate[1:] == candidate[:-1]) & (_np.diff(values) <= period)
+    return _np.bincount(candidate[1:][periodic], minlength=len(timeStampsList))
+
+
+def getPeriodicSupport(timeStamps, period):
+    """
+    Calculate the periodic support of a single candidate
+
+    :param timeStamps: timestamps of the candidate
+    :type timeStamps: list
+    :param period: the maximum period
+    :type period: int or float
+    :return: periodic support
+    :rtype: int
+    """
+    return int(getPeriodicSupports([timeStamps], period)[0])
+
+
+def getIntervalPeriodicities(timeStampsList, maxPer, last):
+    """
+    Calculate ip of many candidates at once.
+    Repeated timestamps are counted once and the periods from 0 to the first timestamp and from the last
+    timestamp to the end of the database are included.
+
+    :param timeStampsList: timestamps of every candidate, in any order
+    :type timeStampsList: list
+    :param maxPer: the maximum period
+    :type maxPer: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :return: ip and the number of distinct timestamps of every candidate
+    :rtype: tuple
+    """
+    values, candidate = _flatten(timeStampsList, True)
+    size = _np.bincount(candidate, minlength=len(timeStampsList))
+    periodic = (candidate[1:] == candidate[:-1]) & (_np.diff(values) <= maxPer)
+    ip = _np.bincount(candidate[1:][periodic], minlength=len(timeStampsList))
+    if len(values) > 0:
+        first = _np.ones(len(values), dtype=bool)
+        first[1:] = candidate[1:] != candidate[:-1]
+        ip += _np.bincount(candidate[first][_np.abs(values[first]) <= maxPer], minlength=len(timeStampsList))
+        final = _np.ones(len(values), dtype=bool)
+        final[:-1] = first[1:]
+        ip += _np.bincount(candidate[final][_np.abs(last - values[final]) <= maxPer], minlength=len(timeStampsList))
+    return ip, size
+
+
+def getIntervalPeriodicity(timeStamps, maxPer, last):
+    """
+    Calculate ip of a single candidate
+
+    :param timeStamps: timestamps of the candidate
+    :type timeStamps: list
+    :param maxPer: the maximum period
+    :type maxPer: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :return: ip
+    :rtype: int
+    """
+    ip, _ = getIntervalPeriodicities([timeStamps], maxPer, last)
+    return int(ip[0])
+
+
+def getPeriodicRatios(timeStampsList, maxPer, last):
+    """
+    Calculate the periodic ratio ip / (support + 1) of many candidates at once
+
+    :param timeStampsList: timestamps of every candidate, in any order
+    :type timeStampsList: list
+    :param maxPer: the maximum period
+    :type maxPer: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :return: periodic ratio of every candidate
+    :rtype: numpy.ndarray
+    """
+    ip, size = getIntervalPeriodicities(timeStampsList, maxPer, last)
+    return ip / (size + 1)
@@ -14,6 +14,8 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.partialPeriodicPattern.topk import abstract as _abstract
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupport as _getPeriodicSupport
+from PAMI.partialPeriodicPattern.periodicSupport import getPeriodicSupports as _getPeriodicSupports
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
@@ -245,13 +247,7 @@ class Topk_PPPGrowth(_abstract.partialPeriodicPatterns):
         :return: support, periodicity
         """
 
-        timeStamps.sort()
-        sup = 0
-        for j in range(len(timeStamps) - 1):
-            per = abs(timeStamps[j + 1] - timeStamps[j])
-            if per <= self._periodicity:
-                sup += 1
-        return sup
+        return _getPeriodicSupport(timeStamps, self._periodicity)
 
     def _save(self, prefix, suffix, tidSetI):
         """Saves the patterns that satisfy the periodic frequent property.
@@ -322,14 +318,14 @@ class Topk_PPPGrowth(_abstract.partialPeriodicPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y)
-                if val >= self._minimum:
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
+            tidSetX = set(tidSetI)
+            candidates = [list(tidSetX.intersection(tidSets[j])) for j in range(i + 1, len(itemSets))]
+            if candidates:
+                values = _getPeriodicSupports(candidates, self._periodicity)
+                for j in range(i + 1, len(itemSets)):
+                    if values[j - i - 1] >= self._minimum:
+                        classItemSets.append(itemSets[j])
+                        classTidSets.append(candidates[j - i - 1])
             newPrefix = list(set(itemSetX)) + prefix
             self._Generation(newPrefix, classItemSets, classTidSets)
             self._save(prefix, list(set(itemSetX)), tidSetI)
@@ -352,14 +348,14 @@ class Topk_PPPGrowth(_abstract.partialPeriodicPatterns):
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
-            for j in range(i + 1, len(plist)):
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y1)
-                if val >= self._minimum:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
+            tidSetX = set(tidSetI)
+            candidates = [list(tidSetX.intersection(self._tidList[plist[j]])) for j in range(i + 1, len(plist))]
+            if candidates:
+                values = _getPeriodicSupports(candidates, self._periodicity)
+                for j in range(i + 1, len(plist)):
+                    if values[j - i - 1] >= self._minimum:
+                        itemSets.append(plist[j])
+                        tidSets.append(candidates[j - i - 1])
             self._Generation(itemSetX, itemSets, tidSets)
         print("TopK partial periodic patterns were generated successfully")
         self._endTime = _abstract._time.time()
@@ -14,6 +14,7 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from itertools import combinations as _combinations
+from array import array as _array
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 
 _pfList = []
@@ -22,26 +23,14 @@ _maxPer = int()
 _lno = int()
 
 
-class _Interval(object):
-    """
-        To represent the timestamp interval of a node in summaries
-    """
-
-    def __init__(self, start, end, per, sup):
-        self.start = start
-        self.end = end
-        self.per = per
-        self.sup = sup
-
-
 class _NodeSummaries(object):
     """
         To define the summaries of timeStamps of a node
 
        Attributes
         ----------
-        totalSummaries : list
-            stores the summaries of timestamps
+        totalSummaries : array
+            stores the summaries of timestamps as flat (start, end, per, sup) records of a signed 64-bit array
 
         Methods
         -------
@@ -50,7 +39,7 @@ class _NodeSummaries(object):
     """
 
     def __init__(self):
-        self.totalSummaries = []
+        self.totalSummaries = _array('q')
 
     def insert(self, tid):
         """ To insert and merge the timeStamps into summaries of a node
@@ -58,154 +47,118 @@ class _NodeSummaries(object):
             :param tid: timeStamps of a node
             :return: summaries of a node
         """
-        k = self.totalSummaries[-1]
-        diff = tid - k.end
+        k = self.totalSummaries
+        diff = tid - k[-3]
         if diff <= _maxPer:
-            k.end = tid
-            k.per = max(diff, k.per)
-            #             print(k.per)
-            k.sup += 1
+            k[-3] = tid
+            k[-2] = max(diff, k[-2])
+            k[-1] += 1
         else:
-            self.totalSummaries.append(_Interval(tid, tid, 0, 1))
+            k.extend((tid, tid, 0, 1))
         return self.totalSummaries
 
 
-def _merge(summariesX, summariesY):
+def _append(buffer, n, start, end, per, sup):
+    """ To append an interval to the merged summaries, joining it with the last interval when they overlap
+    or are at most maxPer apart
+
+    :param buffer: flat (start, end, per, sup) records of the merged summaries
+    :param n: number of values written in buffer
+    :param start: first timestamp of the interval
+    :param end: last timestamp of the interval
+    :param per: periodicity inside the interval
+    :param sup: support of the interval
+    :return: number of values written in buffer
+    """
+    if n:
+        last = buffer[n - 3]
+        v = start - last
+        if last > start or v <= _maxPer:
+            buffer[n - 3] = max(end, last)
+            buffer[n - 2] = max(buffer[n - 2], per, v)
+            buffer[n - 1] += sup
+            return n
+    buffer[n] = start
+    buffer[n + 1] = end
+    buffer[n + 2] = per
+    buffer[n + 3] = sup
+    return n + 4
+
+
+def _merge(summariesX, summariesY, buffer):
     """To Merge the timeStamps
 
+    The merged intervals are written into the buffer of the mining run, which is reused by every merge of the run,
+    so the only allocation is the final copy of the result.
+
     :param summariesX:  TimeStamps of an one itemSet
     :param summariesY:  TimeStamps of an one itemSet
+    :param buffer: the buffer of the mining run, grown to the size of the largest merge
+    :type buffer: array
     :return:  Merged timestamp of both itemSets
     """
-    iter1 = 0
-    iter2 = 0
-    updatedSummaries = []
     l1 = len(summariesX)
     l2 = len(summariesY)
-    while 1:
-        if summariesX[iter1].start < summariesY[iter2].start:
-            if summariesX[iter1].end < summariesY[iter2].start:
-                diff = summariesY[iter2].start - summariesX[iter1].end
+    if len(buffer) < l1 + l2:
+        buffer.frombytes(bytes(buffer.itemsize * (l1 + l2 - len(buffer))))
+    iter1 = 0
+    iter2 = 0
+    n = 0
+    while iter1 < l1 and iter2 < l2:
+        xStart, xEnd, xPer, xSup = summariesX[iter1], summariesX[iter1 + 1], summariesX[iter1 + 2], summariesX[iter1 + 3]
+        yStart, yEnd, yPer, ySup = summariesY[iter2], summariesY[iter2 + 1], summariesY[iter2 + 2], summariesY[iter2 + 3]
+        if xStart < yStart:
+            if xEnd < yStart:
+                diff = yStart - xEnd
                 if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start,
-                                                     summariesX[iter1].end, summariesX[iter1].per,
-                                                     summariesX[iter1].sup))
-                    iter1 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-                else:
-                    per1 = max(diff, summariesX[iter1].per)
-                    per1 = max(per1, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                    iter1 += 1
-                    iter2 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
+                    n = _append(buffer, n, xStart, xEnd, xPer, xSup)
+                    iter1 += 4
+                    continue
+                n = _append(buffer, n, xStart, yEnd, max(diff, xPer, yPer), xSup + ySup)
+            elif xEnd > yEnd:
+                n = _append(buffer, n, xStart, xEnd, xPer, xSup + ySup)
             else:
-                if summariesX[iter1].end > summariesY[iter2].end:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start, summariesX[iter1].end,
-                                                     summariesX[iter1].per,
-                                                     summariesX[iter1].sup + summariesY[iter2].sup))
-                else:
-                    per1 = max(summariesX[iter1].per, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                iter1 += 1
-                iter2 += 1
-                if iter1 >= l1:
-                    ck = 1
-                    break
-
-                if iter2 >= l2:
-                    ck = 2
-                    break
+                n = _append(buffer, n, xStart, yEnd, max(xPer, yPer), xSup + ySup)
         else:
-            if summariesY[iter2].end < summariesX[iter1].start:
-                diff = summariesX[iter1].start - summariesY[iter2].end
+            if yEnd < xStart:
+                diff = xStart - yEnd
                 if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per, summariesY[iter2].sup))
-                    iter2 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-                else:
-                    per1 = max(diff, summariesY[iter2].per)
-                    per1 = max(per1, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                    iter2 += 1
-                    iter1 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
+                    n = _append(buffer, n, yStart, yEnd, yPer, ySup)
+                    iter2 += 4
+                    continue
+                n = _append(buffer, n, yStart, xEnd, max(diff, yPer, xPer), ySup + xSup)
+            elif yEnd > xEnd:
+                n = _append(buffer, n, yStart, yEnd, yPer, ySup + xSup)
             else:
-                if summariesY[iter2].end > summariesX[iter1].end:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per,
-                                                     summariesY[iter2].sup + summariesX[iter1].sup))
-                else:
-                    per1 = max(summariesY[iter2].per, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                iter2 += 1
-                iter1 += 1
-                if iter2 >= l2:
-                    ck = 2
-                    break
-
-                if iter1 >= l1:
-                    ck = 1
-                    break
-    if ck == 1:
-        while iter2 < l2:
-            updatedSummaries.append(summariesY[iter2])
-            iter2 += 1
-    else:
-        while iter1 < l1:
-            updatedSummaries.append(summariesX[iter1])
-            iter1 += 1
-    updatedSummaries = _update(updatedSummaries)
-
-    return updatedSummaries
-
-
-def _update(updatedSummaries):
-    """ After updating the summaries with first, last, and period elements in summaries
-
-    :param updatedSummaries: summaries that have been merged
-    :return: updated summaries of a node
+                n = _append(buffer, n, yStart, xEnd, max(yPer, xPer), ySup + xSup)
+        iter1 += 4
+        iter2 += 4
+    if iter1 < l1:
+        n = _appendRemaining(buffer, n, summariesX, iter1)
+    if iter2 < l2:
+        n = _appendRemaining(buffer, n, summariesY, iter2)
+    return buffer[:n]
+
+
+def _appendRemaining(buffer, n, summaries, i):
+    """ To append the intervals of summaries from position i to the merged summaries.
+    Intervals are appended one by one while they join the last merged interval. Once one of them starts a new
+    interval, the rest are more than maxPer apart from it and are copied as one block.
+
+    :param buffer: flat (start, end, per, sup) records of the merged summaries
+    :param n: number of values written in buffer
+    :param summaries: summaries whose remaining intervals are appended
+    :param i: position of the first remaining interval in summaries
+    :return: number of values written in buffer
     """
-    summaries = [updatedSummaries[0]]
-    cur = updatedSummaries[0]
-    for i in range(1, len(updatedSummaries)):
-        v = (updatedSummaries[i].start - cur.end)
-        if cur.end > updatedSummaries[i].start or v <= _maxPer:
-            cur.end = max(updatedSummaries[i].end, cur.end)
-            cur.sup += updatedSummaries[i].sup
-            cur.per = max(cur.per, updatedSummaries[i].per)
-            cur.per = max(cur.per, v)
-        else:
-            summaries.append(updatedSummaries[i])
-        cur = summaries[-1]
-    return summaries
+    length = len(summaries)
+    while i < length:
+        written = _append(buffer, n, summaries[i], summaries[i + 1], summaries[i + 2], summaries[i + 3])
+        i += 4
+        if written > n:
+            buffer[written:written + length - i] = summaries[i:]
+            return written + length - i
+    return n
 
 
 class Node(object):
@@ -266,6 +219,8 @@ class _Tree(object):
             storing the nodes with same item name
         info : dictionary
             stores the support of items
+        buffer : array
+            scratch buffer of the merges, shared by the tree of a mining run and its conditional trees
 
 
     Methods:
@@ -286,10 +241,11 @@ class _Tree(object):
 
         """
 
-    def __init__(self):
+    def __init__(self, buffer=None):
         self.root = Node(None, {})
         self.summaries = {}
         self.info = {}
+        self.buffer = _array('q') if buffer is None else buffer
 
     def addTransaction(self, transaction, tid):
         """
@@ -315,7 +271,7 @@ class _Tree(object):
         if len(currentNode.timeStamps.totalSummaries) != 0:
             currentNode.timeStamps.insert(tid)
         else:
-            currentNode.timeStamps.totalSummaries.append(_Interval(tid, tid, 0, 1))
+            currentNode.timeStamps.totalSummaries.extend((tid, tid, 0, 1))
 
     def addConditionalPatterns(self, transaction, tid):
         """
@@ -338,7 +294,7 @@ class _Tree(object):
             else:
                 currentNode = currentNode.children[transaction[i]]
         if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.totalSummaries = _merge(currentNode.timeStamps.totalSummaries, tid)
+            currentNode.timeStamps.totalSummaries = _merge(currentNode.timeStamps.totalSummaries, tid, self.buffer)
         else:
             currentNode.timeStamps.totalSummaries = tid
 
@@ -361,7 +317,7 @@ class _Tree(object):
                 set2.reverse()
                 finalPatterns.append(set2)
                 finalSets.append(set1)
-        finalPatterns, finalSets, info = conditionalTransactions(finalPatterns, finalSets)
+        finalPatterns, finalSets, info = conditionalTransactions(finalPatterns, finalSets, self.buffer)
         return finalPatterns, finalSets, info
 
     def removeNode(self, nodeValue):
@@ -374,7 +330,7 @@ class _Tree(object):
         for i in self.summaries[nodeValue]:
             if len(i.parent.timeStamps.totalSummaries) != 0:
                 i.parent.timeStamps.totalSummaries = _merge(i.parent.timeStamps.totalSummaries,
-                                                           i.timeStamps.totalSummaries)
+                                                           i.timeStamps.totalSummaries, self.buffer)
             else:
                 i.parent.timeStamps.totalSummaries = i.timeStamps.totalSummaries
             del i.parent.children[nodeValue]
@@ -388,9 +344,9 @@ class _Tree(object):
         :param alpha: name of node for the timeStamps
         :return: timeStamps of a node
         """
-        temp = []
+        temp = _array('q')
         for i in self.summaries[alpha]:
-            temp += i.timeStamps
+            temp += i.timeStamps.totalSummaries
         return temp
 
     def check(self):
@@ -421,8 +377,8 @@ class _Tree(object):
             pattern.append(_pfList[i])
             yield pattern, self.info[i]
             patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
+            conditionalTree = _Tree(self.buffer)
+            conditionalTree.info = info
             for pat in range(len(patterns)):
                 conditionalTree.addConditionalPatterns(patterns[pat], timeStamps[pat])
             find = conditionalTree.check()
@@ -432,7 +388,7 @@ class _Tree(object):
                     yield cp
             else:
                 if len(conditionalTree.info) != 0:
-                    j = []
+                    j = _array('q')
                     for r in timeStamps:
                         j += r
                     inf = getPeriodAndSupport(j)
@@ -475,34 +431,37 @@ def getPeriodAndSupport(timeStamps):
     cur = 0
     per = 0
     sup = 0
-    for j in range(len(timeStamps)):
-        per = max(per, timeStamps[j].start - cur)
-        per = max(per, timeStamps[j].per)
+    for j in range(0, len(timeStamps), 4):
+        per = max(per, timeStamps[j] - cur)
+        per = max(per, timeStamps[j + 2])
         if per > _maxPer:
             return [0, 0]
-        cur = timeStamps[j].end
-        sup += timeStamps[j].sup
+        cur = timeStamps[j + 1]
+        sup += timeStamps[j + 3]
     per = max(per, _lno - cur)
     return [sup, per]
 
 
-def conditionalTransactions(patterns, timestamp):
+def conditionalTransactions(patterns, timestamp, buffer=None):
     """
     To sort and update the conditional transactions by removing the items which fails frequency
     and periodicity conditions
 
     :param patterns: conditional patterns of a node
     :param timestamp: timeStamps of a conditional pattern
+    :param buffer: scratch buffer of the merges, a new one when None
     :return: conditional transactions with their respective timeStamps
     """
     global _minSup, _maxPer
+    if buffer is None:
+        buffer = _array('q')
     pat = []
     timeStamps = []
     data1 = {}
     for i in range(len(patterns)):
         for j in patterns[i]:
             if j in data1:
-                data1[j] = _merge(data1[j], timestamp[i])
+                data1[j] = _merge(data1[j], timestamp[i], buffer)
             else:
                 data1[j] = timestamp[i]
 
@@ -1,4 +1,5 @@
 from PAMI.periodicFrequentSpatialPattern import abstract as _ab
+from PAMI.extras.neighbours.neighbourhoodGraph import NeighbourhoodGraph as _NeighbourhoodGraph
 
 
 class PFS_ECLAT(_ab._spatialPeriodicFrequentPatterns):
@@ -126,7 +127,7 @@ class PFS_ECLAT(_ab._spatialPeriodicFrequentPatterns):
 
     def __init__(self, iFile, nFile, minSup, maxPer, sep="\t"):
         super().__init__(iFile, nFile, minSup, maxPer, sep)
-        self._NeighboursMap = {}
+        self._neighbourhood = None
 
     def _creatingItemSets(self):
         """Storing the complete transactions of the database/input file in a database variable
@@ -263,18 +264,12 @@ class PFS_ECLAT(_ab._spatialPeriodicFrequentPatterns):
             itemSetX = [itemX]
             neighboursItemsI = self._getNeighbourItems(itemSets[i])
             for j in range(i + 1, len(itemSets)):
-                neighboursItemsJ = self._getNeighbourItems(itemSets[i])
                 if not itemSets[j] in neighboursItemsI:
                     continue
                 itemJ = itemSets[j]
                 tidSetJ = tidSets[j]
                 y = list(set(tidSetX).intersection(tidSetJ))
                 if len(y) >= self._minSup:
-                    ne = list(set(neighboursItemsI).intersection(neighboursItemsJ))
-                    x = []
-                    x = x + [itemX]
-                    x = x + [itemJ]
-                    self._NeighboursMap[tuple(x)] = ne
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
             newPrefix = list(set(itemSetX)) + prefix
@@ -289,52 +284,19 @@ class PFS_ECLAT(_ab._spatialPeriodicFrequentPatterns):
             :return: set of common neighbours 
             :rtype:set
         """
-        itemNeighbours = self._NeighboursMap.keys()
         if isinstance(keySet, str):
-            if self._NeighboursMap.get(keySet) is None:
-                return []
-            itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(keySet))))
-        if isinstance(keySet, tuple):
-            keySet = list(keySet)
-            for j in range(0, len(keySet)):
-                i = keySet[j]
-                itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(i))))
-        return itemNeighbours
+            keySet = [keySet]
+        return self._neighbourhood.commonNeighbourNames(keySet, listedOnly=True)
 
     def mapNeighbours(self):
         """
             A function to map items to their Neighbours
         """
-        self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
-            data = []
-            if self._nFile.empty:
-                print("its empty..")
-            i = self._nFile.columns.values.tolist()
-            if 'Neighbours' in i:
-                data = self._nFile['Neighbours'].tolist()
-            for i in data:
-                self._NeighboursMap[i[0]] = i[1:]
-        if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
-                data = _ab._urlopen(self._nFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._NeighboursMap[temp[0]] = temp[1:]
-            else:
-                try:
-                    with open(self._nFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._NeighboursMap[temp[0]] = temp[1:]
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._neighbourhood = _NeighbourhoodGraph.read(self._nFile, self._sep)
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def startMine(self):
         """Frequent pattern mining process will start from here"""
@@ -10,6 +10,8 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.DF2DB.transactionDatabase import TransactionDatabase as _TransactionDatabase, \
+    asTransactionalInput as _asTransactionalInput
 
 
 
@@ -60,13 +62,13 @@ class _frequentPatterns(_ABC):
     def __init__(self, iFile, minSup, minRatio, sep='\t'):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or TransactionDatabase or scipy.sparse matrix
         :param minSup: UserSpecified minimum support value. It has to be given in terms of count of total number of
         transactions in the input database/file
         :type minSup: str
         """
 
-        self._iFile = iFile
+        self._iFile = _asTransactionalInput(iFile)
         self._minSup = minSup
         self._minRatio = minRatio
         self._sep = sep
@@ -1,7 +1,8 @@
 from PAMI.uncertainCorrelatedPattern.basic import abstract as _ab
+from PAMI.fuzzyFrequentPatterns.basic.fuzzyList import FuzzyList as _FuzzyList
 
 
-class _FFList:
+class _FFList(_FuzzyList):
     """
      A class represent a Fuzzy List of an element
 
@@ -9,15 +10,17 @@ class _FFList:
     ----------
          item: int
              the item name
+         region: str
+             the fuzzy region of the item
          sumIUtil: float
              the sum of utilities of an fuzzy item in database
          sumRUtil: float
              the sum of resting values of a fuzzy item in database
-         elements: list
-             a list of elements contain tid, Utility and resting values of element in each transaction
+         tids, iUtils, rUtils: numpy.ndarray
+             the tid, Utility and resting value of the element of each transaction
     Methods:
     -------
-        addElement(element)
+        addElement(tid, iUtil, rUtil)
             Method to add an element to this fuzzy list and update the sums at the same time.
 
         printElement(e)
@@ -25,34 +28,8 @@ class _FFList:
 
     """
     def __init__(self, itemName, region):
-        self.item = itemName
+        super().__init__(itemName)
         self.region = region
-        self.sumIUtil = 0.0 
-        self.sumRUtil = 0.0
-        self.elements = []
-
-    def addElement(self, element):
-        self.sumIUtil += element.iUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element) 
-
-
-class _Element:
-    """
-        A class represents an Element of a fuzzy list
-    Attributes:
-    ----------
-        tid : int
-            keep tact of transaction id
-        iUtils: float
-            the utility of an fuzzy item in the transaction
-        rUtil : float
-            the neighbourhood resting value of an fuzzy item in the transaction
-    """
-    def __init__(self, tid, iUtil, rUtil):
-        self.tid = tid 
-        self.iUtils = iUtil
-        self.rUtils = rUtil
 
 
 class _Regions:
@@ -275,30 +252,6 @@ class CFFI(_ab._frequentPatterns):
         else:
             return compare
 
-    @staticmethod
-    def _findElementWithTID(uList,  tid):
-        """
-        To find element with same tid as given
-        :param uList: fuzzyList
-        :type uList: FFI-List
-        :param tid: transaction id
-        :type tid: int
-        :return: element eith tid as given
-        :rtype: element if exists or None
-        """
-        List = uList.elements
-        first = 0
-        last = len(List)-1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None            
-
     def _convert(self,  value):
         """
         To convert the given user specified value
@@ -436,8 +389,7 @@ class CFFI(_ab._frequentPatterns):
                     remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(pair.item) is not None:
                     FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = _Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
+                    FFListOfItem.addElement(tid, pair.quantity, remainingUtility)
             tid += 1
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFIList, self._minSup)
         self._endTime = _ab._time.time()
@@ -466,7 +418,7 @@ class CFFI(_ab._frequentPatterns):
                 ratio = self.getRatio(prefix, prefixLen, X)
                 if ratio >= self._minRatio:
                     self.WriteOut(prefix, prefixLen, X, ratio) 
-            if X.sumRUtill >= minSup:
+            if X.sumRUtil >= minSup:
                 exULs = []
                 for j in range(i+1, len(FSFIM)):
                     Y = FSFIM[j]
@@ -487,12 +439,7 @@ class CFFI(_ab._frequentPatterns):
             :rtype :FFI-List
         """
         pxyUL = _FFList(py.item, py.region)
-        for ex in px.elements:
-            ey = self._findElementWithTID(py,  ex.tid)
-            if ey is None:
-                continue
-            eXY = _Element(ex.tid, min([ex.iUtils, ey.iUtils], key=lambda x: float(x)), ey.rUtils)
-            pxyUL.addElement(eXY)
+        pxyUL.setElements(*px.joinElements(py))
         return pxyUL
 
     def getMemoryUSS(self):
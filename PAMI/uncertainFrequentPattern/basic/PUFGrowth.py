@@ -14,29 +14,14 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
+from PAMI.uncertainFrequentPattern.basic.expectedSupport import ExpectedSupportIndex as _ExpectedSupportIndex
+from PAMI.uncertainFrequentPattern.basic.uncertainDatabase import UncertainDatabase as _UncertainDatabase
 
 _minSup = str()
 _ab._sys.setrecursionlimit(20000)
 _finalPatterns = {}
 
 
-class _Item:
-    """
-    A class used to represent the item with probability in transaction of dataset
-    ...
-    Attributes:
-    __________
-        item : int or word
-            Represents the name of the item
-        probability : float
-            Represent the existential probability(likelihood presence) of an item
-    """
-
-    def __init__(self, item, probability):
-        self.item = item
-        self.probability = probability
-
-
 class _Node(object):
     """
     A class used to represent the node of frequentPatternTree
@@ -102,42 +87,28 @@ class _Tree(object):
         self.summaries = {}
         self.info = {}
 
-    def addTransaction(self, transaction):
+    def addTransaction(self, transaction, caps):
         """adding transaction into tree
-            :param transaction : it represents the one self.Database in database
+            :param transaction : items of one transaction of the database
             :type transaction : list
+            :param caps : cap probability of every item, its probability multiplied by the highest probability before it
+            :type caps : list
         """
 
         currentNode = self.root
         for i in range(len(transaction)):
-            if transaction[i].item not in currentNode.children:
-                newNode = _Node(transaction[i].item, {})
-                l1 = i - 1
-                lp = []
-                while l1 >= 0:
-                    lp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(lp) == 0:
-                    newNode.probability = transaction[i].probability
-                else:
-                    newNode.probability = max(lp) * transaction[i].probability
+            if transaction[i] not in currentNode.children:
+                newNode = _Node(transaction[i], {})
+                newNode.probability = caps[i]
                 currentNode.addChild(newNode)
-                if transaction[i].item in self.summaries:
-                    self.summaries[transaction[i].item].append(newNode)
+                if transaction[i] in self.summaries:
+                    self.summaries[transaction[i]].append(newNode)
                 else:
-                    self.summaries[transaction[i].item] = [newNode]
+                    self.summaries[transaction[i]] = [newNode]
                 currentNode = newNode
             else:
-                currentNode = currentNode.children[transaction[i].item]
-                l1 = i - 1
-                lp = []
-                while l1 >= 0:
-                    lp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(lp) == 0:
-                    currentNode.probability += transaction[i].probability
-                else:
-                    currentNode.probability += max(lp) * transaction[i].probability
+                currentNode = currentNode.children[transaction[i]]
+                currentNode.probability += caps[i]
 
     def addConditionalPattern(self, transaction, sup):
         """constructing conditional tree from prefixPaths
@@ -366,57 +337,10 @@ class PUFGrowth(_ab._frequentPatterns):
             Scans the uncertain transactional dataset
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            uncertain, data = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
-            if 'uncertain' in i:
-                uncertain = self._iFile['uncertain'].tolist()
-            for k in range(len(data)):
-                tr = []
-                for j in range(len(data[k])):
-                    product = _Item(data[k][j], uncertain[k][j])
-                    tr.append(product)
-                self._Database.append(tr)
-
-            # print(self.Database)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    tr = []
-                    for i in temp:
-                        i1 = i.index('(')
-                        i2 = i.index(')')
-                        item = i[0:i1]
-                        probability = float(i[i1 + 1:i2])
-                        product = _Item(item, probability)
-                        tr.append(product)
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r') as f:
-                        for line in f:
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            tr = []
-                            for i in temp:
-                                i1 = i.index('(')
-                                i2 = i.index(')')
-                                item = i[0:i1]
-                                probability = float(i[i1 + 1:i2])
-                                product = _Item(item, probability)
-                                tr.append(product)
-                            self._Database.append(tr)
-                except IOError:
-                    print("File Not Found")
+        try:
+            self._Database = _UncertainDatabase.read(self._iFile, self._sep)
+        except IOError:
+            print("File Not Found")
 
     def _frequentOneItem(self):
         """takes the self.Database and calculates the support of each item in the dataset and assign the
@@ -425,16 +349,14 @@ class PUFGrowth(_ab._frequentPatterns):
                 :type self.Database : list
         """
 
-        mapSupport = {}
-        for i in self._Database:
-            for j in i:
-                if j.item not in mapSupport:
-                    mapSupport[j.item] = j.probability
-                else:
-                    mapSupport[j.item] += j.probability
-        mapSupport = {k: v for k, v in mapSupport.items() if v >= self._minSup}
-        plist = [k for k, v in sorted(mapSupport.items(), key=lambda x: x[1], reverse=True)]
-        self.rank = dict([(index, item) for (item, index) in enumerate(plist)])
+        supports = self._Database.expectedSupports()
+        names = self._Database.itemNames
+        frequent = [i for i in range(1, len(names)) if supports[i] >= self._minSup]
+        frequent.sort(key=lambda x: supports[x], reverse=True)
+        mapSupport = {names[i]: float(supports[i]) for i in frequent}
+        plist = [names[i] for i in frequent]
+        self.rank = _ab._np.full(len(names), -1, dtype=_ab._np.int64)
+        self.rank[frequent] = _ab._np.arange(len(frequent))
         return mapSupport, plist
 
     @staticmethod
@@ -442,15 +364,15 @@ class PUFGrowth(_ab._frequentPatterns):
         """it takes the self.Database and support of each item and construct the main tree with setting root
             node as null
                 :param data : it represents the one self.Database in database
-                :type data : list
+                :type data : UncertainDatabase
                 :param info : it represents the support of each item
                 :type info : dictionary
         """
 
         rootNode = _Tree()
         rootNode.info = info.copy()
-        for i in range(len(data)):
-            rootNode.addTransaction(data[i])
+        for _, items, _, caps in data.transactions(caps=True):
+            rootNode.addTransaction(items, caps)
         return rootNode
 
     def _updateTransactions(self, dict1):
@@ -459,37 +381,7 @@ class PUFGrowth(_ab._frequentPatterns):
             :type dict1 : dictionary
         """
 
-        list1 = []
-        for tr in self._Database:
-            list2 = []
-            for i in range(0, len(tr)):
-                if tr[i].item in dict1:
-                    list2.append(tr[i])
-            if len(list2) >= 2:
-                basket = list2
-                basket.sort(key=lambda val: self.rank[val.item])
-                list2 = basket
-                list1.append(list2)
-        return list1
-
-    @staticmethod
-    def _check(i, x):
-        """To check the presence of item or pattern in transaction
-                :param x: it represents the pattern
-                :type x : list
-                :param i : represents the uncertain self.Database
-                :type i : list
-        """
-
-        # This method taken a transaction as input and returns the tree
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
+        return self._Database.revise(self.rank, 2)
 
     def _convert(self, value):
         """
@@ -515,21 +407,14 @@ class PUFGrowth(_ab._frequentPatterns):
         """
         global _finalPatterns
         periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        candidates = [x for x in _finalPatterns if len(x) > 1]
+        index = _ExpectedSupportIndex.fromDatabase(self._Database, {item for x in candidates for item in x})
+        supports = index.expectedSupports(candidates)
+        for x, y in _finalPatterns.items():
+            if len(x) == 1:
+                periods[x] = y
+            elif x in supports:
+                periods[x] = supports[x]
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -0,0 +1,146 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+import numpy as _np
+
+
+class ExpectedSupportIndex:
+    """
+        A vertical index of an uncertain database, mapping every item to the ids of the transactions containing it
+        and its existential probability in each of them.
+        The expected support of a pattern is the sum, over the transactions containing all its items, of the product
+        of their probabilities. Patterns sharing a prefix are stored in a trie, so the intersection and the partial
+        products of a prefix are computed once for all of them.
+
+    Attributes:
+    ----------
+        index: dict
+            item -> (tids, probabilities) numpy arrays, tids in increasing order
+
+    Methods:
+    --------
+        expectedSupports(patterns)
+            return the expected support of the patterns occurring in the database
+    """
+
+    def __init__(self, transactions, items=None):
+        """
+            :param transactions: transactions made of elements with item and probability attributes
+            :type transactions: iterable
+            :param items: items to index, all of them when None
+            :type items: set
+        """
+        tids, probabilities = {}, {}
+        for tid, transaction in enumerate(transactions):
+            for element in transaction:
+                item = element.item
+                if items is not None and item not in items:
+                    continue
+                itemTids = tids.get(item)
+                if itemTids is None:
+                    itemTids = tids[item] = _array('q')
+                    probabilities[item] = _array('d')
+                if itemTids and itemTids[-1] == tid:
+                    # an item repeated in a transaction contributes each of its probabilities
+                    probabilities[item][-1] *= element.probability
+                else:
+                    itemTids.append(tid)
+                    probabilities[item].append(element.probability)
+        self.index = {item: (_np.array(tids[item], dtype=_np.int64), _np.array(probabilities[item], dtype=_np.float64))
+                      for item in tids}
+
+    @classmethod
+    def fromDatabase(cls, database, items=None):
+        """
+            Build the index of an UncertainDatabase on its arrays, the items being given by their names
+
+            :param database: the uncertain database
+            :type database: UncertainDatabase
+            :param items: names of the items to index, all of them when None
+            :type items: set
+            :rtype: ExpectedSupportIndex
+        """
+        index = cls(())
+        itemIds = database.items
+        tids = _np.repeat(_np.arange(len(database), dtype=_np.int64), _np.diff(database.bounds))
+        probabilities = database.decimalProbabilities()
+        if items is not None:
+            keep = _np.array([name in items for name in database.itemNames], dtype=bool)
+            kept = keep[itemIds]
+            itemIds, tids, probabilities = itemIds[kept], tids[kept], probabilities[kept]
+        if len(itemIds) == 0:
+            return index
+        order = _np.lexsort((tids, itemIds))
+        itemIds, tids, probabilities = itemIds[order], tids[order], probabilities[order]
+        # an item repeated in a transaction contributes each of its probabilities
+        starts = _np.flatnonzero(_np.r_[True, (itemIds[1:] != itemIds[:-1]) | (tids[1:] != tids[:-1])])
+        itemIds, tids = itemIds[starts], tids[starts]
+        probabilities = _np.multiply.reduceat(probabilities, starts)
+        itemStarts = _np.flatnonzero(_np.r_[True, itemIds[1:] != itemIds[:-1]])
+        itemEnds = _np.r_[itemStarts[1:], len(itemIds)]
+        for start, end in zip(itemStarts.tolist(), itemEnds.tolist()):
+            index.index[database.itemNames[itemIds[start]]] = (tids[start:end], probabilities[start:end])
+        return index
+
+    def expectedSupports(self, patterns):
+        """
+            A method to calculate the expected support of patterns, the work depends on the support of the
+            patterns instead of the size of the database
+
+            :param patterns: the patterns, each one a sequence of items
+            :type patterns: iterable
+            :return: expected support of every pattern contained in at least one transaction
+            :rtype: dict
+        """
+        trie = {}
+        for pattern in patterns:
+            node = trie
+            for item in pattern:
+                node = node.setdefault(item, {})
+        supports = {}
+        self._expectedSupports(trie, (), None, None, supports)
+        return {pattern: supports[tuple(pattern)] for pattern in patterns if tuple(pattern) in supports}
+
+    def _expectedSupports(self, node, prefix, tids, probabilities, supports):
+        """
+            A method to calculate the expected support of every pattern of a trie
+
+            :param node: children of the trie node of the prefix
+            :type node: dict
+            :param prefix: the prefix pattern
+            :type prefix: tuple
+            :param tids: ids of the transactions containing the prefix, None for the empty prefix
+            :type tids: numpy.ndarray
+            :param probabilities: product of the probabilities of the prefix items in each of these transactions
+            :type probabilities: numpy.ndarray
+            :param supports: map to store the expected support of each pattern
+            :type supports: dict
+        """
+        for item, child in node.items():
+            if item not in self.index:
+                continue
+            itemTids, itemProbabilities = self.index[item]
+            if tids is None:
+                patternTids, patternProbabilities = itemTids, itemProbabilities
+            else:
+                patternTids, i, j = _np.intersect1d(tids, itemTids, assume_unique=True, return_indices=True)
+                patternProbabilities = probabilities[i] * itemProbabilities[j]
+            if len(patternTids) == 0:
+                continue
+            pattern = prefix + (item,)
+            supports[pattern] = float(patternProbabilities.sum())
+            if child:
+                self._expectedSupports(child, pattern, patternTids, patternProbabilities, supports)
@@ -0,0 +1,359 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array as _array
+from urllib.request import urlopen as _urlopen
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+
+
+def _parseItem(token):
+    """
+    Split an uncertain item written as item(probability)
+
+    :param token: the uncertain item
+    :type token: str
+    :rtype: tuple
+    """
+    i1 = token.index('(')
+    i2 = token.index(')')
+    return token[0:i1], float(token[i1 + 1:i2])
+
+
+def readUncertainTransactions(iFile, sep='\t', timestamps=False):
+    """
+    Read the transactions of an uncertain database one at a time.
+    Every line holds items written as item(probability), preceded by the timestamp of the transaction when
+    timestamps is True. A DataFrame has the columns Transactions and, optionally, uncertain (the probabilities of
+    the items) and TS (the timestamps).
+
+    :param iFile: file path, URL or DataFrame
+    :type iFile: str or pandas.DataFrame
+    :param sep: separator of the items
+    :type sep: str
+    :param timestamps: read the timestamp of every transaction
+    :type timestamps: bool
+    :return: generator of the timestamp (None without timestamps), items and probabilities of every transaction
+    :rtype: generator
+    """
+    if isinstance(iFile, _pd.DataFrame):
+        columns = iFile.columns.values.tolist()
+        data = iFile['Transactions'].tolist()
+        uncertain = iFile['uncertain'].tolist() if 'uncertain' in columns else None
+        ts = iFile['TS'].tolist() if timestamps and 'TS' in columns else None
+        for k in range(len(data)):
+            transaction = data[k]
+            if isinstance(transaction, str):
+                transaction = [x for x in transaction.strip().split(sep) if x]
+            if uncertain is None:
+                pairs = [_parseItem(x) for x in transaction]
+                items, probabilities = [p[0] for p in pairs], [p[1] for p in pairs]
+            else:
+                items, probabilities = [str(x) for x in transaction], [float(x) for x in uncertain[k]]
+            yield (int(ts[k]) if ts is not None else (k + 1 if timestamps else None)), items, probabilities
+        return
+    if _validators.url(iFile):
+        lines = (line.decode("utf-8") for line in _urlopen(iFile))
+    else:
+        lines = open(iFile, 'r')
+    try:
+        for line in lines:
+            temp = [i.rstrip() for i in line.split(sep)]
+            temp = [x for x in temp if x]
+            if not temp:
+                continue
+            timestamp = None
+            if timestamps:
+                timestamp = int(temp[0])
+                temp = temp[1:]
+            pairs = [_parseItem(x) for x in temp]
+            yield timestamp, [p[0] for p in pairs], [p[1] for p in pairs]
+    finally:
+        if hasattr(lines, 'close'):
+            lines.close()
+
+
+class UncertainDatabase:
+    """
+        An uncertain database stored as flat arrays: int32 item ids, numbered from 1 in the order of their first
+        occurrence, and float32 existential probabilities. Transaction i holds the positions bounds[i] to
+        bounds[i + 1]. Expected supports, periodicities and the cap probabilities of the tree based miners are
+        computed on the arrays at once.
+        float32 keeps about 7 significant digits of a probability and 0.1 is stored as 0.10000000149011612, so the
+        computations use the float64 values of the shortest decimals of the float32 probabilities. They are the
+        probabilities as written in the database when these have at most 7 significant digits, and the supports are
+        then those summed from the text, to the last bit. Longer probabilities come back within the float32
+        precision, 6e-8 of the probability, which can move a support at minSup.
+        Only the table of the distinct probabilities and their decimals is kept, the probabilities of a range of
+        positions being mapped to their decimals when they are used.
+
+    Attributes:
+    ----------
+        items: numpy.ndarray
+            item ids of all transactions, one transaction after the other
+        probabilities: numpy.ndarray
+            existential probabilities of the items
+        bounds: numpy.ndarray
+            start position of every transaction, followed by the total number of items
+        timestamps: numpy.ndarray
+            timestamp of every transaction, None for databases without timestamps
+        itemNames: list
+            name of every item id, itemNames[0] is unused
+
+    Methods:
+    --------
+        read(iFile, sep, timestamps)
+            Read an uncertain database
+        expectedSupports(rounding)
+            return the expected support of every item
+        periodicities(last)
+            return the maximum period of every item
+        revise(rank, minLength)
+            keep the ranked items, sorted by rank, in the transactions holding at least minLength of them
+        decimalProbabilities(start, end)
+            return the float64 probabilities of the shortest decimals of the float32 probabilities of a range
+        capProbabilities()
+            return the probability of every item multiplied by the highest probability before it
+        transactions(caps)
+            iterate over the transactions
+    """
+
+    def __init__(self, items, probabilities, bounds, timestamps, itemNames):
+        self.items = items
+        self.probabilities = probabilities
+        self.bounds = bounds
+        self.timestamps = timestamps
+        self.itemNames = itemNames
+        self._distinct = None
+        self._decimals = None
+
+    def __len__(self):
+        return len(self.bounds) - 1
+
+    @classmethod
+    def fromTransactions(cls, transactions):
+        """
+            Store transactions given one at a time
+
+            :param transactions: timestamp, items and probabilities of every transaction
+            :type transactions: iterable
+            :rtype: UncertainDatabase
+        """
+        ids = {}
+        itemNames = [None]
+        items = _array('i')
+        probabilities = _array('f')
+        bounds = _array('q', [0])
+        timestamps = _array('q')
+        distinct = set()
+        for timestamp, transactionItems, transactionProbabilities in transactions:
+            for item in transactionItems:
+                itemId = ids.get(item)
+                if itemId is None:
+                    itemId = ids[item] = len(itemNames)
+                    itemNames.append(item)
+                items.append(itemId)
+            probabilities.extend(transactionProbabilities)
+            distinct.update(transactionProbabilities)
+            bounds.append(len(items))
+            if timestamp is not None:
+                timestamps.append(timestamp)
+        database = cls(_np.array(items, dtype=_np.int32), _np.array(probabilities, dtype=_np.float32),
+                       _np.array(bounds, dtype=_np.int64),
+                       _np.array(timestamps, dtype=_np.int64) if len(timestamps) else None, itemNames)
+        database._setDistinct(_np.unique(_np.array(list(distinct), dtype=_np.float32)))
+        return database
+
+    @classmethod
+    def read(cls, iFile, sep='\t', timestamps=False):
+        """
+            Read an uncertain database
+
+            :param iFile: file path, URL, DataFrame or an already read UncertainDatabase
+            :type iFile: str or pandas.DataFrame or UncertainDatabase
+            :param sep: separator of the items
+            :type sep: str
+            :param timestamps: the first value of every line is the timestamp of the transaction
+            :type timestamps: bool
+            :rtype: UncertainDatabase
+        """
+        if isinstance(iFile, UncertainDatabase):
+            return iFile
+        return cls.fromTransactions(readUncertainTransactions(iFile, sep, timestamps))
+
+    def _transactionIds(self):
+        """
+            The id of the transaction of every position
+        """
+        return _np.repeat(_np.arange(len(self), dtype=_np.int64), _np.diff(self.bounds))
+
+    def _setDistinct(self, distinct):
+        """
+            Keep the sorted distinct float32 probabilities and the float64 value of the shortest decimal of each one
+        """
+        self._distinct = distinct
+        self._decimals = _np.array([float(_np.format_float_positional(value, unique=True)) for value in distinct],
+                                   dtype=_np.float64)
+
+    def _distinctProbabilities(self, chunkSize=1 << 20):
+        """
+            The sorted distinct float32 probabilities, found chunk by chunk for a database built from its arrays
+        """
+        if self._distinct is None:
+            distinct = _np.empty(0, dtype=_np.float32)
+            for start in range(0, len(self.probabilities), chunkSize):
+                distinct = _np.union1d(distinct, self.probabilities[start:start + chunkSize])
+            self._setDistinct(distinct.astype(_np.float32))
+        return self._distinct
+
+    def decimalProbabilities(self, start=0, end=None):
+        """
+            A method to widen the float32 probabilities of the positions start to end to float64 through their
+            shortest decimal representation, giving back 0.1 for the stored 0.10000000149011612. Every distinct
+            probability is converted once, and the result is not kept.
+
+            :param start: the first position
+            :type start: int
+            :param end: the position after the last one, the end of the database when None
+            :type end: int
+            :rtype: numpy.ndarray
+        """
+        distinct = self._distinctProbabilities()
+        return self._decimals[_np.searchsorted(distinct, self.probabilities[start:end])]
+
+    def expectedSupports(self, rounding=None):
+        """
+            A method to calculate the expected support of every item, summing the decimal probabilities in float64 in
+            the order of the transactions. With rounding, every distinct probability is rounded once by the round
+            of Python, which rounds the decimals as the miners always did, unlike numpy.round.
+
+            :param rounding: number of decimals every probability is rounded to before the sum, no rounding when None
+            :type rounding: int
+            :return: expected support of the item ids 0 to len(itemNames) - 1
+            :rtype: numpy.ndarray
+        """
+        distinct = self._distinctProbabilities()
+        decimals = self._decimals
+        if rounding is not None:
+            decimals = _np.array([round(value, rounding) for value in decimals.tolist()], dtype=_np.float64)
+        probabilities = decimals[_np.searchsorted(distinct, self.probabilities)]
+        return _np.bincount(self.items, weights=probabilities, minlength=len(self.itemNames))
+
+    def periodicities(self, last):
+        """
+            A method to calculate the maximum period of every item, the largest difference between the timestamps of
+            its consecutive transactions, counting from 0 and up to last
+
+            :param last: the timestamp closing the database
+            :type last: int
+            :return: maximum period of the item ids 0 to len(itemNames) - 1
+            :rtype: numpy.ndarray
+        """
+        timestamps = _np.repeat(self.timestamps, _np.diff(self.bounds))
+        order = _np.argsort(self.items, kind='stable')
+        items, timestamps = self.items[order], timestamps[order]
+        first = _np.r_[True, items[1:] != items[:-1]]
+        gaps = _np.abs(timestamps - _np.where(first, 0, _np.r_[0, timestamps[:-1]]))
+        periodicity = _np.zeros(len(self.itemNames), dtype=_np.int64)
+        _np.maximum.at(periodicity, items, gaps)
+        lastTimestamps = _np.zeros(len(self.itemNames), dtype=_np.int64)
+        lastTimestamps[items] = timestamps
+        return _np.maximum(periodicity, last - lastTimestamps)
+
+    def revise(self, rank, minLength=1):
+        """
+            A method to keep the items having a rank, ordered by increasing rank in every transaction.
+            The order of the items having the same rank is kept.
+
+            :param rank: rank of every item id, -1 for the items to remove
+            :type rank: numpy.ndarray
+            :param minLength: minimum number of items of the kept transactions
+            :type minLength: int
+            :return: the revised database
+            :rtype: UncertainDatabase
+        """
+        tids = self._transactionIds()
+        itemRanks = rank[self.items]
+        kept = _np.flatnonzero(itemRanks >= 0)
+        lengths = _np.bincount(tids[kept], minlength=len(self))
+        kept = kept[lengths[tids[kept]] >= minLength]
+        kept = kept[_np.lexsort((itemRanks[kept], tids[kept]))]
+        keptTransactions = _np.flatnonzero(lengths >= minLength)
+        bounds = _np.zeros(len(keptTransactions) + 1, dtype=_np.int64)
+        _np.cumsum(lengths[keptTransactions], out=bounds[1:])
+        timestamps = self.timestamps[keptTransactions] if self.timestamps is not None else None
+        database = UncertainDatabase(self.items[kept], self.probabilities[kept], bounds, timestamps, self.itemNames)
+        # the distinct probabilities of the database hold those of the revised one
+        database._distinct, database._decimals = self._distinctProbabilities(), self._decimals
+        return database
+
+    def capProbabilities(self, first=0, last=None):
+        """
+            A method to calculate the cap probability of every item of the transactions first to last, its
+            probability multiplied by the highest probability of the items before it in the transaction, or its
+            probability for the first item
+
+            :param first: the first transaction
+            :type first: int
+            :param last: the transaction after the last one, the end of the database when None
+            :type last: int
+            :rtype: numpy.ndarray
+        """
+        if last is None:
+            last = len(self)
+        start, end = int(self.bounds[first]), int(self.bounds[last])
+        distinct = self._distinctProbabilities()
+        ranks = _np.searchsorted(distinct, self.probabilities[start:end])
+        probabilities = self._decimals[ranks]
+        if len(probabilities) == 0:
+            return probabilities
+        # a running maximum of (transaction, rank of the probability) pairs encoded in one integer, the decimals
+        # being in the order of the distinct probabilities
+        bounds = self.bounds[first:last + 1] - start
+        tids = _np.repeat(_np.arange(last - first, dtype=_np.int64), _np.diff(bounds))
+        keys = tids * len(distinct) + ranks
+        runningMaximum = self._decimals[_np.maximum.accumulate(keys) % len(distinct)]
+        previousMaximum = _np.r_[0.0, runningMaximum[:-1]]
+        starts = _np.zeros(len(probabilities), dtype=bool)
+        starts[bounds[:-1][_np.diff(bounds) > 0]] = True
+        return _np.where(starts, probabilities, previousMaximum * probabilities)
+
+    def transactions(self, caps=False, chunkSize=1 << 16):
+        """
+            Iterate over the transactions, chunkSize transactions being converted to lists at a time
+
+            :param caps: give the cap probabilities as well
+            :type caps: bool
+            :param chunkSize: number of transactions converted at a time
+            :type chunkSize: int
+            :return: generator of the timestamp, item names, probabilities and, with caps, cap probabilities
+            :rtype: generator
+        """
+        for first in range(0, len(self), chunkSize):
+            last = min(first + chunkSize, len(self))
+            start = int(self.bounds[first])
+            bounds = (self.bounds[first:last + 1] - start).tolist()
+            end = bounds[-1] + start
+            items = [self.itemNames[item] for item in self.items[start:end].tolist()]
+            probabilities = self.decimalProbabilities(start, end).tolist()
+            capValues = self.capProbabilities(first, last).tolist() if caps else None
+            timestamps = self.timestamps[first:last].tolist() if self.timestamps is not None else None
+            for i in range(last - first):
+                transaction = (timestamps[i] if timestamps is not None else None,
+                               items[bounds[i]:bounds[i + 1]], probabilities[bounds[i]:bounds[i + 1]])
+                if caps:
+                    transaction += (capValues[bounds[i]:bounds[i + 1]],)
+                yield transaction
@@ -14,6 +14,8 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.uncertainPeriodicFrequentPattern.basic import abstract as _ab
+from PAMI.uncertainFrequentPattern.basic.expectedSupport import ExpectedSupportIndex as _ExpectedSupportIndex
+from PAMI.uncertainFrequentPattern.basic.uncertainDatabase import UncertainDatabase as _UncertainDatabase
 
 _minSup = float()
 __maxPer = float()
@@ -22,24 +24,6 @@ _first = int()
 _last = int()
 
 
-class _Item:
-    """
-        A class used to represent the item with probability in transaction of dataset
-
-        ...
-        Attributes:
-        __________
-            item : int or word
-                Represents the name of the item
-            probability : float
-                Represent the existential probability(likelihood presence) of an item
-    """
-
-    def __init__(self, item, probability):
-        self.item = item
-        self.probability = probability
-
-
 class _Node(object):
     """
         A class used to represent the node of frequentPatternTree
@@ -85,20 +69,18 @@ class _Node(object):
         node.parent = self
 
 
-def _Second(transaction, i):
+def _Second(probabilities, i):
     """
     To find the secondProbability of a node in transaction by considering second max probability
     of the prefix items.
 
-    :param transaction: transaction in a database with item and probability
+    :param probabilities: probabilities of the items of a transaction in a database
 
     :param i: index of the item to calculate secondProbability in a transaction
 
     :return: secondProbability of a node
     """
-    temp = []
-    for j in range(0, i):
-        temp.append(transaction[j].probability)
+    temp = probabilities[:i]
     l1 = max(temp)
     temp.remove(l1)
     l2 = max(temp)
@@ -156,13 +138,21 @@ class _Tree(object):
         self.summaries = {}
         self.info = {}
 
-    def addTransaction(self, transaction, tid):
+    def addTransaction(self, transaction, probabilities, caps, tid):
         """adding transaction into tree
 
-            :param transaction : it represents the one transactions in database
+            :param transaction : items of one transaction in database
 
             :type transaction : list
 
+            :param probabilities : existential probability of every item
+
+            :type probabilities : list
+
+            :param caps : cap probability of every item, its probability multiplied by the highest probability before it
+
+            :type caps : list
+
             :param tid : the timestamp of transaction
 
             :type tid : list
@@ -171,41 +161,24 @@ class _Tree(object):
         k = 0
         for i in range(len(transaction)):
             k += 1
-            if transaction[i].item not in currentNode.children:
-                newNode = _Node(transaction[i].item, {})
+            if transaction[i] not in currentNode.children:
+                newNode = _Node(transaction[i], {})
                 newNode.k = k
                 if k >= 3:
-                    newNode.secondProbability = _Second(transaction, i)
-                l1 = i - 1
-                temp = []
-                while l1 >= 0:
-                    temp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(temp) == 0:
-                    newNode.probability = round(transaction[i].probability, 2)
-                else:
-                    newNode.probability = round(max(temp) * transaction[i].probability, 2)
+                    newNode.secondProbability = _Second(probabilities, i)
+                newNode.probability = round(caps[i], 2)
                 currentNode.addChild(newNode)
-                if transaction[i].item in self.summaries:
-                    self.summaries[transaction[i].item].append(newNode)
+                if transaction[i] in self.summaries:
+                    self.summaries[transaction[i]].append(newNode)
                 else:
-                    self.summaries[transaction[i].item] = [newNode]
+                    self.summaries[transaction[i]] = [newNode]
                 currentNode = newNode
             else:
-                currentNode = currentNode.children[transaction[i].item]
+                currentNode = currentNode.children[transaction[i]]
                 if k >= 3:
-                    currentNode.secondProbability = max(transaction[i].probability, currentNode.secondProbability)
+                    currentNode.secondProbability = max(probabilities[i], currentNode.secondProbability)
                 currentNode.k = k
-                l1 = i - 1
-                temp = []
-                while l1 >= 0:
-                    temp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(temp) == 0:
-                    currentNode.probability += round(transaction[i].probability, 2)
-                else:
-                    nn = max(temp) * transaction[i].probability
-                    currentNode.probability += round(nn, 2)
+                currentNode.probability += round(caps[i], 2)
         currentNode.timeStamps = currentNode.timeStamps + tid
 
     def addConditionalTransaction(self, transaction, tid, sup, second):
@@ -543,86 +516,26 @@ class PTubeS(_ab._periodicFrequentPatterns):
 
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            uncertain, data, ts = [], [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'TS' in i:
-                ts = self._iFile['TS'].tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            if 'uncertain' in i:
-                uncertain = self._iFile['uncertain'].tolist()
-            for k in range(len(data)):
-                tr = [ts[k]]
-                for j in range(len(data[k])):
-                    product = _Item(data[k][j], uncertain[k][j])
-                    tr.append(product)
-                self._Database.append(tr)
-                self._lno += 1
-
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    tr = []
-                    for i in temp[1:]:
-                        i1 = i.index('(')
-                        i2 = i.index(')')
-                        item = i[0:i1]
-                        probability = float(i[i1 + 1:i2])
-                        product = _Item(item, probability)
-                        tr.append(product)
-                    self._lno += 1
-                    self._Database.append(temp)
-            else:
-                try:
-                    count = 0
-                    with open(self._iFile, 'r') as f:
-                        for line in f:
-                            #count += 1
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            tr = [int(temp[0])]
-                            for i in temp[1:]:
-                                i1 = i.index('(')
-                                i2 = i.index(')')
-                                item = i[0:i1]
-                                probability = float(i[i1 + 1:i2])
-                                product = _Item(item, probability)
-                                tr.append(product)
-                            self._lno += 1
-                            self._Database.append(tr)
-                except IOError:
-                    print("File Not Found")
+        try:
+            self._Database = _UncertainDatabase.read(self._iFile, self._sep, True)
+            self._lno = len(self._Database)
+        except IOError:
+            print("File Not Found")
 
     def _PeriodicFrequentOneItems(self):
         """takes the transactions and calculates the support of each item in the dataset and assign the
             ranks to the items by decreasing support and returns the frequent items list
 
         """
-        global _first, _last
-        mapSupport = {}
-        for i in self._Database:
-            n = i[0]
-            for j in i[1:]:
-                if j.item not in mapSupport:
-                    mapSupport[j.item] = [round(j.probability, 2), abs(0 - n), n]
-                else:
-                    mapSupport[j.item][0] += round(j.probability, 2)
-                    mapSupport[j.item][1] = max(mapSupport[j.item][1], abs(n - mapSupport[j.item][2]))
-                    mapSupport[j.item][2] = n
-        for key in mapSupport:
-            mapSupport[key][1] = max(mapSupport[key][1], self._lno - mapSupport[key][2])
-        mapSupport = {k: [round(v[0], 2), v[1]] for k, v in mapSupport.items() if
-                      v[1] <= self._maxPer and v[0] >= self._minSup}
-        plist = [k for k, v in sorted(mapSupport.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
-        self._rank = dict([(index, item) for (item, index) in enumerate(plist)])
+        supports = self._Database.expectedSupports(2)
+        periodicities = self._Database.periodicities(self._lno)
+        names = self._Database.itemNames
+        frequent = [i for i in range(1, len(names)) if periodicities[i] <= self._maxPer and supports[i] >= self._minSup]
+        mapSupport = {names[i]: [round(float(supports[i]), 2), int(periodicities[i])] for i in frequent}
+        frequent.sort(key=lambda x: (mapSupport[names[x]][0], names[x]), reverse=True)
+        plist = [names[i] for i in frequent]
+        self._rank = _ab._np.full(len(names), -1, dtype=_ab._np.int64)
+        self._rank[frequent] = _ab._np.arange(len(frequent))
         return mapSupport, plist
 
     def _buildTree(self, data, info):
@@ -631,7 +544,7 @@ class PTubeS(_ab._periodicFrequentPatterns):
 
             :param data : it represents the one transactions in database
 
-            :type data : list
+            :type data : UncertainDatabase
 
             :param info : it represents the support of each item
 
@@ -639,9 +552,8 @@ class PTubeS(_ab._periodicFrequentPatterns):
         """
         rootNode = _Tree()
         rootNode.info = info.copy()
-        for i in range(len(data)):
-            set1 = [data[i][0]]
-            rootNode.addTransaction(data[i][1:], set1)
+        for timestamp, items, probabilities, caps in data.transactions(caps=True):
+            rootNode.addTransaction(items, probabilities, caps, [timestamp])
         return rootNode
 
     def _updateTransactions(self, dict1):
@@ -651,38 +563,7 @@ class PTubeS(_ab._periodicFrequentPatterns):
 
                 :type dict1 : dictionary
         """
-        list1 = []
-        for tr in self._Database:
-            list2 = [int(tr[0])]
-            for i in range(1, len(tr)):
-                if tr[i].item in dict1:
-                    list2.append(tr[i])
-            if (len(list2) >= 2):
-                basket = list2[1:]
-                basket.sort(key=lambda val: self._rank[val.item])
-                list2[1:] = basket[0:]
-                list1.append(list2)
-        return list1
-
-    def _check(self, i, x):
-        """To check the presence of item or pattern in transaction
-
-            :param x: it represents the pattern
-
-            :type x: list
-
-            :param i: represents the uncertain transactions
-
-            :type i: list
-        """
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
+        return self._Database.revise(self._rank)
 
     def _convert(self, value):
         """
@@ -711,21 +592,14 @@ class PTubeS(_ab._periodicFrequentPatterns):
         :return: original patterns
         """
         periods = {}
-        for i in self._Database:
-            for x, y in self._periodic.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i[1:], x)
-                    if check == 1:
-                        for j in i[1:]:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x][0] += s
-                        else:
-                            periods[x] = [s, y[1]]
+        candidates = [x for x in self._periodic if len(x) > 1]
+        index = _ExpectedSupportIndex.fromDatabase(self._Database, {item for x in candidates for item in x})
+        supports = index.expectedSupports(candidates)
+        for x, y in self._periodic.items():
+            if len(x) == 1:
+                periods[x] = y
+            elif x in supports:
+                periods[x] = [supports[x], y[1]]
         for x, y in periods.items():
             if y[0] >= _minSup:
                 sample = str()
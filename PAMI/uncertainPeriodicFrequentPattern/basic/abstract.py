@@ -17,6 +17,7 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import math as _math
 import csv as _csv
+import numpy as _np
 import pandas as _pd
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c